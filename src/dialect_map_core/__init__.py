@@ -2,5 +2,6 @@
 
 from .controllers import *
 from .encoding import *
+from .metrics import *
 from .models import *
 from .storage import *
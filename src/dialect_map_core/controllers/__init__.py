@@ -1,18 +1,36 @@
 # -*- coding: utf-8 -*-
 
 from .base import BaseController
+from .cache import RecordsCache
+from .graph import CitationGraph
+
+from .base_async import AsyncStaticController
+from .base_async import AsyncArchivalController
+from .base_async import AsyncEvolvingController
 
 from .ctl_category import CategoryController
+from .ctl_category import AsyncCategoryController
 from .ctl_membership import MembershipController
+from .ctl_membership import AsyncMembershipController
 
 from .ctl_jargon import JargonController
 from .ctl_jargon import JargonGroupController
+from .ctl_jargon import AsyncJargonController
+from .ctl_jargon import AsyncJargonGroupController
 
 from .ctl_metrics import JargonCategoryMetricsController
 from .ctl_metrics import JargonPaperMetricsController
+from .ctl_metrics import AsyncJargonCategoryMetricsController
+from .ctl_metrics import AsyncJargonPaperMetricsController
+from .ctl_metrics import LatestMetricsListener
 
 from .ctl_paper import PaperController
 from .ctl_paper import PaperAuthorController
 from .ctl_paper import PaperReferenceCountersController
+from .ctl_paper import AsyncPaperController
+from .ctl_paper import AsyncPaperAuthorController
+from .ctl_paper import AsyncPaperReferenceCountersController
 
 from .ctl_reference import ReferenceController
+from .ctl_reference import AsyncReferenceController
+from .ctl_reference import ReferenceCountersListener
@@ -4,14 +4,31 @@ from abc import ABC
 from abc import abstractmethod
 from datetime import datetime
 from datetime import timezone
+from itertools import islice
+from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import Generic
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import NamedTuple
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
 
+from sqlalchemy import Delete
+from sqlalchemy import Select
+from sqlalchemy import delete
 from sqlalchemy import false
-
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy import tuple_
+from sqlalchemy import update
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from .cache import RecordsCache
 from ..models import StaticModel
 from ..models import ArchivalModel
 from ..models import EvolvingModel
@@ -24,8 +41,198 @@ ArchivalModelVar = TypeVar("ArchivalModelVar", bound=ArchivalModel)
 EvolvingModelVar = TypeVar("EvolvingModelVar", bound=EvolvingModel)
 
 
+def iter_chunks(items: Iterable, chunk_size: int) -> Iterator[list]:
+    """
+    Iterates over bounded-size chunks of items, to keep SQL statements small
+    :param items: iterable of items
+    :param chunk_size: maximum number of items per chunk
+    :return: iterator of lists of items
+    """
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be a positive integer")
+
+    items = iter(items)
+
+    while chunk := list(islice(items, chunk_size)):
+        yield chunk
+
+
+def fetch_records(
+    session: BaseDatabaseSession,
+    model: type,
+    keys: Iterable[Any],
+    chunk_size: int = 1000,
+) -> Dict[Any, Any]:
+    """
+    Fetches a set of database records by their primary keys, using IN statements.
+    The records already present in the session identity map are not queried
+    :param session: database session to use
+    :param model: data model to query
+    :param keys: primary keys of the records (tuples for composite keys)
+    :param chunk_size: maximum number of keys per statement (optional)
+    :return: dictionary of primary keys and found records
+    """
+
+    mapper = inspect(model)
+    columns = mapper.primary_key
+    composite = len(columns) > 1
+
+    found: Dict[Any, Any] = {}
+    pending = []
+
+    for key in dict.fromkeys(keys):
+        ident = tuple(key) if composite else (key,)
+        record = session.identity_map.get(mapper.identity_key_from_primary_key(ident))
+
+        if record is not None and not inspect(record).expired:
+            found[key] = record
+        else:
+            pending.append(key)
+
+    for chunk in iter_chunks(pending, chunk_size):
+        if composite:
+            query = session.query(model).filter(tuple_(*columns).in_(chunk))
+        else:
+            query = session.query(model).filter(columns[0].in_(chunk))
+
+        for record in query.all():
+            ident = tuple(mapper.primary_key_from_instance(record))
+            found[ident if composite else ident[0]] = record
+
+    return found
+
+
+def get_id_attribute(model: type) -> Any:
+    """
+    Gets the mapped attribute of the (first) primary key column of a data model.
+    Write statements filter by it, so the session can synchronize its identity map
+    :param model: data model to inspect
+    :return: mapped ID attribute
+    """
+
+    mapper = inspect(model)
+    return mapper.get_property_by_column(mapper.primary_key[0]).class_attribute
+
+
+def build_all_query(
+    model: type,
+    include_archived: bool,
+    after: str | None = None,
+    limit: int | None = None,
+) -> Select:
+    """
+    Builds an SQL statement to get all the records of an archival model, sorted by ID.
+    Shared by the sync and async controllers, which only differ in its execution
+    :param model: archival data model
+    :param include_archived: whether to include archived records
+    :param after: ID after which to start the page (optional)
+    :param limit: maximum number of records in the page (optional)
+    :return: SQL select statement
+    """
+
+    id_column = inspect(model).primary_key[0]
+    query = select(model).order_by(id_column)
+
+    if include_archived is False:
+        query = query.where(model.archived == false())
+    if after is not None:
+        query = query.where(id_column > after)
+    if limit is not None:
+        query = query.limit(limit)
+
+    return query
+
+
+def build_filter_query(model: type, **values: Any) -> Select:
+    """
+    Builds an SQL statement to get the records of a model matching a set of column values
+    :param model: data model to query
+    :param values: column names and values to match
+    :return: SQL select statement
+    """
+
+    return select(model).filter_by(**values)
+
+
+def build_delete_query(model: type, id: str, rev: int | None = None) -> Delete:
+    """
+    Builds an SQL statement to delete the revisions of an evolving record
+    :param model: evolving data model
+    :param id: ID of the database entry
+    :param rev: revision of the database entry. None to delete them all (optional)
+    :return: SQL delete statement
+    """
+
+    query = delete(model).where(get_id_attribute(model) == id)
+
+    if rev is not None:
+        mapper = inspect(model)
+        rev_attr = mapper.get_property_by_column(mapper.primary_key[1]).class_attribute
+        query = query.where(rev_attr == rev)
+
+    return query
+
+
+def delete_records(
+    session: BaseDatabaseSession,
+    model: type,
+    ids: Iterable[str],
+    chunk_size: int = 1000,
+    commit: bool = True,
+) -> int:
+    """
+    Deletes a set of database records by their IDs, using set-based statements
+    :param session: database session to use
+    :param model: data model to delete the records of
+    :param ids: IDs of the database entries
+    :param chunk_size: maximum number of IDs per statement (optional)
+    :param commit: whether to commit the deletion, or leave it to the caller (optional)
+    :return: number of deleted records
+    """
+
+    id_attr = get_id_attribute(model)
+    num_records = 0
+
+    try:
+        for chunk in iter_chunks(ids, chunk_size):
+            query = delete(model).where(id_attr.in_(chunk))
+
+            # Expired objects cannot be evaluated in Python, so the deleted keys are fetched
+            query = query.execution_options(synchronize_session="fetch")
+            num_records += session.execute(query).rowcount
+        if commit:
+            session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+    return num_records
+
+
+class RecordsBatch(NamedTuple):
+    """
+    Result of a multiple records retrieval
+
+    :attr records: found records, in the requested order
+    :attr missing: requested keys without a matching record
+    """
+
+    records: list
+    missing: list
+
+
 class BaseController(ABC):
-    """Interface for the data controllers"""
+    """
+    Interface for the data controllers
+
+    :attr query_filters:
+        Class attribute used to declare the sets of columns the controller
+        queries filter by, besides the primary key ones.
+        (They are checked against the model indexes by the CLI)
+    """
+
+    query_filters: Tuple[Tuple[str, ...], ...] = ()
 
     @abstractmethod
     def create(self, instance) -> str:
@@ -86,6 +293,27 @@ class StaticController(BaseController, Generic[StaticModelVar]):
 
         return record
 
+    def get_many(self, ids: Iterable[str], chunk_size: int = 1000) -> RecordsBatch:
+        """
+        Gets a set of database records by their IDs, using set-based statements
+        :param ids: IDs of the database entries
+        :param chunk_size: maximum number of IDs per statement (optional)
+        :return: found records (in the requested order) and missing IDs
+        """
+
+        ids = list(ids)
+
+        try:
+            found = fetch_records(self.session, self.model, ids, chunk_size)
+        except Exception:
+            self.session.rollback()
+            raise
+
+        records = [found[id] for id in ids if id in found]
+        missing = [id for id in ids if id not in found]
+
+        return RecordsBatch(records, missing)
+
     def create(self, instance: StaticModelVar) -> str:
         """
         Creates a new database record given its object properties
@@ -129,6 +357,16 @@ class StaticController(BaseController, Generic[StaticModelVar]):
         self.session.commit()
         return id
 
+    def delete_many(self, ids: Iterable[str], chunk_size: int = 1000) -> int:
+        """
+        Deletes a set of database records by their IDs, using set-based statements
+        :param ids: IDs of the database entries
+        :param chunk_size: maximum number of IDs per statement (optional)
+        :return: number of deleted records
+        """
+
+        return delete_records(self.session, self.model, ids, chunk_size)
+
 
 class ArchivalController(BaseController, Generic[ArchivalModelVar]):
     """
@@ -138,9 +376,15 @@ class ArchivalController(BaseController, Generic[ArchivalModelVar]):
         Class attribute used to store the data model
         SQLAlchemy will be performing queries against
         (It cannot be obtained at runtime from ArchivalModelVar)
+
+    :attr cache:
+        Class attribute used to store an optional process-wide cache
+        the record lookups will be served from (disabled by default).
+        It is invalidated by any modification done through the controller
     """
 
     model: Type[ArchivalModelVar]
+    cache: RecordsCache | None = None
 
     def __init__(self, session: BaseDatabaseSession):
         """
@@ -150,6 +394,85 @@ class ArchivalController(BaseController, Generic[ArchivalModelVar]):
 
         self.session = session
 
+    def _dump_record(self, record: ArchivalModelVar | None) -> dict | None:
+        """
+        Dumps a record column values, to be stored in the cache
+        :param record: data object to dump
+        :return: dictionary of column values
+        """
+
+        if record is None:
+            return None
+
+        return record.to_dict()
+
+    def _load_record(self, values: dict | None) -> ArchivalModelVar | None:
+        """
+        Loads a record from its cached column values, attaching it to the session.
+        Records already present in the session are returned as they are
+        :param values: dictionary of column values
+        :return: data object attached to the session
+        """
+
+        if values is None:
+            return None
+
+        mapper = inspect(self.model)
+        ident = [values[mapper.get_property_by_column(c).key] for c in mapper.primary_key]
+        record = self.session.identity_map.get(mapper.identity_key_from_primary_key(ident))
+
+        if record is not None:
+            return record
+
+        record = mapper.class_manager.new_instance()
+
+        for key, val in values.items():
+            set_committed_value(record, key, val)
+
+        make_transient_to_detached(record)
+        return self.session.merge(record, load=False)
+
+    def _cached(self, key: tuple, query: Callable[[], Any]) -> Any:
+        """
+        Runs a lookup query through the cache, when it is enabled.
+        The lookup result could be a record, a list of records or None.
+        Misses (None) are not cached, as the records could be inserted
+        by other means than the controller (i.e. bulk loads)
+        :param key: lookup key, unique within the controller model
+        :param query: function running the lookup query
+        :return: lookup result
+        """
+
+        if self.cache is None:
+            return query()
+
+        namespace = self.model.__tablename__
+        found, values = self.cache.get((namespace, *key))
+
+        if found and isinstance(values, list):
+            return [self._load_record(v) for v in values]
+        if found:
+            return self._load_record(values)
+
+        version = self.cache.version(namespace)
+        result = query()
+
+        if result is None:
+            return result
+        if isinstance(result, list):
+            values = [self._dump_record(r) for r in result]
+        else:
+            values = self._dump_record(result)
+
+        self.cache.set((namespace, *key), values, version)
+        return result
+
+    def _invalidate_cache(self) -> None:
+        """Invalidates the cached lookups of the controller model, if any"""
+
+        if self.cache is not None:
+            self.cache.invalidate(self.model.__tablename__)
+
     def get(self, id: str, include_archived: bool = False) -> ArchivalModelVar:
         """
         Gets a database record by its ID
@@ -159,7 +482,7 @@ class ArchivalController(BaseController, Generic[ArchivalModelVar]):
         """
 
         try:
-            record = self.session.get(self.model, id)
+            record = self._cached(("get", id), lambda: self.session.get(self.model, id))
         except Exception:
             self.session.rollback()
             raise
@@ -171,19 +494,76 @@ class ArchivalController(BaseController, Generic[ArchivalModelVar]):
 
         return record
 
-    def get_all(self, include_archived: bool = False) -> list:
+    def get_many(
+        self,
+        ids: Iterable[str],
+        include_archived: bool = False,
+        chunk_size: int = 1000,
+    ) -> RecordsBatch:
         """
-        Gets all database records
+        Gets a set of database records by their IDs, using set-based statements
+        :param ids: IDs of the database entries
         :param include_archived: whether to include archived records
-        :return: list of records
+        :param chunk_size: maximum number of IDs per statement (optional)
+        :return: found records (in the requested order) and missing IDs
         """
 
-        query = self.session.query(self.model)
+        ids = list(ids)
+
+        try:
+            found = fetch_records(self.session, self.model, ids, chunk_size)
+        except Exception:
+            self.session.rollback()
+            raise
 
         if include_archived is False:
-            query = query.filter(self.model.archived == false())
+            found = {id: rec for id, rec in found.items() if rec.archived is False}
+
+        records = [found[id] for id in ids if id in found]
+        missing = [id for id in ids if id not in found]
 
-        return query.all()
+        return RecordsBatch(records, missing)
+
+    def get_all(
+        self,
+        include_archived: bool = False,
+        after: str | None = None,
+        limit: int | None = None,
+    ) -> list:
+        """
+        Gets all database records, sorted by ID.
+        Use the 'after' and 'limit' arguments to paginate over the records,
+        providing the ID of the last record of the previous page
+        :param include_archived: whether to include archived records
+        :param after: ID after which to start the page (optional)
+        :param limit: maximum number of records in the page (optional)
+        :return: list of records
+        """
+
+        query = build_all_query(self.model, include_archived, after, limit)
+        return list(self.session.scalars(query).all())
+
+    def iter_all(
+        self,
+        include_archived: bool = False,
+        batch_size: int = 1000,
+    ) -> Iterator[ArchivalModelVar]:
+        """
+        Iterates over all database records, sorted by ID, in constant memory.
+        Records are streamed from a server-side cursor, when supported
+        :param include_archived: whether to include archived records
+        :param batch_size: number of records fetched at a time (optional)
+        :return: iterator of records
+        """
+
+        query = build_all_query(self.model, include_archived)
+        query = query.execution_options(yield_per=batch_size)
+
+        try:
+            yield from self.session.scalars(query)
+        except Exception:
+            self.session.rollback()
+            raise
 
     def create(self, instance: ArchivalModelVar) -> str:
         """
@@ -195,6 +575,7 @@ class ArchivalController(BaseController, Generic[ArchivalModelVar]):
         try:
             self.session.add(instance)
             self.session.commit()
+            self._invalidate_cache()
         except Exception:
             self.session.rollback()
             raise
@@ -210,8 +591,21 @@ class ArchivalController(BaseController, Generic[ArchivalModelVar]):
 
         self.session.delete(self.get(id, include_archived=True))
         self.session.commit()
+        self._invalidate_cache()
         return id
 
+    def delete_many(self, ids: Iterable[str], chunk_size: int = 1000) -> int:
+        """
+        Deletes a set of database records by their IDs, using set-based statements
+        :param ids: IDs of the database entries
+        :param chunk_size: maximum number of IDs per statement (optional)
+        :return: number of deleted records
+        """
+
+        num_records = delete_records(self.session, self.model, ids, chunk_size)
+        self._invalidate_cache()
+        return num_records
+
     def archive(self, id: str) -> str:
         """
         Archives a database record by its ID
@@ -224,8 +618,37 @@ class ArchivalController(BaseController, Generic[ArchivalModelVar]):
         record.archived_at = datetime.now(timezone.utc)
 
         self.session.commit()
+        self._invalidate_cache()
         return id
 
+    def archive_many(self, ids: Iterable[str], chunk_size: int = 1000) -> int:
+        """
+        Archives a set of database records by their IDs, using set-based statements.
+        Already archived records are left untouched
+        :param ids: IDs of the database entries
+        :param chunk_size: maximum number of IDs per statement (optional)
+        :return: number of archived records
+        """
+
+        id_attr = get_id_attribute(self.model)
+        archived_at = datetime.now(timezone.utc)
+        num_records = 0
+
+        try:
+            for chunk in iter_chunks(ids, chunk_size):
+                query = update(self.model)
+                query = query.where(id_attr.in_(chunk))
+                query = query.where(self.model.archived == false())
+                query = query.values(archived=True, archived_at=archived_at)
+                num_records += self.session.execute(query).rowcount
+            self.session.commit()
+            self._invalidate_cache()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return num_records
+
 
 class EvolvingController(BaseController, Generic[EvolvingModelVar]):
     """
@@ -266,6 +689,27 @@ class EvolvingController(BaseController, Generic[EvolvingModelVar]):
 
         return record
 
+    def get_many(self, keys: Iterable[Tuple[str, int]], chunk_size: int = 1000) -> RecordsBatch:
+        """
+        Gets a set of database records by their IDs and revisions, using set-based statements
+        :param keys: (ID, revision) pairs of the database entries
+        :param chunk_size: maximum number of pairs per statement (optional)
+        :return: found records (in the requested order) and missing pairs
+        """
+
+        keys = [tuple(key) for key in keys]
+
+        try:
+            found = fetch_records(self.session, self.model, keys, chunk_size)
+        except Exception:
+            self.session.rollback()
+            raise
+
+        records = [found[key] for key in keys if key in found]
+        missing = [key for key in keys if key not in found]
+
+        return RecordsBatch(records, missing)
+
     def create(self, instance: EvolvingModelVar) -> str:
         """
         Creates a new database record given its object properties
@@ -284,24 +728,40 @@ class EvolvingController(BaseController, Generic[EvolvingModelVar]):
 
     def delete(self, id: str) -> str:
         """
-        Deletes a database record by its ID
+        Deletes all the revisions of a database record by its ID, at once
         :param id: ID of the database entry
         :return: ID of the deleted object
         """
 
-        rev = 0
-
-        while True:
-            try:
-                rev += 1
-                record = self.get(id, rev)
-                self.session.delete(record)
-            except ValueError:
-                break
+        try:
+            self.session.execute(build_delete_query(self.model, id))
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
 
-        self.session.commit()
         return id
 
+    def delete_revisions(self, id: str) -> List[int]:
+        """
+        Deletes all the revisions of a database record by its ID, at once.
+        Requires a database supporting the RETURNING clause (i.e. PostgreSQL, SQLite)
+        :param id: ID of the database entry
+        :return: sorted list of deleted revisions
+        """
+
+        rev_column = inspect(self.model).primary_key[1]
+        query = build_delete_query(self.model, id).returning(rev_column)
+
+        try:
+            revs = self.session.execute(query).scalars().all()
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return sorted(revs)
+
     def delete_rev(self, id: str, rev: int) -> Tuple[str, int]:
         """
         Deletes a database record by its ID
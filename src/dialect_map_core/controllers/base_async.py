@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from datetime import timezone
+from typing import Generic
+from typing import List
+from typing import Tuple
+from typing import Type
+
+from sqlalchemy import inspect
+
+from .base import StaticModelVar
+from .base import ArchivalModelVar
+from .base import EvolvingModelVar
+from .base import build_all_query
+from .base import build_delete_query
+from ..storage import BaseDatabaseAsyncSession
+
+
+class AsyncStaticController(Generic[StaticModelVar]):
+    """
+    Asynchronous controller for the static models
+
+    :attr model:
+        Class attribute used to store the data model
+        SQLAlchemy will be performing queries against
+        (It cannot be obtained at runtime from StaticModelVar)
+    """
+
+    model: Type[StaticModelVar]
+
+    def __init__(self, session: BaseDatabaseAsyncSession):
+        """
+        Initializes the controller with the provided async DB session
+        :param session: asynchronous database session to use
+        """
+
+        self.session = session
+
+    async def get(self, id: str) -> StaticModelVar:
+        """
+        Gets a database record by its ID
+        :param id: ID of the database entry
+        :return: data object representing the database record
+        """
+
+        try:
+            record = await self.session.get(self.model, id)
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        if record is None:
+            raise ValueError(f"Unknown record: {id}")
+
+        return record
+
+    async def create(self, instance: StaticModelVar) -> str:
+        """
+        Creates a new database record given its object properties
+        :param instance: data object to create the record from
+        :return: ID of the created object
+        """
+
+        try:
+            self.session.add(instance)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return instance.id
+
+    async def create_all(self, instances: List[StaticModelVar]) -> int:
+        """
+        Creates new database records given a list of objects
+        :param instances: data objects to create the records from
+        :return: number of successfully create records
+        """
+
+        try:
+            self.session.add_all(instances)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return len(instances)
+
+    async def delete(self, id: str) -> str:
+        """
+        Deletes a database record by its ID
+        :param id: ID of the database entry
+        :return: ID of the deleted object
+        """
+
+        await self.session.delete(await self.get(id))
+        await self.session.commit()
+        return id
+
+
+class AsyncArchivalController(Generic[ArchivalModelVar]):
+    """
+    Asynchronous controller for the archival models
+
+    :attr model:
+        Class attribute used to store the data model
+        SQLAlchemy will be performing queries against
+        (It cannot be obtained at runtime from ArchivalModelVar)
+    """
+
+    model: Type[ArchivalModelVar]
+
+    def __init__(self, session: BaseDatabaseAsyncSession):
+        """
+        Initializes the controller with the provided async DB session
+        :param session: asynchronous database session to use
+        """
+
+        self.session = session
+
+    async def get(self, id: str, include_archived: bool = False) -> ArchivalModelVar:
+        """
+        Gets a database record by its ID
+        :param id: ID of the database entry
+        :param include_archived: whether to include archived records
+        :return: data object representing the database record
+        """
+
+        try:
+            record = await self.session.get(self.model, id)
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        if record is None:
+            raise ValueError(f"Unknown record: {id}")
+        if record.archived is True and include_archived is False:
+            raise ValueError(f"The record {id} has been archived")
+
+        return record
+
+    async def get_all(
+        self,
+        include_archived: bool = False,
+        after: str | None = None,
+        limit: int | None = None,
+    ) -> list:
+        """
+        Gets all database records, sorted by ID.
+        Use the 'after' and 'limit' arguments to paginate over the records,
+        providing the ID of the last record of the previous page
+        :param include_archived: whether to include archived records
+        :param after: ID after which to start the page (optional)
+        :param limit: maximum number of records in the page (optional)
+        :return: list of records
+        """
+
+        query = build_all_query(self.model, include_archived, after, limit)
+        result = await self.session.scalars(query)
+        return list(result.all())
+
+    async def create(self, instance: ArchivalModelVar) -> str:
+        """
+        Creates a new database record given its object properties
+        :param instance: data object to create the record from
+        :return: ID of the created object
+        """
+
+        try:
+            self.session.add(instance)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return instance.id
+
+    async def create_all(self, instances: List[ArchivalModelVar]) -> int:
+        """
+        Creates new database records given a list of objects
+        :param instances: data objects to create the records from
+        :return: number of successfully create records
+        """
+
+        try:
+            self.session.add_all(instances)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return len(instances)
+
+    async def delete(self, id: str) -> str:
+        """
+        Deletes a database record by its ID
+        :param id: ID of the database entry
+        :return: ID of the deleted object
+        """
+
+        await self.session.delete(await self.get(id, include_archived=True))
+        await self.session.commit()
+        return id
+
+    async def archive(self, id: str) -> str:
+        """
+        Archives a database record by its ID
+        :param id: ID of the database entry
+        :return: ID of the archived object
+        """
+
+        record = await self.get(id)
+        record.archived = True
+        record.archived_at = datetime.now(timezone.utc)
+
+        await self.session.commit()
+        return id
+
+
+class AsyncEvolvingController(Generic[EvolvingModelVar]):
+    """
+    Asynchronous controller for the evolving models
+
+    :attr model:
+        Class attribute used to store the data model
+        SQLAlchemy will be performing queries against
+        (It cannot be obtained at runtime from EvolvingModelVar)
+    """
+
+    model: Type[EvolvingModelVar]
+
+    def __init__(self, session: BaseDatabaseAsyncSession):
+        """
+        Initializes the controller with the provided async DB session
+        :param session: asynchronous database session to use
+        """
+
+        self.session = session
+
+    async def get(self, id: str, rev: int) -> EvolvingModelVar:
+        """
+        Gets a database record by its ID
+        :param id: ID of the database entry
+        :param rev: revision of the database entry
+        :return: data object representing the database record
+        """
+
+        try:
+            record = await self.session.get(self.model, (id, rev))
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        if record is None:
+            raise ValueError(f"Unknown record: {id} - Revision: {rev}")
+
+        return record
+
+    async def create(self, instance: EvolvingModelVar) -> str:
+        """
+        Creates a new database record given its object properties
+        :param instance: data object to create the record from
+        :return: ID of the created object
+        """
+
+        try:
+            self.session.add(instance)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return instance.id
+
+    async def create_all(self, instances: List[EvolvingModelVar]) -> int:
+        """
+        Creates new database records given a list of objects
+        :param instances: data objects to create the records from
+        :return: number of successfully create records
+        """
+
+        try:
+            self.session.add_all(instances)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return len(instances)
+
+    async def delete(self, id: str) -> str:
+        """
+        Deletes all the revisions of a database record by its ID, at once
+        :param id: ID of the database entry
+        :return: ID of the deleted object
+        """
+
+        try:
+            await self.session.execute(build_delete_query(self.model, id))
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return id
+
+    async def delete_revisions(self, id: str) -> List[int]:
+        """
+        Deletes all the revisions of a database record by its ID, at once.
+        Requires a database supporting the RETURNING clause (i.e. PostgreSQL, SQLite)
+        :param id: ID of the database entry
+        :return: sorted list of deleted revisions
+        """
+
+        rev_column = inspect(self.model).primary_key[1]
+        query = build_delete_query(self.model, id).returning(rev_column)
+
+        try:
+            result = await self.session.execute(query)
+            revs = result.scalars().all()
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return sorted(revs)
+
+    async def delete_rev(self, id: str, rev: int) -> Tuple[str, int]:
+        """
+        Deletes a database record by its ID
+        :param id: ID of the database entry
+        :param rev: revision of the database entry
+        :return: ID of the deleted object
+        """
+
+        await self.session.delete(await self.get(id, rev))
+        await self.session.commit()
+        return id, rev
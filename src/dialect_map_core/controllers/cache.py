@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import Tuple
+
+
+class RecordsCache:
+    """
+    Process-wide read-through cache for controller lookups.
+    Entries expire after a time-to-live, and the least recently used ones
+    are evicted once the maximum size is reached.
+
+    Keys are tuples whose first element is a namespace (i.e. table name),
+    so that all the entries of a namespace can be invalidated at once.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300.0):
+        """
+        Initializes the cache with its size and expiration limits
+        :param max_size: maximum number of entries (optional)
+        :param ttl: entries time-to-live, in seconds (optional)
+        """
+
+        if max_size < 1:
+            raise ValueError("The maximum size must be a positive integer")
+        if ttl <= 0:
+            raise ValueError("The time-to-live must be a positive number")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict = OrderedDict()
+        self._versions: Dict[Hashable, int] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """
+        Gets the number of stored entries, including the expired ones
+        :return: number of entries
+        """
+
+        return len(self._entries)
+
+    def get(self, key: Tuple[Hashable, ...]) -> Tuple[bool, Any]:
+        """
+        Gets a cached value, updating the hit / miss counters
+        :param key: tuple key, starting with the namespace
+        :return: whether the key was found, and its value
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key: Tuple[Hashable, ...], value: Any, version: int) -> None:
+        """
+        Stores a value, unless its namespace was invalidated after reading it
+        :param key: tuple key, starting with the namespace
+        :param value: value to store
+        :param version: namespace version obtained before reading the value
+        """
+
+        with self._lock:
+            if self._versions.get(key[0], 0) != version:
+                return
+
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def version(self, namespace: Hashable) -> int:
+        """
+        Gets the current version of a namespace
+        :param namespace: namespace to get the version from
+        :return: version number
+        """
+
+        with self._lock:
+            return self._versions.get(namespace, 0)
+
+    def invalidate(self, namespace: Hashable) -> None:
+        """
+        Removes all the entries of a namespace
+        :param namespace: namespace to invalidate
+        """
+
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+            for key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Removes all the entries and resets the counters"""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from .base import ArchivalController
+from .base_async import AsyncArchivalController
 from ..models import Category
 
 
@@ -11,3 +12,12 @@ class CategoryController(ArchivalController):
     """
 
     model = Category
+
+
+class AsyncCategoryController(AsyncArchivalController):
+    """
+    Asynchronous controller for the Category objects (archival)
+    Extend as desired
+    """
+
+    model = Category
@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 
+from typing import Tuple
+
 from sqlalchemy import false
+from sqlalchemy import func
+from sqlalchemy import select
 
 from .base import ArchivalController
+from .base import build_filter_query
+from .base_async import AsyncArchivalController
 from ..models import Jargon
 from ..models import JargonGroup
 
@@ -14,6 +20,10 @@ class JargonController(ArchivalController):
     """
 
     model = Jargon
+    query_filters = (
+        ("jargon_term",),
+        ("group_id",),
+    )
 
     def get_by_string(self, jargon_term: str) -> Jargon | None:
         """
@@ -22,11 +32,11 @@ class JargonController(ArchivalController):
         :return: jargon term object
         """
 
-        query = self.session.query(self.model)
-        query = query.filter(self.model.archived == false())
-        query = query.filter(self.model.jargon_term == jargon_term)
-
-        return query.one_or_none()
+        query = build_filter_query(self.model, archived=False, jargon_term=jargon_term)
+        return self._cached(
+            ("get_by_string", jargon_term),
+            lambda: self.session.scalars(query).one_or_none(),
+        )
 
     def get_by_group(self, group_id: str) -> list:
         """
@@ -35,21 +45,40 @@ class JargonController(ArchivalController):
         :return: list of jargon terms
         """
 
-        group = self.session.query(JargonGroup)
-        group = group.filter(JargonGroup.archived == false())
-        group = group.filter(JargonGroup.group_id == group_id)
-
-        group = group.one_or_none()
+        group = build_filter_query(JargonGroup, archived=False, group_id=group_id)
+        group = self.session.scalars(group).one_or_none()
         jargons = []
 
         if group:
-            query = self.session.query(self.model)
-            query = query.filter(self.model.archived == false())
-            query = query.filter(self.model.group_id == group_id)
-            jargons = query.all()
+            query = build_filter_query(self.model, archived=False, group_id=group_id)
+            jargons = list(self.session.scalars(query).all())
 
         return jargons
 
+    def get_version(self) -> Tuple:
+        """
+        Gets a fingerprint of the jargons table, changing whenever a jargon
+        is created, archived, deleted or modified (as its audit date is refreshed).
+        It is computed by a single aggregation, so it is cheap to check.
+        Useful to invalidate derived data
+        :return: tuple of (active jargons, all jargons, last audited / archived dates)
+        """
+
+        query = select(
+            func.count().filter(self.model.archived == false()),
+            func.count(),
+            func.max(self.model.audited_at),
+            func.max(self.model.archived_at),
+        )
+
+        try:
+            version = self.session.execute(query).one()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return tuple(version)
+
 
 class JargonGroupController(ArchivalController):
     """
@@ -58,3 +87,52 @@ class JargonGroupController(ArchivalController):
     """
 
     model = JargonGroup
+
+
+class AsyncJargonController(AsyncArchivalController):
+    """
+    Asynchronous controller for the jargon objects (archival)
+    Extend as desired
+    """
+
+    model = Jargon
+
+    async def get_by_string(self, jargon_term: str) -> Jargon | None:
+        """
+        Gets a database record by its string value
+        :param jargon_term: jargon string representation
+        :return: jargon term object
+        """
+
+        query = build_filter_query(self.model, archived=False, jargon_term=jargon_term)
+
+        result = await self.session.scalars(query)
+        return result.one_or_none()
+
+    async def get_by_group(self, group_id: str) -> list:
+        """
+        Gets a database set of jargons given their group ID
+        :param group_id: jargon group ID to filter by
+        :return: list of jargon terms
+        """
+
+        group = build_filter_query(JargonGroup, archived=False, group_id=group_id)
+
+        group_result = await self.session.scalars(group)
+        jargons = []
+
+        if group_result.one_or_none():
+            query = build_filter_query(self.model, archived=False, group_id=group_id)
+            result = await self.session.scalars(query)
+            jargons = list(result.all())
+
+        return jargons
+
+
+class AsyncJargonGroupController(AsyncArchivalController):
+    """
+    Asynchronous controller for the jargon group objects (archival)
+    Extend as desired
+    """
+
+    model = JargonGroup
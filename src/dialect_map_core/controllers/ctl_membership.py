@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 from .base import StaticController
+from .base import build_filter_query
+from .base_async import AsyncStaticController
 from ..models import CategoryMembership
 
 
@@ -11,6 +13,7 @@ class MembershipController(StaticController):
     """
 
     model = CategoryMembership
+    query_filters = (("arxiv_id", "arxiv_rev"),)
 
     def get_by_paper(self, arxiv_id: str, arxiv_rev: int) -> list:
         """
@@ -20,8 +23,26 @@ class MembershipController(StaticController):
         :return: list of database objects
         """
 
-        query = self.session.query(self.model)
-        query = query.filter(self.model.arxiv_id == arxiv_id)
-        query = query.filter(self.model.arxiv_rev == arxiv_rev)
+        query = build_filter_query(self.model, arxiv_id=arxiv_id, arxiv_rev=arxiv_rev)
+        return list(self.session.scalars(query).all())
 
-        return query.all()
+
+class AsyncMembershipController(AsyncStaticController):
+    """
+    Asynchronous controller for the membership objects (static)
+    Extend as desired
+    """
+
+    model = CategoryMembership
+
+    async def get_by_paper(self, arxiv_id: str, arxiv_rev: int) -> list:
+        """
+        Gets a list of category memberships given a paper
+        :param arxiv_id: ID of the reference source paper
+        :param arxiv_rev: revision of the reference source paper
+        :return: list of database objects
+        """
+
+        query = build_filter_query(self.model, arxiv_id=arxiv_id, arxiv_rev=arxiv_rev)
+        result = await self.session.scalars(query)
+        return list(result.all())
@@ -1,13 +1,208 @@
 # -*- coding: utf-8 -*-
 
-from sqlalchemy.sql import and_
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Sequence
+from typing import Set
+from typing import Type
+
+from sqlalchemy import Select
+from sqlalchemy import Update
+from sqlalchemy import and_
+from sqlalchemy import case
+from sqlalchemy import extract
+from sqlalchemy import true
+from sqlalchemy import update
+from sqlalchemy.orm import Query
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql import func
-from sqlalchemy.sql import distinct
-from sqlalchemy.sql import Subquery
+from sqlalchemy.sql import select
 
 from .base import StaticController
+from .base import delete_records
+from .base import get_id_attribute
+from .base import iter_chunks
+from .base_async import AsyncStaticController
+from ..models import Base
+from ..models import CategoryMembership
+from ..models import Jargon
 from ..models import JargonCategoryMetrics as JCategoryMetrics
 from ..models import JargonPaperMetrics as JPaperMetrics
+from ..models import Paper
+from ..storage import BaseDatabaseSession
+from ..storage import BaseLoadListener
+
+
+def group_by_jargon(jargon_ids: Iterable[str], records: Iterable) -> Dict[str, list]:
+    """
+    Groups a set of records by their jargon ID attribute
+    :param jargon_ids: IDs of the jargons to group by (all of them will be present)
+    :param records: records or result rows with a 'jargon_id' attribute
+    :return: dictionary of jargon IDs and their records
+    """
+
+    groups: Dict[str, list] = {jargon_id: [] for jargon_id in jargon_ids}
+
+    for record in records:
+        groups[record.jargon_id].append(record)
+
+    return groups
+
+
+def build_aggregate_query(
+    query: Query,
+    model: type,
+    dimensions: Dict[str, list],
+    group_by: str | Sequence[str],
+) -> Query:
+    """
+    Completes a metrics query to aggregate them over a set of dimensions.
+    The aggregated 'abs_freq' is the sum of the absolute frequencies,
+    while the aggregated 'rel_freq' is weighted by the size of each record
+    sample, computed as abs_freq / rel_freq (records with rel_freq = 0 are
+    considered as having no sample size information)
+    :param query: base ORM query to complete (without selected entities)
+    :param model: metrics data model
+    :param dimensions: dictionary of dimension names and their columns
+    :param group_by: names of the dimensions to group by
+    :return: ORM query of (*dimension columns, abs_freq, rel_freq) rows
+    """
+
+    if isinstance(group_by, str):
+        group_by = [group_by]
+
+    unknown = set(group_by) - dimensions.keys()
+    if unknown:
+        raise ValueError(f"Unknown aggregation dimensions: {unknown}")
+
+    sample_size = case((model.rel_freq > 0, model.abs_freq / model.rel_freq), else_=0)
+    abs_freq = func.sum(model.abs_freq)
+    rel_freq = abs_freq / func.nullif(func.sum(sample_size), 0)
+
+    columns = [column for name in group_by for column in dimensions[name]]
+    query = query.add_columns(*columns, abs_freq.label("abs_freq"), rel_freq.label("rel_freq"))
+
+    return query.group_by(*columns).order_by(*columns)
+
+
+def build_category_metrics_query(jargon_id: str, category_id: str | None = None) -> Select:
+    """
+    Builds the query selecting the category jargon metrics of a jargon
+    :param jargon_id: ID of the metrics associated jargon
+    :param category_id: ID of the metrics associated category (optional)
+    :return: SQL select statement
+    """
+
+    model = JCategoryMetrics
+    query = select(model).where(model.jargon_id == jargon_id)
+
+    if category_id:
+        query = query.where(model.category_id == category_id)
+
+    return query
+
+
+def build_paper_metrics_query(
+    jargon_id: str,
+    arxiv_id: str | None = None,
+    arxiv_rev: int | None = None,
+    latest: bool = False,
+) -> Select:
+    """
+    Builds the query selecting the paper jargon metrics of a jargon
+    :param jargon_id: ID of the metrics associated jargon
+    :param arxiv_id: ID of the metrics associated paper (optional)
+    :param arxiv_rev: revision of the metrics associated paper (optional)
+    :param latest: whether to select only the latest revision metrics (optional)
+    :return: SQL select statement
+    """
+
+    model = JPaperMetrics
+    query = select(model).where(model.jargon_id == jargon_id)
+
+    if arxiv_id:
+        query = query.where(model.arxiv_id == arxiv_id)
+    if arxiv_rev:
+        query = query.where(model.arxiv_rev == arxiv_rev)
+    if latest:
+        query = query.where(model.is_latest == true())
+
+    return query
+
+
+def build_latest_query(arxiv_ids: List[str] | None = None) -> Update:
+    """
+    Builds an SQL statement to flag the metrics of the latest paper revisions.
+    Only the rows whose flag changes are updated
+    :param arxiv_ids: IDs of the papers to refresh. None to refresh them all (optional)
+    :return: SQL update statement
+    """
+
+    model = JPaperMetrics
+    latest = aliased(model)
+    latest_rev = (
+        select(func.max(latest.arxiv_rev))
+        .where(latest.arxiv_id == model.arxiv_id)
+        .scalar_subquery()
+    )
+
+    is_latest = model.arxiv_rev == latest_rev
+    query = update(model).where(model.is_latest != is_latest)
+
+    if arxiv_ids is not None:
+        query = query.where(model.arxiv_id.in_(arxiv_ids))
+
+    return query.values(is_latest=is_latest).execution_options(synchronize_session=False)
+
+
+def build_latest_queries(arxiv_ids: Iterable[str] | None = None) -> List[Update]:
+    """
+    Builds the SQL statements to flag the metrics of the latest paper revisions,
+    keeping the number of papers per statement bounded
+    :param arxiv_ids: IDs of the papers to refresh. None to refresh them all (optional)
+    :return: list of SQL update statements
+    """
+
+    if arxiv_ids is None:
+        return [build_latest_query()]
+
+    return [build_latest_query(chunk) for chunk in iter_chunks(set(arxiv_ids), 1000)]
+
+
+class LatestMetricsListener(BaseLoadListener):
+    """
+    File loading listener flagging the paper jargon metrics of the latest revisions,
+    within the same transaction the metrics are loaded with
+    """
+
+    def __init__(self):
+        """Initializes the listener with no pending papers"""
+
+        self.pending: Dict[BaseDatabaseSession, Set[str]] = {}
+
+    def on_batch(self, session: BaseDatabaseSession, data_model: Type[Base], batch: List[dict]):
+        """
+        Accumulates the papers of a batch of loaded paper jargon metrics
+        :param session: database session loading the records
+        :param data_model: SQLAlchemy model whose table is targeted
+        :param batch: list of dictionary records
+        """
+
+        if data_model.__tablename__ == JPaperMetrics.__tablename__:
+            self.pending.setdefault(session, set()).update(r["arxiv_id"] for r in batch)
+
+    def on_loaded(self, session: BaseDatabaseSession, data_model: Type[Base]):
+        """
+        Flags the latest metrics of the papers within the loaded metrics file
+        :param session: database session loading the records
+        :param data_model: SQLAlchemy model whose table is targeted
+        """
+
+        arxiv_ids = self.pending.pop(session, None)
+
+        if arxiv_ids:
+            JargonPaperMetricsController(session).mark_latest(arxiv_ids)
 
 
 class JargonCategoryMetricsController(StaticController):
@@ -17,6 +212,7 @@ class JargonCategoryMetricsController(StaticController):
     """
 
     model = JCategoryMetrics
+    query_filters = (("jargon_id", "category_id"),)
 
     def get_by_jargon(self, jargon_id: str, category_id: str | None = None) -> list:
         """
@@ -26,12 +222,66 @@ class JargonCategoryMetricsController(StaticController):
         :return: list of database objects
         """
 
-        query = self.session.query(self.model)
-        query = query.filter(self.model.jargon_id == jargon_id)
+        query = build_category_metrics_query(jargon_id, category_id)
+        return list(self.session.scalars(query).all())
+
+    def get_by_jargons(self, jargon_ids: List[str], aggregate: bool = False) -> Dict[str, list]:
+        """
+        Gets the category jargon metrics of multiple jargons, in a single query.
+        When aggregating, the metrics of each jargon and category are summarized
+        into (jargon_id, category_id, abs_freq, rel_freq) rows, where 'abs_freq'
+        is the sum of the absolute frequencies and 'rel_freq' the mean relative one
+        :param jargon_ids: IDs of the metrics associated jargons
+        :param aggregate: whether to aggregate the metrics per category (optional)
+        :return: dictionary of jargon IDs and their list of database objects / rows
+        """
+
+        if aggregate:
+            query = self.session.query(
+                self.model.jargon_id,
+                self.model.category_id,
+                func.sum(self.model.abs_freq).label("abs_freq"),
+                func.avg(self.model.rel_freq).label("rel_freq"),
+            )
+            query = query.group_by(self.model.jargon_id, self.model.category_id)
+        else:
+            query = self.session.query(self.model)
+
+        query = query.filter(self.model.jargon_id.in_(jargon_ids))
+        query = query.order_by(self.model.jargon_id, self.model.category_id)
+
+        return group_by_jargon(jargon_ids, query.all())
+
+    def aggregate(
+        self,
+        group_by: str | Sequence[str],
+        jargon_ids: Iterable[str] | None = None,
+    ) -> list:
+        """
+        Aggregates the category jargon metrics in the database.
+        Available dimensions: 'jargon', 'group' (jargon group) and 'category'
+        :param group_by: names of the dimensions to group by
+        :param jargon_ids: IDs of the jargons to restrict the metrics to (optional)
+        :return: list of (*dimension columns, abs_freq, rel_freq) rows
+        """
+
+        dimensions = {
+            "jargon": [self.model.jargon_id],
+            "group": [Jargon.group_id],
+            "category": [self.model.category_id],
+        }
+
+        if isinstance(group_by, str):
+            group_by = [group_by]
+
+        query = self.session.query().select_from(self.model)
 
-        if category_id:
-            query = query.filter(self.model.category_id == category_id)
+        if "group" in group_by:
+            query = query.join(Jargon, Jargon.jargon_id == self.model.jargon_id)
+        if jargon_ids is not None:
+            query = query.filter(self.model.jargon_id.in_(list(jargon_ids)))
 
+        query = build_aggregate_query(query, self.model, dimensions, group_by)
         return query.all()
 
 
@@ -42,23 +292,292 @@ class JargonPaperMetricsController(StaticController):
     """
 
     model = JPaperMetrics
+    query_filters = (
+        ("jargon_id", "arxiv_id", "arxiv_rev"),
+        ("jargon_id", "is_latest"),
+        ("arxiv_id",),
+    )
 
-    def _build_latest_rev_subquery(self) -> Subquery:
+    def get_by_jargon(
+        self,
+        jargon_id: str,
+        arxiv_id: str | None = None,
+        arxiv_rev: int | None = None,
+    ) -> list:
+        """
+        Gets a list of paper jargon metrics
+        :param jargon_id: ID of the metrics associated jargon
+        :param arxiv_id: ID of the metrics associated paper (optional)
+        :param arxiv_rev: revision of the metrics associated paper (optional)
+        :return: list of database objects
+        """
+
+        query = build_paper_metrics_query(jargon_id, arxiv_id, arxiv_rev)
+        return list(self.session.scalars(query).all())
+
+    def get_latest_by_jargon(self, jargon_id: str) -> list:
         """
-        Builds an SQL subquery to select the latest revision of each ID
-        :return: SQL subquery
+        Gets the latest paper jargon metrics given a jargon ID
+        :param jargon_id: ID of the metrics associated jargon
+        :return: list of database objects
         """
 
-        return (
-            self.session.query(
-                distinct(self.model.arxiv_id).label("arxiv_id"),
-                func.max(self.model.arxiv_rev).label("latest_rev"),
+        query = build_paper_metrics_query(jargon_id, latest=True)
+        return list(self.session.scalars(query).all())
+
+    def get_by_jargons(
+        self,
+        jargon_ids: List[str],
+        latest: bool = False,
+        aggregate: bool = False,
+    ) -> Dict[str, list]:
+        """
+        Gets the paper jargon metrics of multiple jargons, in a single query.
+        When aggregating, the metrics of each jargon are summarized per paper category
+        into (jargon_id, category_id, abs_freq, rel_freq) rows, where 'abs_freq'
+        is the sum of the absolute frequencies and 'rel_freq' the mean relative one
+        :param jargon_ids: IDs of the metrics associated jargons
+        :param latest: whether to only consider the latest paper revisions (optional)
+        :param aggregate: whether to aggregate the metrics per category (optional)
+        :return: dictionary of jargon IDs and their list of database objects / rows
+        """
+
+        if aggregate:
+            membership = CategoryMembership
+            query = self.session.query(
+                self.model.jargon_id,
+                membership.category_id,
+                func.sum(self.model.abs_freq).label("abs_freq"),
+                func.avg(self.model.rel_freq).label("rel_freq"),
+            )
+            query = query.join(
+                membership,
+                and_(
+                    self.model.arxiv_id == membership.arxiv_id,
+                    self.model.arxiv_rev == membership.arxiv_rev,
+                ),
             )
-            .group_by(self.model.arxiv_id)
-            .subquery()
-        )
+            query = query.group_by(self.model.jargon_id, membership.category_id)
+            query = query.order_by(self.model.jargon_id, membership.category_id)
+        else:
+            query = self.session.query(self.model)
+            query = query.order_by(self.model.jargon_id, self.model.arxiv_id, self.model.arxiv_rev)
 
-    def get_by_jargon(
+        query = query.filter(self.model.jargon_id.in_(jargon_ids))
+
+        if latest:
+            query = query.filter(self.model.is_latest == true())
+
+        return group_by_jargon(jargon_ids, query.all())
+
+    def aggregate(
+        self,
+        group_by: str | Sequence[str],
+        jargon_ids: Iterable[str] | None = None,
+        latest: bool = False,
+    ) -> list:
+        """
+        Aggregates the paper jargon metrics in the database.
+        Available dimensions: 'jargon', 'group' (jargon group), 'category',
+        'paper' (ID and revision) and 'month' (paper submission year and month)
+        :param group_by: names of the dimensions to group by
+        :param jargon_ids: IDs of the jargons to restrict the metrics to (optional)
+        :param latest: whether to only consider the latest paper revisions (optional)
+        :return: list of (*dimension columns, abs_freq, rel_freq) rows
+        """
+
+        dimensions = {
+            "jargon": [self.model.jargon_id],
+            "group": [Jargon.group_id],
+            "category": [CategoryMembership.category_id],
+            "paper": [self.model.arxiv_id, self.model.arxiv_rev],
+            "month": [
+                extract("year", Paper.submission_date).label("submission_year"),
+                extract("month", Paper.submission_date).label("submission_month"),
+            ],
+        }
+
+        if isinstance(group_by, str):
+            group_by = [group_by]
+
+        query = self.session.query().select_from(self.model)
+
+        if "group" in group_by:
+            query = query.join(Jargon, Jargon.jargon_id == self.model.jargon_id)
+        if "category" in group_by:
+            query = query.join(
+                CategoryMembership,
+                and_(
+                    self.model.arxiv_id == CategoryMembership.arxiv_id,
+                    self.model.arxiv_rev == CategoryMembership.arxiv_rev,
+                ),
+            )
+        if "month" in group_by:
+            query = query.join(
+                Paper,
+                and_(
+                    self.model.arxiv_id == Paper.arxiv_id,
+                    self.model.arxiv_rev == Paper.arxiv_rev,
+                ),
+            )
+
+        if jargon_ids is not None:
+            query = query.filter(self.model.jargon_id.in_(list(jargon_ids)))
+        if latest:
+            query = query.filter(self.model.is_latest == true())
+
+        query = build_aggregate_query(query, self.model, dimensions, group_by)
+        return query.all()
+
+    def mark_latest(self, arxiv_ids: Iterable[str] | None = None) -> int:
+        """
+        Updates the latest revision flag of the paper jargon metrics.
+        The changes are not committed, so that they are part of the caller transaction
+        :param arxiv_ids: IDs of the papers to update. None to update them all (optional)
+        :return: number of updated records
+        """
+
+        num_records = 0
+
+        try:
+            for query in build_latest_queries(arxiv_ids):
+                num_records += self.session.execute(query).rowcount
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return num_records
+
+    def refresh_latest(self, arxiv_ids: Iterable[str] | None = None) -> int:
+        """
+        Refreshes the latest revision flag of the paper jargon metrics.
+        Call it after modifying metrics without this controller (i.e. bulk loading)
+        :param arxiv_ids: IDs of the papers to refresh. None to refresh them all (optional)
+        :return: number of updated records
+        """
+
+        num_records = self.mark_latest(arxiv_ids)
+
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return num_records
+
+    def create(self, instance: JPaperMetrics) -> str:
+        """
+        Creates a new database record given its object properties,
+        refreshing the latest revision flags of its paper
+        :param instance: data object to create the record from
+        :return: ID of the created object
+        """
+
+        try:
+            self.session.add(instance)
+            self.session.flush()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        self.refresh_latest([instance.arxiv_id])
+        return instance.id
+
+    def create_all(self, instances: List[JPaperMetrics]) -> int:
+        """
+        Creates new database records given a list of objects,
+        refreshing the latest revision flags of their papers
+        :param instances: data objects to create the records from
+        :return: number of successfully create records
+        """
+
+        try:
+            self.session.add_all(instances)
+            self.session.flush()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        self.refresh_latest([instance.arxiv_id for instance in instances])
+        return len(instances)
+
+    def delete(self, id: str) -> str:
+        """
+        Deletes a database record by its ID,
+        refreshing the latest revision flags of its paper
+        :param id: ID of the database entry
+        :return: ID of the deleted object
+        """
+
+        record = self.get(id)
+
+        try:
+            self.session.delete(record)
+            self.session.flush()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        self.refresh_latest([record.arxiv_id])
+        return id
+
+    def delete_many(self, ids: Iterable[str], chunk_size: int = 1000) -> int:
+        """
+        Deletes a set of database records by their IDs, using set-based statements,
+        refreshing the latest revision flags of their papers within the same transaction
+        :param ids: IDs of the database entries
+        :param chunk_size: maximum number of IDs per statement (optional)
+        :return: number of deleted records
+        """
+
+        ids = list(ids)
+        id_attr = get_id_attribute(self.model)
+        arxiv_ids: Set[str] = set()
+
+        try:
+            for chunk in iter_chunks(ids, chunk_size):
+                query = select(self.model.arxiv_id).where(id_attr.in_(chunk)).distinct()
+                arxiv_ids.update(self.session.execute(query).scalars())
+        except Exception:
+            self.session.rollback()
+            raise
+
+        num_records = delete_records(self.session, self.model, ids, chunk_size, commit=False)
+        self.refresh_latest(arxiv_ids)
+        return num_records
+
+
+class AsyncJargonCategoryMetricsController(AsyncStaticController):
+    """
+    Asynchronous controller for the jargon category metric objects
+    Extend as desired
+    """
+
+    model = JCategoryMetrics
+
+    async def get_by_jargon(self, jargon_id: str, category_id: str | None = None) -> list:
+        """
+        Gets a list of category jargon metrics
+        :param jargon_id: ID of the metrics associated jargon
+        :param category_id: ID of the metrics associated category (optional)
+        :return: list of database objects
+        """
+
+        query = build_category_metrics_query(jargon_id, category_id)
+        result = await self.session.scalars(query)
+        return list(result.all())
+
+
+class AsyncJargonPaperMetricsController(AsyncStaticController):
+    """
+    Asynchronous controller for the jargon paper metric objects
+    Extend as desired
+    """
+
+    model = JPaperMetrics
+
+    async def get_by_jargon(
         self,
         jargon_id: str,
         arxiv_id: str | None = None,
@@ -72,33 +591,111 @@ class JargonPaperMetricsController(StaticController):
         :return: list of database objects
         """
 
-        query = self.session.query(self.model)
-        query = query.filter(self.model.jargon_id == jargon_id)
-
-        if arxiv_id:
-            query = query.filter(self.model.arxiv_id == arxiv_id)
-        if arxiv_rev:
-            query = query.filter(self.model.arxiv_rev == arxiv_rev)
-
-        return query.all()
+        query = build_paper_metrics_query(jargon_id, arxiv_id, arxiv_rev)
+        result = await self.session.scalars(query)
+        return list(result.all())
 
-    def get_latest_by_jargon(self, jargon_id: str) -> list:
+    async def get_latest_by_jargon(self, jargon_id: str) -> list:
         """
         Gets the latest paper jargon metrics given a jargon ID
         :param jargon_id: ID of the metrics associated jargon
         :return: list of database objects
         """
 
-        subquery = self._build_latest_rev_subquery()
+        query = build_paper_metrics_query(jargon_id, latest=True)
+        result = await self.session.scalars(query)
+        return list(result.all())
+
+    async def mark_latest(self, arxiv_ids: Iterable[str] | None = None) -> int:
+        """
+        Updates the latest revision flag of the paper jargon metrics.
+        The changes are not committed, so that they are part of the caller transaction
+        :param arxiv_ids: IDs of the papers to update. None to update them all (optional)
+        :return: number of updated records
+        """
+
+        num_records = 0
 
-        query = self.session.query(self.model)
-        query = query.filter(self.model.jargon_id == jargon_id)
-        query = query.join(
-            subquery,
-            and_(
-                self.model.arxiv_id == subquery.c.arxiv_id,
-                self.model.arxiv_rev == subquery.c.latest_rev,
-            ),
-        )
+        try:
+            for query in build_latest_queries(arxiv_ids):
+                result = await self.session.execute(query)
+                num_records += result.rowcount
+        except Exception:
+            await self.session.rollback()
+            raise
 
-        return query.all()
+        return num_records
+
+    async def refresh_latest(self, arxiv_ids: Iterable[str] | None = None) -> int:
+        """
+        Refreshes the latest revision flag of the paper jargon metrics.
+        Call it after modifying metrics without this controller (i.e. bulk loading)
+        :param arxiv_ids: IDs of the papers to refresh. None to refresh them all (optional)
+        :return: number of updated records
+        """
+
+        num_records = await self.mark_latest(arxiv_ids)
+
+        try:
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return num_records
+
+    async def create(self, instance: JPaperMetrics) -> str:
+        """
+        Creates a new database record given its object properties,
+        refreshing the latest revision flags of its paper
+        :param instance: data object to create the record from
+        :return: ID of the created object
+        """
+
+        try:
+            self.session.add(instance)
+            await self.session.flush()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        await self.refresh_latest([instance.arxiv_id])
+        return instance.id
+
+    async def create_all(self, instances: List[JPaperMetrics]) -> int:
+        """
+        Creates new database records given a list of objects,
+        refreshing the latest revision flags of their papers
+        :param instances: data objects to create the records from
+        :return: number of successfully create records
+        """
+
+        try:
+            self.session.add_all(instances)
+            await self.session.flush()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        await self.refresh_latest([instance.arxiv_id for instance in instances])
+        return len(instances)
+
+    async def delete(self, id: str) -> str:
+        """
+        Deletes a database record by its ID,
+        refreshing the latest revision flags of its paper
+        :param id: ID of the database entry
+        :return: ID of the deleted object
+        """
+
+        record = await self.get(id)
+
+        try:
+            await self.session.delete(record)
+            await self.session.flush()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        await self.refresh_latest([record.arxiv_id])
+        return id
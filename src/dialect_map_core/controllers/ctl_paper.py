@@ -1,12 +1,45 @@
 # -*- coding: utf-8 -*-
 
+from collections import defaultdict
+from datetime import datetime
+from datetime import timezone
+from typing import Dict
+from typing import Tuple
+
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import true
+from sqlalchemy import tuple_
+from sqlalchemy import update
+from sqlalchemy.orm import aliased
+
 from .base import StaticController
 from .base import EvolvingController
+from .base import build_delete_query
+from .base import build_filter_query
+from .base import iter_chunks
+from .base_async import AsyncStaticController
+from .base_async import AsyncEvolvingController
+from .ctl_metrics import build_latest_queries
+from .graph import PaperKey
 from ..models import Paper
 from ..models import PaperAuthor
+from ..models import PaperReference
 from ..models import PaperReferenceCounters
 
 
+def build_delete_rev_queries(id: str, rev: int) -> list:
+    """
+    Builds the SQL statements to delete a paper revision, refreshing the latest
+    revision flags of the paper jargon metrics, as those of the revision are deleted in cascade
+    :param id: ID of the paper
+    :param rev: revision of the paper
+    :return: list of SQL statements
+    """
+
+    return [build_delete_query(Paper, id, rev), *build_latest_queries([id])]
+
+
 class PaperController(EvolvingController):
     """
     Controller for the Paper objects (evolving)
@@ -15,6 +48,27 @@ class PaperController(EvolvingController):
 
     model = Paper
 
+    def delete_rev(self, id: str, rev: int) -> Tuple[str, int]:
+        """
+        Deletes a database record by its ID, refreshing the latest revision flags
+        of the paper jargon metrics, as those of the revision are deleted in cascade
+        :param id: ID of the database entry
+        :param rev: revision of the database entry
+        :return: ID of the deleted object
+        """
+
+        self.get(id, rev)
+
+        try:
+            for query in build_delete_rev_queries(id, rev):
+                self.session.execute(query)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return id, rev
+
 
 class PaperAuthorController(StaticController):
     """
@@ -23,6 +77,7 @@ class PaperAuthorController(StaticController):
     """
 
     model = PaperAuthor
+    query_filters = (("arxiv_id", "arxiv_rev"),)
 
     def get_by_paper(self, arxiv_id: str, arxiv_rev: int) -> list:
         """
@@ -32,11 +87,8 @@ class PaperAuthorController(StaticController):
         :return: list of database objects
         """
 
-        query = self.session.query(self.model)
-        query = query.filter(self.model.arxiv_id == arxiv_id)
-        query = query.filter(self.model.arxiv_rev == arxiv_rev)
-
-        return query.all()
+        query = build_filter_query(self.model, arxiv_id=arxiv_id, arxiv_rev=arxiv_rev)
+        return list(self.session.scalars(query).all())
 
 
 class PaperReferenceCountersController(StaticController):
@@ -46,6 +98,7 @@ class PaperReferenceCountersController(StaticController):
     """
 
     model = PaperReferenceCounters
+    query_filters = (("arxiv_id", "arxiv_rev"),)
 
     def get_by_paper(self, arxiv_id: str, arxiv_rev: int) -> list:
         """
@@ -55,8 +108,238 @@ class PaperReferenceCountersController(StaticController):
         :return: list of database objects
         """
 
+        query = build_filter_query(self.model, arxiv_id=arxiv_id, arxiv_rev=arxiv_rev)
+        return list(self.session.scalars(query).all())
+
+    def get_current(self, arxiv_id: str, arxiv_rev: int) -> PaperReferenceCounters | None:
+        """
+        Gets the most recent reference counters of a paper
+        :param arxiv_id: ID of the counters associated paper
+        :param arxiv_rev: revision of the counters associated paper
+        :return: database object. None if the paper has no counters
+        """
+
         query = self.session.query(self.model)
         query = query.filter(self.model.arxiv_id == arxiv_id)
         query = query.filter(self.model.arxiv_rev == arxiv_rev)
+        query = query.order_by(self.model.created_at.desc(), self.model.count_id.desc())
+
+        return query.first()
+
+    def get_current_ids(self, keys: list) -> Dict[PaperKey, str]:
+        """
+        Gets the IDs of the most recent reference counters of a set of papers
+        :param keys: paper keys, as (arxiv_id, arxiv_rev) pairs
+        :return: dictionary of paper keys and counter IDs
+        """
+
+        paper = (self.model.arxiv_id, self.model.arxiv_rev)
+
+        query = select(*paper, self.model.created_at, self.model.count_id)
+        query = query.where(tuple_(*paper).in_(keys))
+        query = query.order_by(self.model.created_at, self.model.count_id)
+
+        # Later rows overwrite the earlier ones
+        return {(id, rev): count_id for id, rev, _, count_id in self.session.execute(query)}
+
+    def increment(self, deltas: Dict[PaperKey, int], chunk_size: int = 1000) -> int:
+        """
+        Adds a number of references to the most recent counters of a set of papers,
+        creating the counters of those papers without them. The changes are flushed,
+        but not committed, so that they are part of the caller transaction
+        :param deltas: dictionary of paper keys and number of references to add
+        :param chunk_size: maximum number of keys per statement (optional)
+        :return: number of updated / created counters
+        """
+
+        deltas = {key: delta for key, delta in deltas.items() if delta != 0}
+        num_counters = 0
+
+        try:
+            for chunk in iter_chunks(deltas, chunk_size):
+                current_ids = self.get_current_ids(chunk)
+                grouped_ids = defaultdict(list)
+
+                for key in chunk:
+                    if key in current_ids:
+                        grouped_ids[deltas[key]].append(current_ids[key])
+                    elif deltas[key] > 0:
+                        self.session.add(
+                            self.model(
+                                arxiv_id=key[0],
+                                arxiv_rev=key[1],
+                                arxiv_ref_count=deltas[key],
+                                total_ref_count=deltas[key],
+                                derived=True,
+                                created_at=datetime.now(timezone.utc),
+                            )
+                        )
+                        num_counters += 1
+
+                # Counters are updated in place, so concurrent increments do not collide
+                for delta, count_ids in grouped_ids.items():
+                    query = update(self.model)
+                    query = query.where(self.model.count_id.in_(count_ids))
+                    query = query.values(
+                        arxiv_ref_count=self.model.arxiv_ref_count + delta,
+                        total_ref_count=self.model.total_ref_count + delta,
+                    )
+
+                    self.session.execute(query)
+                    num_counters += len(count_ids)
+
+            self.session.flush()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return num_counters
+
+    def reconcile(self, batch_size: int = 10000) -> int:
+        """
+        Corrects the most recent derived counters of every paper, according to its references.
+        The arXiv references count is set to the number of stored references,
+        and the total references count is shifted by the same difference.
+        The loaded counters are external snapshots, only shifted by the increments,
+        so they are left untouched.
+        Counters are corrected by a single set-based statement, and the papers
+        with references but without counters are fetched in batches.
+        Meant to be run periodically, to fix the drift of the incremental updates
+        :param batch_size: number of rows fetched at a time (optional)
+        :return: number of corrected / created counters
+        """
+
+        target = (PaperReference.target_arxiv_id, PaperReference.target_arxiv_rev)
+        current = aliased(self.model)
+
+        current_id = (
+            select(current.count_id)
+            .where(current.arxiv_id == self.model.arxiv_id)
+            .where(current.arxiv_rev == self.model.arxiv_rev)
+            .order_by(current.created_at.desc(), current.count_id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        actual = (
+            select(func.count())
+            .where(target[0] == self.model.arxiv_id)
+            .where(target[1] == self.model.arxiv_rev)
+            .scalar_subquery()
+        )
+
+        query = update(self.model)
+        query = query.where(self.model.derived == true())
+        query = query.where(self.model.count_id == current_id)
+        query = query.where(self.model.arxiv_ref_count != actual)
+        query = query.values(
+            arxiv_ref_count=actual,
+            total_ref_count=self.model.total_ref_count + actual - self.model.arxiv_ref_count,
+        )
+        query = query.execution_options(synchronize_session=False)
+
+        counted = (
+            select(self.model.count_id)
+            .where(self.model.arxiv_id == target[0])
+            .where(self.model.arxiv_rev == target[1])
+            .exists()
+        )
+
+        missing = select(*target, func.count()).where(~counted).group_by(*target)
+        missing = missing.execution_options(yield_per=batch_size)
+
+        try:
+            num_counters = self.session.execute(query).rowcount
+            created = []
+
+            for rows in self.session.execute(missing).partitions():
+                created.extend(
+                    self.model(
+                        arxiv_id=id,
+                        arxiv_rev=rev,
+                        arxiv_ref_count=count,
+                        total_ref_count=count,
+                        derived=True,
+                        created_at=datetime.now(timezone.utc),
+                    )
+                    for id, rev, count in rows
+                )
+
+            self.session.add_all(created)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return num_counters + len(created)
+
+
+class AsyncPaperController(AsyncEvolvingController):
+    """
+    Asynchronous controller for the Paper objects (evolving)
+    Extend as desired
+    """
+
+    model = Paper
+
+    async def delete_rev(self, id: str, rev: int) -> Tuple[str, int]:
+        """
+        Deletes a database record by its ID, refreshing the latest revision flags
+        of the paper jargon metrics, as those of the revision are deleted in cascade
+        :param id: ID of the database entry
+        :param rev: revision of the database entry
+        :return: ID of the deleted object
+        """
+
+        await self.get(id, rev)
+
+        try:
+            for query in build_delete_rev_queries(id, rev):
+                await self.session.execute(query)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return id, rev
+
+
+class AsyncPaperAuthorController(AsyncStaticController):
+    """
+    Asynchronous controller for the PaperAuthor objects (static)
+    Extend as desired
+    """
+
+    model = PaperAuthor
+
+    async def get_by_paper(self, arxiv_id: str, arxiv_rev: int) -> list:
+        """
+        Gets a list paper authors given a paper
+        :param arxiv_id: ID of the metrics associated paper
+        :param arxiv_rev: revision of the metrics associated paper
+        :return: list of database objects
+        """
+
+        query = build_filter_query(self.model, arxiv_id=arxiv_id, arxiv_rev=arxiv_rev)
+        result = await self.session.scalars(query)
+        return list(result.all())
+
+
+class AsyncPaperReferenceCountersController(AsyncStaticController):
+    """
+    Asynchronous controller for the PaperReferenceCounter objects (static)
+    Extend as desired
+    """
+
+    model = PaperReferenceCounters
+
+    async def get_by_paper(self, arxiv_id: str, arxiv_rev: int) -> list:
+        """
+        Gets a list of paper reference counters given a paper
+        :param arxiv_id: ID of the metrics associated paper
+        :param arxiv_rev: revision of the metrics associated paper
+        :return: list of database objects
+        """
 
-        return query.all()
+        query = build_filter_query(self.model, arxiv_id=arxiv_id, arxiv_rev=arxiv_rev)
+        result = await self.session.scalars(query)
+        return list(result.all())
@@ -1,16 +1,196 @@
 # -*- coding: utf-8 -*-
 
+from collections import Counter
+from threading import Lock
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Type
+
+from sqlalchemy import CTE
+from sqlalchemy import Integer
+from sqlalchemy import and_
+from sqlalchemy import cast
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import null
+from sqlalchemy import select
+from sqlalchemy import tuple_
+
 from .base import StaticController
+from .base import build_filter_query
+from .base import iter_chunks
+from .base_async import AsyncStaticController
+from .ctl_paper import PaperReferenceCountersController
+from .graph import MAX_PATH_DEPTH
+from .graph import CitationGraph
+from .graph import PaperKey
+from .graph import check_direction
+from ..models import Base
 from ..models import PaperReference
+from ..models import PaperReferenceCounters
+from ..storage import BaseDatabaseSession
+from ..storage import BaseLoadListener
+
+
+def count_targets(references: Iterable) -> Counter:
+    """
+    Counts the number of references to each target paper
+    :param references: iterable of references (objects or dictionaries)
+    :return: counter of target paper keys
+    """
+
+    keys = []
+
+    for ref in references:
+        if isinstance(ref, dict):
+            keys.append((ref["target_arxiv_id"], ref["target_arxiv_rev"]))
+        else:
+            keys.append((ref.target_arxiv_id, ref.target_arxiv_rev))
+
+    return Counter(keys)
+
+
+class ReferenceCountersListener(BaseLoadListener):
+    """
+    File loading listener updating the reference counters of the target papers,
+    within the same transaction the references are loaded with.
+
+    The current counters of the papers are updated in place, and no counters
+    are created. The references to papers without counters are held until
+    the counters of those papers are loaded, so that the counters loaded
+    after the references are not shadowed by more recent ones.
+    Any references still held at the end are accounted by 'reconcile-counters'
+    """
+
+    def __init__(self):
+        """Initializes the listener with no pending increments"""
+
+        self.pending: Dict[BaseDatabaseSession, Counter] = {}
+        self.loaded: Dict[BaseDatabaseSession, set] = {}
+        self.deferred: Counter = Counter()
+        self.lock = Lock()
+
+    def on_batch(self, session: BaseDatabaseSession, data_model: Type[Base], batch: List[dict]):
+        """
+        Accumulates the target papers of a batch of loaded references,
+        or the papers of a batch of loaded counters
+        :param session: database session loading the records
+        :param data_model: SQLAlchemy model whose table is targeted
+        :param batch: list of dictionary records
+        """
+
+        if data_model.__tablename__ == PaperReference.__tablename__:
+            self.pending.setdefault(session, Counter()).update(count_targets(batch))
+        if data_model.__tablename__ == PaperReferenceCounters.__tablename__:
+            keys = {(r["arxiv_id"], r["arxiv_rev"]) for r in batch}
+            self.loaded.setdefault(session, set()).update(keys)
+
+    def on_loaded(self, session: BaseDatabaseSession, data_model: Type[Base]):
+        """
+        Applies the accumulated increments to the papers with counters
+        :param session: database session loading the records
+        :param data_model: SQLAlchemy model whose table is targeted
+        """
+
+        controller = PaperReferenceCountersController(session)
+        deltas = self.pending.pop(session, Counter())
+        keys = self.loaded.pop(session, set())
+
+        with self.lock:
+            for key in keys & self.deferred.keys():
+                deltas[key] += self.deferred.pop(key)
+
+            counted = {}
+            for chunk in iter_chunks(deltas, 1000):
+                counted.update(controller.get_current_ids(chunk))
+
+            for key in deltas.keys() - counted.keys():
+                self.deferred[key] += deltas.pop(key)
+
+        if deltas:
+            controller.increment(deltas)
 
 
 class ReferenceController(StaticController):
     """
     Controller for the PaperReference objects (static)
     Extend as desired
+
+    :attr maintain_counters:
+        Class attribute to update the reference counters of the target papers
+        whenever references are created or deleted, within the same transaction
     """
 
     model = PaperReference
+    maintain_counters: bool = False
+    query_filters = (
+        ("source_arxiv_id", "source_arxiv_rev"),
+        ("target_arxiv_id", "target_arxiv_rev"),
+    )
+
+    def _update_counters(self, deltas: Dict[PaperKey, int]) -> None:
+        """
+        Updates the reference counters of the target papers, without committing
+        :param deltas: dictionary of paper keys and number of references to add
+        """
+
+        if self.maintain_counters:
+            PaperReferenceCountersController(self.session).increment(deltas)
+
+    def create(self, instance: PaperReference) -> str:
+        """
+        Creates a new database record given its object properties,
+        updating the reference counters of its target paper
+        :param instance: data object to create the record from
+        :return: ID of the created object
+        """
+
+        self._update_counters(count_targets([instance]))
+        return super().create(instance)
+
+    def create_all(self, instances: List[PaperReference]) -> int:
+        """
+        Creates new database records given a list of objects,
+        updating the reference counters of their target papers
+        :param instances: data objects to create the records from
+        :return: number of successfully create records
+        """
+
+        self._update_counters(count_targets(instances))
+        return super().create_all(instances)
+
+    def delete(self, id: str) -> str:
+        """
+        Deletes a database record by its ID,
+        updating the reference counters of its target paper
+        :param id: ID of the database entry
+        :return: ID of the deleted object
+        """
+
+        if self.maintain_counters:
+            deltas = count_targets([self.get(id)])
+            self._update_counters({key: -count for key, count in deltas.items()})
+
+        return super().delete(id)
+
+    def delete_many(self, ids: Iterable[str], chunk_size: int = 1000) -> int:
+        """
+        Deletes a set of database records by their IDs, using set-based statements,
+        updating the reference counters of their target papers
+        :param ids: IDs of the database entries
+        :param chunk_size: maximum number of IDs per statement (optional)
+        :return: number of deleted records
+        """
+
+        ids = list(ids)
+
+        if self.maintain_counters:
+            records = self.get_many(ids, chunk_size).records
+            deltas = count_targets(records)
+            self._update_counters({key: -count for key, count in deltas.items()})
+
+        return super().delete_many(ids, chunk_size)
 
     def get_by_source_paper(self, arxiv_id: str, arxiv_rev: int) -> list:
         """
@@ -20,11 +200,8 @@ class ReferenceController(StaticController):
         :return: list of database objects
         """
 
-        query = self.session.query(self.model)
-        query = query.filter(self.model.source_arxiv_id == arxiv_id)
-        query = query.filter(self.model.source_arxiv_rev == arxiv_rev)
-
-        return query.all()
+        query = build_filter_query(self.model, source_arxiv_id=arxiv_id, source_arxiv_rev=arxiv_rev)
+        return list(self.session.scalars(query).all())
 
     def get_by_target_paper(self, arxiv_id: str, arxiv_rev: int) -> list:
         """
@@ -34,8 +211,208 @@ class ReferenceController(StaticController):
         :return: list of database objects
         """
 
-        query = self.session.query(self.model)
-        query = query.filter(self.model.target_arxiv_id == arxiv_id)
-        query = query.filter(self.model.target_arxiv_rev == arxiv_rev)
+        query = build_filter_query(self.model, target_arxiv_id=arxiv_id, target_arxiv_rev=arxiv_rev)
+        return list(self.session.scalars(query).all())
+
+    def _build_traversal_cte(self, key: PaperKey, depth: int, direction: str) -> CTE:
+        """
+        Builds a recursive CTE expanding the references graph from a paper.
+        Each row contains a reached paper, the paper it was reached from and the hop.
+        The UNION operator discards duplicated rows within the same hop
+        :param key: paper key to start from
+        :param depth: maximum number of hops
+        :param direction: either 'references' (cited papers) or 'citations' (citing papers)
+        :return: recursive CTE
+        """
+
+        check_direction(direction)
+
+        if depth < 0:
+            raise ValueError("The depth must be a non-negative integer")
+
+        source = (self.model.source_arxiv_id, self.model.source_arxiv_rev)
+        target = (self.model.target_arxiv_id, self.model.target_arxiv_rev)
+
+        if direction == "citations":
+            source, target = target, source
+
+        id_type = self.model.source_arxiv_id.type
+
+        seed = select(
+            cast(literal(key[0]), id_type).label("arxiv_id"),
+            cast(literal(key[1]), Integer).label("arxiv_rev"),
+            cast(null(), id_type).label("parent_arxiv_id"),
+            cast(null(), Integer).label("parent_arxiv_rev"),
+            cast(literal(0), Integer).label("depth"),
+        )
+
+        cte = seed.cte("paper_traversal", recursive=True)
+
+        step = select(
+            target[0],
+            target[1],
+            cte.c.arxiv_id,
+            cte.c.arxiv_rev,
+            cte.c.depth + 1,
+        )
+        step = step.join(
+            cte,
+            and_(
+                source[0] == cte.c.arxiv_id,
+                source[1] == cte.c.arxiv_rev,
+            ),
+        )
+        step = step.where(cte.c.depth < depth)
+
+        return cte.union(step)
+
+    def get_neighbourhood(
+        self,
+        arxiv_id: str,
+        arxiv_rev: int,
+        depth: int = 1,
+        direction: str = "references",
+    ) -> Dict[PaperKey, int]:
+        """
+        Gets the papers reachable from a paper within a number of hops, in a single query
+        :param arxiv_id: ID of the paper to start from
+        :param arxiv_rev: revision of the paper to start from
+        :param depth: maximum number of hops (optional)
+        :param direction: either 'references' or 'citations' (optional)
+        :return: dictionary of paper keys and their hop distance
+        """
+
+        cte = self._build_traversal_cte((arxiv_id, arxiv_rev), depth, direction)
+
+        query = select(cte.c.arxiv_id, cte.c.arxiv_rev, func.min(cte.c.depth))
+        query = query.where(cte.c.depth > 0)
+        query = query.group_by(cte.c.arxiv_id, cte.c.arxiv_rev)
+
+        rows = self.session.execute(query).all()
+        neighbourhood = {(id, rev): hop for id, rev, hop in rows}
+        neighbourhood.pop((arxiv_id, arxiv_rev), None)
+
+        return neighbourhood
+
+    def get_shortest_path(
+        self,
+        source: PaperKey,
+        target: PaperKey,
+        max_depth: int = MAX_PATH_DEPTH,
+    ) -> List[PaperKey] | None:
+        """
+        Gets the shortest chain of references between two papers, in a single query.
+        The traversal is bounded, as the query expands every path up to 'max_depth'
+        :param source: key of the citing paper, as (arxiv_id, arxiv_rev)
+        :param target: key of the cited paper, as (arxiv_id, arxiv_rev)
+        :param max_depth: maximum number of hops (optional)
+        :return: list of paper keys, from source to target. None if unreachable
+        """
+
+        source, target = tuple(source), tuple(target)
+
+        if source == target:
+            return [source]
+
+        cte = self._build_traversal_cte(source, max_depth, "references")
+        rows = self.session.execute(select(cte).where(cte.c.depth > 0)).all()
+
+        distances: Dict[PaperKey, int] = {}
+        parents: Dict[tuple, list] = {}
+
+        for id, rev, parent_id, parent_rev, hop in rows:
+            distances[(id, rev)] = min(hop, distances.get((id, rev), hop))
+            parents.setdefault((id, rev, hop), []).append((parent_id, parent_rev))
+
+        if target not in distances:
+            return None
+
+        path = [target]
+        hop = distances[target]
+
+        # Any parent reached at the previous hop lies on a shortest path
+        while hop > 0:
+            path.append(min(parents[(*path[-1], hop)]))
+            hop -= 1
+
+        return path[::-1]
+
+    def count_citations(
+        self,
+        keys: Iterable[PaperKey],
+        chunk_size: int = 1000,
+    ) -> Dict[PaperKey, int]:
+        """
+        Counts the number of papers referencing each of the provided papers
+        :param keys: paper keys, as (arxiv_id, arxiv_rev) pairs
+        :param chunk_size: maximum number of keys per statement (optional)
+        :return: dictionary of paper keys and number of citations
+        """
+
+        target = (self.model.target_arxiv_id, self.model.target_arxiv_rev)
+        counts: Dict[PaperKey, int] = {}
+
+        for chunk in iter_chunks(keys, chunk_size):
+            counts.update({(id, rev): 0 for id, rev in chunk})
+
+            query = select(*target, func.count())
+            query = query.where(tuple_(*target).in_(chunk))
+            query = query.group_by(*target)
+
+            for id, rev, count in self.session.execute(query):
+                counts[(id, rev)] = count
+
+        return counts
+
+    def snapshot(self, batch_size: int = 10000) -> CitationGraph:
+        """
+        Loads the whole references graph into memory, to serve repeated traversals
+        :param batch_size: number of references fetched at a time (optional)
+        :return: in-memory citation graph
+        """
+
+        query = select(
+            self.model.source_arxiv_id,
+            self.model.source_arxiv_rev,
+            self.model.target_arxiv_id,
+            self.model.target_arxiv_rev,
+        )
+        query = query.execution_options(yield_per=batch_size)
+
+        rows = self.session.execute(query)
+        edges = (((s_id, s_rev), (t_id, t_rev)) for s_id, s_rev, t_id, t_rev in rows)
+
+        return CitationGraph(edges)
+
+
+class AsyncReferenceController(AsyncStaticController):
+    """
+    Asynchronous controller for the PaperReference objects (static)
+    Extend as desired
+    """
+
+    model = PaperReference
+
+    async def get_by_source_paper(self, arxiv_id: str, arxiv_rev: int) -> list:
+        """
+        Gets a list of paper references given the source
+        :param arxiv_id: ID of the reference source paper
+        :param arxiv_rev: revision of the reference source paper
+        :return: list of database objects
+        """
+
+        query = build_filter_query(self.model, source_arxiv_id=arxiv_id, source_arxiv_rev=arxiv_rev)
+        result = await self.session.scalars(query)
+        return list(result.all())
+
+    async def get_by_target_paper(self, arxiv_id: str, arxiv_rev: int) -> list:
+        """
+        Gets a list of paper references given the target
+        :param arxiv_id: ID of the reference target paper
+        :param arxiv_rev: revision of the reference target paper
+        :return: list of database objects
+        """
 
-        return query.all()
+        query = build_filter_query(self.model, target_arxiv_id=arxiv_id, target_arxiv_rev=arxiv_rev)
+        result = await self.session.scalars(query)
+        return list(result.all())
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+from collections import deque
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+
+
+# Paper keys: (arxiv_id, arxiv_rev)
+PaperKey = Tuple[str, int]
+
+GRAPH_DIRECTIONS = ("references", "citations")
+
+# Default maximum number of hops of the shortest path searches
+MAX_PATH_DEPTH = 5
+
+
+def check_direction(direction: str) -> None:
+    """
+    Checks the direction of a citation graph traversal
+    :param direction: either 'references' (cited papers) or 'citations' (citing papers)
+    """
+
+    if direction not in GRAPH_DIRECTIONS:
+        raise ValueError(f"Unknown direction: {direction}. Options: {GRAPH_DIRECTIONS}")
+
+
+class CitationGraph:
+    """
+    In-memory snapshot of the paper references graph.
+    Both the references and the citations adjacencies are stored in
+    Compressed Sparse Row (CSR) format: the neighbours of the node 'i'
+    are the 'indices[offsets[i]:offsets[i + 1]]' entries.
+
+    The snapshot is not updated when references are created or deleted.
+    """
+
+    def __init__(self, edges: Iterable[Tuple[PaperKey, PaperKey]]):
+        """
+        Initializes the graph from a list of (source, target) paper keys
+        :param edges: iterable of paper reference edges
+        """
+
+        self.nodes: List[PaperKey] = []
+        self.positions: Dict[PaperKey, int] = {}
+
+        sources = array("l")
+        targets = array("l")
+
+        for source, target in edges:
+            sources.append(self._add_node(source))
+            targets.append(self._add_node(target))
+
+        self._references = self._build_csr(sources, targets)
+        self._citations = self._build_csr(targets, sources)
+
+    def __len__(self) -> int:
+        """
+        Gets the number of nodes in the graph
+        :return: number of nodes
+        """
+
+        return len(self.nodes)
+
+    def _add_node(self, key: PaperKey) -> int:
+        """
+        Gets the position of a node, adding it to the graph if necessary
+        :param key: paper key
+        :return: node position
+        """
+
+        key = (key[0], key[1])
+        position = self.positions.get(key)
+
+        if position is None:
+            position = self.positions[key] = len(self.nodes)
+            self.nodes.append(key)
+
+        return position
+
+    def _build_csr(self, rows: array, cols: array) -> Tuple[array, array]:
+        """
+        Builds a CSR adjacency using a counting sort over the row positions
+        :param rows: positions of the edges origin nodes
+        :param cols: positions of the edges destination nodes
+        :return: offsets and indices arrays
+        """
+
+        offsets = array("l", [0] * (len(self.nodes) + 1))
+        indices = array("l", [0] * len(cols))
+
+        for row in rows:
+            offsets[row + 1] += 1
+        for i in range(len(self.nodes)):
+            offsets[i + 1] += offsets[i]
+
+        cursors = offsets[:-1]
+
+        for row, col in zip(rows, cols):
+            indices[cursors[row]] = col
+            cursors[row] += 1
+
+        return offsets, indices
+
+    def _get_adjacency(self, direction: str) -> Tuple[array, array]:
+        """
+        Gets the CSR adjacency of a traversal direction
+        :param direction: either 'references' or 'citations'
+        :return: offsets and indices arrays
+        """
+
+        check_direction(direction)
+
+        if direction == "references":
+            return self._references
+        else:
+            return self._citations
+
+    def get_neighbours(self, key: PaperKey, direction: str = "references") -> List[PaperKey]:
+        """
+        Gets the direct neighbours of a paper
+        :param key: paper key
+        :param direction: either 'references' or 'citations' (optional)
+        :return: list of paper keys
+        """
+
+        offsets, indices = self._get_adjacency(direction)
+        position = self.positions.get(key)
+
+        if position is None:
+            return []
+
+        return [self.nodes[i] for i in indices[offsets[position] : offsets[position + 1]]]
+
+    def get_neighbourhood(
+        self,
+        key: PaperKey,
+        depth: int = 1,
+        direction: str = "references",
+    ) -> Dict[PaperKey, int]:
+        """
+        Gets the papers reachable from a paper within a number of hops
+        :param key: paper key
+        :param depth: maximum number of hops (optional)
+        :param direction: either 'references' or 'citations' (optional)
+        :return: dictionary of paper keys and their hop distance
+        """
+
+        offsets, indices = self._get_adjacency(direction)
+        origin = self.positions.get(key)
+
+        if origin is None:
+            return {}
+
+        distances = {origin: 0}
+        frontier = [origin]
+
+        for hop in range(1, depth + 1):
+            next_frontier = []
+
+            for node in frontier:
+                for neighbour in indices[offsets[node] : offsets[node + 1]]:
+                    if neighbour not in distances:
+                        distances[neighbour] = hop
+                        next_frontier.append(neighbour)
+
+            frontier = next_frontier
+
+        del distances[origin]
+        return {self.nodes[i]: hop for i, hop in distances.items()}
+
+    def get_shortest_path(
+        self,
+        source: PaperKey,
+        target: PaperKey,
+        max_depth: int | None = MAX_PATH_DEPTH,
+    ) -> List[PaperKey] | None:
+        """
+        Gets the shortest chain of references between two papers
+        :param source: key of the citing paper
+        :param target: key of the cited paper
+        :param max_depth: maximum number of hops. None for unbounded (optional)
+        :return: list of paper keys, from source to target. None if unreachable
+        """
+
+        offsets, indices = self._references
+        origin = self.positions.get(source)
+        destination = self.positions.get(target)
+
+        if origin is None or destination is None:
+            return None
+
+        parents = {origin: -1}
+        queue = deque([(origin, 0)])
+
+        while queue and destination not in parents:
+            node, hop = queue.popleft()
+
+            if max_depth is not None and hop >= max_depth:
+                continue
+
+            for neighbour in indices[offsets[node] : offsets[node + 1]]:
+                if neighbour not in parents:
+                    parents[neighbour] = node
+                    queue.append((neighbour, hop + 1))
+
+        if destination not in parents:
+            return None
+
+        path = []
+        node = destination
+
+        while node != -1:
+            path.append(self.nodes[node])
+            node = parents[node]
+
+        return path[::-1]
+
+    def count_citations(self, key: PaperKey) -> int:
+        """
+        Counts the number of papers referencing a paper
+        :param key: paper key
+        :return: number of citations
+        """
+
+        offsets, _ = self._citations
+        position = self.positions.get(key)
+
+        if position is None:
+            return 0
+
+        return offsets[position + 1] - offsets[position]
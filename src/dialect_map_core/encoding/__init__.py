@@ -3,5 +3,7 @@
 from .base import BaseDecoder
 from .base import BaseEncoder
 
+from .fast import FastJSONEncoder
+
 from .json import CustomJSONDecoder
 from .json import CustomJSONEncoder
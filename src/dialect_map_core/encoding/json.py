@@ -4,8 +4,15 @@ import re
 
 from datetime import date
 from datetime import datetime
+from functools import lru_cache
 from json import JSONDecoder
 from json import JSONEncoder
+from typing import Callable
+from typing import Dict
+
+from sqlalchemy import Date
+from sqlalchemy import DateTime
+from sqlalchemy import inspect
 
 from .base import BaseDecoder
 from .base import BaseEncoder
@@ -61,6 +68,26 @@ class CustomJSONEncoder(BaseEncoder, JSONEncoder):
         return self.custom_encode(obj)
 
 
+@lru_cache(maxsize=None)
+def get_decoding_schema(data_model: type) -> Dict[str, Callable[[str], object]]:
+    """
+    Gets the parsing functions of the date and datetime columns of a data model.
+    The rest of columns are left out, as their values do not need decoding
+    :param data_model: SQLAlchemy model to inspect
+    :return: dictionary of column keys and parsing functions
+    """
+
+    schema: Dict[str, Callable[[str], object]] = {}
+
+    for key, column in inspect(data_model).columns.items():
+        if isinstance(column.type, DateTime):
+            schema[key] = datetime.fromisoformat
+        elif isinstance(column.type, Date):
+            schema[key] = date.fromisoformat
+
+    return schema
+
+
 class CustomJSONDecoder(BaseDecoder, JSONDecoder):
     """Custom JSON decoder for Python data types"""
 
@@ -87,6 +114,9 @@ class CustomJSONDecoder(BaseDecoder, JSONDecoder):
         self.date_regex = f"^{date_regex}$"
         self.datetime_regex = f"^{date_regex}(T| ){time_regex}$"
 
+        self.date_pattern = re.compile(self.date_regex)
+        self.datetime_pattern = re.compile(self.datetime_regex)
+
     def custom_decode(self, obj: object) -> object:
         """
         Decodes a JSON data type as its equivalent Python object
@@ -97,13 +127,42 @@ class CustomJSONDecoder(BaseDecoder, JSONDecoder):
         if not isinstance(obj, str):
             return obj
 
-        if re.match(self.date_regex, obj):
-            return datetime.strptime(obj, "%Y-%m-%d").date()
-        elif re.match(self.datetime_regex, obj):
-            return datetime.strptime(obj, "%Y-%m-%d %H:%M:%S")
+        if self.date_pattern.match(obj):
+            return date.fromisoformat(obj)
+        elif self.datetime_pattern.match(obj):
+            return datetime.fromisoformat(obj)
         else:
             return obj
 
+    def custom_decode_record(self, record: dict, data_model: type | None = None) -> dict:
+        """
+        Decodes the values of a JSON record, in place.
+        When a data model is provided, only its date and datetime columns are parsed,
+        and invalid date strings are kept as they are, to be reported by the validation
+        :param record: JSON record to decode
+        :param data_model: SQLAlchemy model the record belongs to (optional)
+        :return: decoded record
+        """
+
+        if data_model is None:
+            for key, val in record.items():
+                record[key] = self.custom_decode(val)
+            return record
+
+        for key, parse in get_decoding_schema(data_model).items():
+            val = record.get(key)
+            if not isinstance(val, str):
+                continue
+            if not self.date_pattern.match(val) and not self.datetime_pattern.match(val):
+                continue
+
+            try:
+                record[key] = parse(val)
+            except ValueError:
+                pass
+
+        return record
+
     def default(self, obj: object) -> object:
         """
         Decodes a JSON data type as its equivalent Python object (default function)
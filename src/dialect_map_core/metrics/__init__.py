@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+
+from .matcher import JargonMatcher
+from .matcher import load_matcher
+
+from .pipeline import MetricsPipeline
+from .pipeline import PaperText
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import re
+import re._parser as re_parser
+
+from datetime import datetime
+from datetime import timezone
+from threading import Lock
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Pattern
+from typing import Set
+from typing import Tuple
+from weakref import WeakKeyDictionary
+
+from ..controllers import JargonController
+from ..models import JargonPaperMetrics
+from ..storage import BaseDatabaseSession
+
+
+logger = logging.getLogger()
+
+
+def get_required_literal(regex: str) -> Tuple[str, bool]:
+    """
+    Gets the longest literal that every match of a regular expression contains.
+    Only the top-level sequence of the expression is inspected
+    :param regex: regular expression
+    :return: required literal (empty if none), and whether the expression is just that literal
+    """
+
+    try:
+        parsed = re_parser.parse(regex)
+        ignore_case = parsed.state.flags & re.IGNORECASE
+        tokens = [(op is re_parser.LITERAL, value) for op, value in parsed]
+    except Exception:
+        return "", False
+
+    if ignore_case:
+        return "", False
+
+    longest = current = ""
+    is_literal = True
+
+    for literal, value in tokens:
+        if literal:
+            current += chr(value)
+        else:
+            is_literal = False
+            current = ""
+
+        longest = max(longest, current, key=len)
+
+    return longest, is_literal and longest != ""
+
+
+def build_trie_regex(literals: Iterable[str]) -> str:
+    """
+    Builds a regular expression matching any of the provided literals,
+    structured as a trie so that each position is checked in linear time.
+    Longer literals are preferred over their prefixes
+    :param literals: literals to match
+    :return: regular expression
+    """
+
+    trie: dict = {}
+
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+
+        if not branches:
+            return ""
+
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{pattern})?" if "" in node else pattern
+
+    return build(trie)
+
+
+class JargonMatcher:
+    """
+    Engine counting the occurrences of a set of jargons in a text document.
+
+    The document is scanned once with a combined trie of the literals every
+    jargon expression requires (prefilter), and only the jargons whose literal
+    was found, or that require none, are counted with their own expression.
+    Jargons that are just a literal are counted without regular expressions.
+    """
+
+    def __init__(self, jargons: Iterable[Tuple[str, str]]):
+        """
+        Initializes the engine compiling the provided jargon expressions.
+        Invalid expressions are logged and skipped
+        :param jargons: iterable of (jargon ID, jargon regex) pairs
+        """
+
+        self.patterns: Dict[str, Pattern | str] = {}
+        self.unfiltered: List[str] = []
+
+        literal_jargons: Dict[str, List[str]] = {}
+
+        for jargon_id, regex in jargons:
+            try:
+                pattern = re.compile(regex)
+            except re.error as e:
+                logger.warning(f"Invalid jargon {jargon_id} expression: {regex} ({e})")
+                continue
+
+            literal, is_literal = get_required_literal(regex)
+            self.patterns[jargon_id] = literal if is_literal else pattern
+
+            if literal:
+                literal_jargons.setdefault(literal, []).append(jargon_id)
+            else:
+                self.unfiltered.append(jargon_id)
+
+        # Literals found at a position imply all the literals they contain
+        self.implied: Dict[str, Set[str]] = {
+            literal: {other for other in literal_jargons if other in literal}
+            for literal in literal_jargons
+        }
+
+        self.literal_jargons = literal_jargons
+        self.prefilter = None
+
+        if literal_jargons:
+            self.prefilter = re.compile(f"(?=({build_trie_regex(literal_jargons)}))")
+
+    def __len__(self) -> int:
+        """
+        Gets the number of compiled jargons
+        :return: number of jargons
+        """
+
+        return len(self.patterns)
+
+    def get_candidates(self, text: str) -> List[str]:
+        """
+        Gets the IDs of the jargons that may appear in a text, scanning it once
+        :param text: text document
+        :return: list of jargon IDs
+        """
+
+        candidates = list(self.unfiltered)
+
+        if self.prefilter is None:
+            return candidates
+
+        found: Set[str] = set()
+        remaining = len(self.literal_jargons)
+
+        for match in self.prefilter.finditer(text):
+            literal = match.group(1)
+
+            if literal not in found:
+                found.update(self.implied[literal])
+                if len(found) == remaining:
+                    break
+
+        for literal in found:
+            candidates.extend(self.literal_jargons[literal])
+
+        return candidates
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Counts the non-overlapping occurrences of every jargon in a text.
+        Empty matches (i.e. from expressions like 'a*') are not occurrences
+        :param text: text document
+        :return: dictionary of jargon IDs and their positive counts
+        """
+
+        counts = {}
+
+        for jargon_id in self.get_candidates(text):
+            pattern = self.patterns[jargon_id]
+
+            if isinstance(pattern, str):
+                count = text.count(pattern)
+            else:
+                count = sum(1 for m in pattern.finditer(text) if m.end() > m.start())
+
+            if count > 0:
+                counts[jargon_id] = count
+
+        return counts
+
+    @staticmethod
+    def count_words(text: str) -> int:
+        """
+        Counts the number of whitespace separated words in a text
+        :param text: text document
+        :return: number of words
+        """
+
+        return len(text.split())
+
+    def build_metrics(
+        self,
+        text: str,
+        arxiv_id: str,
+        arxiv_rev: int,
+    ) -> List[JargonPaperMetrics]:
+        """
+        Builds the paper metrics of every jargon appearing in a paper text.
+        The relative frequency is computed over the number of words in the text
+        (texts without words get a relative frequency of 0)
+        :param text: paper text
+        :param arxiv_id: ID of the paper
+        :param arxiv_rev: revision of the paper
+        :return: list of ready to insert metrics objects
+        """
+
+        counts = self.count(text)
+        num_words = self.count_words(text)
+        created_at = datetime.now(timezone.utc)
+
+        return [
+            JargonPaperMetrics(
+                jargon_id=jargon_id,
+                arxiv_id=arxiv_id,
+                arxiv_rev=arxiv_rev,
+                abs_freq=count,
+                rel_freq=count / num_words if num_words > 0 else 0.0,
+                created_at=created_at,
+            )
+            for jargon_id, count in counts.items()
+        ]
+
+
+# Engines are weakly referenced, so that disposed databases are evicted
+_matchers: WeakKeyDictionary = WeakKeyDictionary()
+_matchers_lock = Lock()
+
+
+def load_matcher(session: BaseDatabaseSession, version: Tuple | None = None) -> JargonMatcher:
+    """
+    Loads a matching engine with all the non-archived jargons of a database.
+    Engines are cached per database, until the jargons table version changes
+    :param session: database session to use
+    :param version: jargons table version, when already known (optional)
+    :return: jargons matching engine
+    """
+
+    controller = JargonController(session)
+    database = session.get_bind().engine
+
+    if version is None:
+        version = controller.get_version()
+
+    with _matchers_lock:
+        cached = _matchers.get(database)
+
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    jargons = ((j.jargon_id, j.jargon_regex) for j in controller.iter_all())
+    matcher = JargonMatcher(jargons)
+
+    with _matchers_lock:
+        _matchers[database] = (version, matcher)
+
+    return matcher
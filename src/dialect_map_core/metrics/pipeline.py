@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import os
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from datetime import timezone
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Set
+from typing import Tuple
+from typing import Type
+
+from sqlalchemy import delete
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy import tuple_
+
+from .matcher import JargonMatcher
+from .matcher import load_matcher
+from ..controllers import JargonController
+from ..controllers import JargonPaperMetricsController
+from ..controllers.base import iter_chunks
+from ..models import Base
+from ..models import CategoryMembership
+from ..models import JargonCategoryMetrics
+from ..models import JargonPaperMetrics
+from ..storage import BaseDatabaseSession
+from ..storage import get_validator
+from ..storage import prepare_rows
+
+
+logger = logging.getLogger()
+
+
+class PaperText(NamedTuple):
+    """Text of a specific paper revision"""
+
+    arxiv_id: str
+    arxiv_rev: int
+    text: str
+
+
+class PaperCounts(NamedTuple):
+    """Jargon counts of a specific paper revision"""
+
+    arxiv_id: str
+    arxiv_rev: int
+    counts: Dict[str, int]
+    num_words: int
+
+
+class PipelineResult(NamedTuple):
+    """Summary of a metrics pipeline run"""
+
+    num_papers: int
+    num_paper_metrics: int
+    num_category_metrics: int
+
+
+# Matching engine of each worker process, set by the pool initializer
+_worker_matcher: JargonMatcher | None = None
+
+
+def _init_worker(matcher: JargonMatcher) -> None:
+    """
+    Stores the matching engine within a worker process
+    :param matcher: jargons matching engine
+    """
+
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def _count_paper(paper: PaperText) -> PaperCounts:
+    """
+    Counts the jargon occurrences of a paper, within a worker process
+    :param paper: paper text
+    :return: paper jargon counts
+    """
+
+    if _worker_matcher is None:
+        raise RuntimeError("The worker process was not initialized")
+
+    counts = _worker_matcher.count(paper.text)
+    num_words = _worker_matcher.count_words(paper.text)
+
+    return PaperCounts(paper.arxiv_id, paper.arxiv_rev, counts, num_words)
+
+
+def _build_rows(data_model: Type[Base], records: List[dict]) -> List[dict]:
+    """
+    Builds the table rows of a batch of metric records, as the file loader does
+    :param data_model: SQLAlchemy metrics model
+    :param records: list of dictionary records
+    :return: list of dictionary rows
+    """
+
+    valid, errors = get_validator(data_model, allow_children=False).split(records)
+
+    if errors:
+        raise ValueError("; ".join(message for _, message in errors))
+
+    return prepare_rows(data_model, valid)
+
+
+class MetricsCheckpoint:
+    """
+    Append-only file recording the progress of a metrics pipeline run.
+    The first line identifies the jargons version the run was started with,
+    and each following line contains the papers and category partial sums
+    of a committed batch. Incomplete lines (i.e. crashes while writing) are ignored.
+
+    Without a file path, the progress is only kept in memory
+    """
+
+    def __init__(self, file_path: str | None = None):
+        """
+        Initializes the checkpoint with the path of its file
+        :param file_path: path of the checkpoint file (optional)
+        """
+
+        self.file_path = file_path
+        self.papers: Set[Tuple[str, int]] = set()
+        self.abs_freqs: Counter = Counter()
+        self.num_words: Counter = Counter()
+
+    def open(self, version: str) -> None:
+        """
+        Loads the progress of a previous run with the same jargons version, if any.
+        Checkpoints with an incomplete header (i.e. crashes while writing it) are restarted
+        :param version: jargons table version
+        """
+
+        if self.file_path is None:
+            return
+
+        lines = []
+        header = None
+
+        if os.path.exists(self.file_path):
+            with open(self.file_path) as file:
+                lines = file.read().splitlines()
+
+        if lines:
+            try:
+                header = json.loads(lines[0])
+            except json.JSONDecodeError:
+                logger.warning(f"Ignoring incomplete checkpoint header: {lines[0]}")
+
+        if not isinstance(header, dict):
+            self.remove()
+            self._append({"version": version})
+            return
+
+        if header.get("version") != version:
+            raise ValueError(f"The checkpoint {self.file_path} belongs to other jargons version")
+
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Ignoring incomplete checkpoint entry: {line}")
+                continue
+
+            self._update(entry)
+
+    def _update(self, entry: dict) -> None:
+        """
+        Updates the in-memory progress with a batch entry
+        :param entry: checkpoint batch entry
+        """
+
+        self.papers.update((id, rev) for id, rev in entry["papers"])
+        self.abs_freqs.update({(j, c): n for j, c, n in entry["abs_freqs"]})
+        self.num_words.update({c: n for c, n in entry["num_words"]})
+
+    def _append(self, entry: dict) -> None:
+        """
+        Appends an entry to the checkpoint file, waiting for it to reach the disk
+        :param entry: checkpoint entry
+        """
+
+        if self.file_path is None:
+            return
+
+        with open(self.file_path, "a") as file:
+            file.write(json.dumps(entry) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def record(self, papers: List[Tuple[str, int]], abs_freqs: Counter, num_words: Counter):
+        """
+        Records the progress of a committed batch
+        :param papers: keys of the processed papers
+        :param abs_freqs: counter of (jargon ID, category ID) absolute frequencies
+        :param num_words: counter of category number of words
+        """
+
+        entry = {
+            "papers": papers,
+            "abs_freqs": [[j, c, n] for (j, c), n in abs_freqs.items()],
+            "num_words": [[c, n] for c, n in num_words.items()],
+        }
+
+        self._append(entry)
+        self._update(entry)
+
+    def remove(self) -> None:
+        """Removes the checkpoint file, once the run is complete"""
+
+        if self.file_path is not None and os.path.exists(self.file_path):
+            os.remove(self.file_path)
+
+
+class MetricsPipeline:
+    """
+    Pipeline computing the jargon metrics of a corpus of papers.
+
+    Paper texts are spread across a pool of worker processes, where the jargons
+    are counted. The paper metrics of each batch are written with bulk inserts,
+    replacing the previous metrics of those papers, and the counts are rolled up
+    per category through the category memberships. Once every paper is processed,
+    the category metrics of the computed categories are replaced as a whole,
+    so the provided papers should cover the whole corpus of those categories.
+
+    When a checkpoint file is provided, a crashed run resumes from the last
+    committed batch, as long as the non-archived jargons did not change.
+    """
+
+    def __init__(
+        self,
+        session: BaseDatabaseSession,
+        checkpoint_path: str | None = None,
+        workers: int = 1,
+        batch_size: int = 100,
+    ):
+        """
+        Initializes the pipeline with the DB session to read and write the metrics
+        :param session: database session to use
+        :param checkpoint_path: path of the checkpoint file (optional)
+        :param workers: number of worker processes. 1 to count in-process (optional)
+        :param batch_size: number of papers written at a time (optional)
+        """
+
+        if workers < 1:
+            raise ValueError("The number of workers must be a positive integer")
+        if batch_size < 1:
+            raise ValueError("The batch size must be a positive integer")
+
+        self.session = session
+        self.checkpoint_path = checkpoint_path
+        self.workers = workers
+        self.batch_size = batch_size
+
+    def _get_categories(self, keys: List[Tuple[str, int]]) -> Dict[Tuple[str, int], List[str]]:
+        """
+        Gets the categories of a batch of papers, through their memberships
+        :param keys: paper keys, as (arxiv_id, arxiv_rev) pairs
+        :return: dictionary of paper keys and category IDs
+        """
+
+        paper = (CategoryMembership.arxiv_id, CategoryMembership.arxiv_rev)
+
+        query = select(*paper, CategoryMembership.category_id)
+        query = query.where(tuple_(*paper).in_(keys))
+
+        categories: Dict[Tuple[str, int], List[str]] = {}
+
+        for id, rev, category_id in self.session.execute(query):
+            categories.setdefault((id, rev), []).append(category_id)
+
+        return categories
+
+    def _write_papers(self, batch: List[PaperCounts]) -> Tuple[int, Counter, Counter]:
+        """
+        Replaces the paper metrics of a batch of papers, rolling up their categories
+        :param batch: list of paper jargon counts
+        :return: number of metrics, and category absolute frequencies and words counters
+        """
+
+        keys = [(paper.arxiv_id, paper.arxiv_rev) for paper in batch]
+        created_at = datetime.now(timezone.utc)
+        rows = [
+            {
+                "jargon_id": jargon_id,
+                "arxiv_id": paper.arxiv_id,
+                "arxiv_rev": paper.arxiv_rev,
+                "abs_freq": count,
+                "rel_freq": count / paper.num_words if paper.num_words > 0 else 0.0,
+                "created_at": created_at,
+            }
+            for paper in batch
+            for jargon_id, count in paper.counts.items()
+        ]
+
+        abs_freqs: Counter = Counter()
+        num_words: Counter = Counter()
+        categories = self._get_categories(keys)
+
+        for paper in batch:
+            for category_id in categories.get((paper.arxiv_id, paper.arxiv_rev), []):
+                num_words[category_id] += paper.num_words
+                for jargon_id, count in paper.counts.items():
+                    abs_freqs[(jargon_id, category_id)] += count
+
+        rows = _build_rows(JargonPaperMetrics, rows)
+        paper = (JargonPaperMetrics.arxiv_id, JargonPaperMetrics.arxiv_rev)
+
+        try:
+            self.session.execute(delete(JargonPaperMetrics).where(tuple_(*paper).in_(keys)))
+            if rows:
+                self.session.execute(insert(JargonPaperMetrics), rows)
+        except Exception:
+            self.session.rollback()
+            raise
+
+        # Commits the batch, along with the refreshed latest revision flags
+        controller = JargonPaperMetricsController(self.session)
+        controller.refresh_latest(set(key[0] for key in keys))
+
+        return len(rows), abs_freqs, num_words
+
+    def _write_categories(self, abs_freqs: Counter, num_words: Counter) -> int:
+        """
+        Replaces the category metrics of the computed categories
+        :param abs_freqs: counter of (jargon ID, category ID) absolute frequencies
+        :param num_words: counter of category number of words
+        :return: number of metrics
+        """
+
+        created_at = datetime.now(timezone.utc)
+        rows = [
+            {
+                "jargon_id": jargon_id,
+                "category_id": category_id,
+                "abs_freq": count,
+                "rel_freq": count / num_words[category_id] if num_words[category_id] > 0 else 0.0,
+                "created_at": created_at,
+            }
+            for (jargon_id, category_id), count in abs_freqs.items()
+        ]
+
+        rows = _build_rows(JargonCategoryMetrics, rows)
+
+        # Every metric of the computed categories is replaced, so no stale jargon remains
+        categories = set(num_words) | {category_id for _, category_id in abs_freqs}
+        category = JargonCategoryMetrics.category_id
+
+        try:
+            for chunk in iter_chunks(sorted(categories), 1000):
+                self.session.execute(delete(JargonCategoryMetrics).where(category.in_(chunk)))
+            if rows:
+                self.session.execute(insert(JargonCategoryMetrics), rows)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        return len(rows)
+
+    def _iter_counts(
+        self,
+        matcher: JargonMatcher,
+        papers: Iterable[PaperText],
+    ) -> Iterator[List[PaperCounts]]:
+        """
+        Iterates over batches of paper jargon counts, computed by the worker processes.
+        The next batch is submitted to the pool before the current one is yielded
+        :param matcher: jargons matching engine
+        :param papers: iterable of paper texts
+        :return: iterator of lists of paper jargon counts
+        """
+
+        batches = iter_chunks(papers, self.batch_size)
+
+        if self.workers == 1:
+            _init_worker(matcher)
+            yield from ([_count_paper(paper) for paper in batch] for batch in batches)
+            return
+
+        chunk_size = max(1, self.batch_size // (self.workers * 4))
+
+        with ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(matcher,)) as ex:
+            pending = None
+
+            for batch in batches:
+                results = ex.map(_count_paper, batch, chunksize=chunk_size)
+                if pending is not None:
+                    yield list(pending)
+                pending = results
+
+            if pending is not None:
+                yield list(pending)
+
+    def run(self, papers: Iterable[PaperText]) -> PipelineResult:
+        """
+        Computes and stores the paper and category metrics of the provided papers
+        :param papers: iterable of paper texts
+        :return: summary of the run
+        """
+
+        version = JargonController(self.session).get_version()
+        matcher = load_matcher(self.session, version)
+
+        checkpoint = MetricsCheckpoint(self.checkpoint_path)
+        checkpoint.open(str(version))
+
+        if checkpoint.papers:
+            logger.info(f"Resuming from checkpoint: {len(checkpoint.papers)} papers done")
+
+        pending = (p for p in papers if (p.arxiv_id, p.arxiv_rev) not in checkpoint.papers)
+        num_papers = 0
+        num_paper_metrics = 0
+
+        for batch in self._iter_counts(matcher, pending):
+            num_metrics, abs_freqs, num_words = self._write_papers(batch)
+            keys = [[paper.arxiv_id, paper.arxiv_rev] for paper in batch]
+
+            checkpoint.record(keys, abs_freqs, num_words)
+            num_papers += len(batch)
+            num_paper_metrics += num_metrics
+
+        num_category_metrics = self._write_categories(checkpoint.abs_freqs, checkpoint.num_words)
+        checkpoint.remove()
+
+        return PipelineResult(num_papers, num_paper_metrics, num_category_metrics)
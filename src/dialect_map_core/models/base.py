@@ -1,18 +1,82 @@
 # -*- coding: utf-8 -*-
 
 from abc import abstractmethod
+from operator import attrgetter
+from operator import itemgetter
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import NamedTuple
+from typing import Sequence
+from typing import Tuple
 
 from sqlalchemy import Boolean
 from sqlalchemy import DateTime
+from sqlalchemy import Row
+from sqlalchemy import inspect
 from sqlalchemy.orm import ONETOMANY
+from sqlalchemy.orm import configure_mappers
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import declared_attr
 from sqlalchemy.orm import mapped_column as Column
 from sqlalchemy.orm import validates
+from sqlalchemy.orm.attributes import AttributeImpl
+from sqlalchemy.orm.attributes import instance_state
 
 from .__utils import generate_timestamp
 
 
+class ModelKeys(NamedTuple):
+    """
+    Keyword arguments accepted by the initializer of a data model
+
+    :attr columns: attribute implementations of the mapped columns, by name
+    :attr children: classes of the one-to-many relationships, by name
+    """
+
+    columns: Dict[str, AttributeImpl]
+    children: Dict[str, type]
+
+
+class ModelGetters(NamedTuple):
+    """
+    Getters of the column values of a data model, as tuples
+
+    :attr columns: names of the retrieved columns
+    :attr item_getter: getter reading the values from instance dictionaries or row mappings
+    :attr attr_getter: getter reading the values as attributes (loading them if needed)
+    """
+
+    columns: Tuple[str, ...]
+    item_getter: Callable
+    attr_getter: Callable
+
+
+# Initializer keys of each data model, computed upon their first instance
+_models_keys: Dict[type, ModelKeys] = {}
+
+# Column getters of each data model and projection, computed upon their first use
+_models_getters: Dict[Tuple[type, Tuple[str, ...] | None], ModelGetters] = {}
+
+
+def _build_tuple_getter(getter_cls: Callable, keys: Tuple[str, ...]) -> Callable:
+    """
+    Builds a getter of multiple keys always returning tuples,
+    as operator getters return bare values for single keys
+    :param getter_cls: either operator.attrgetter or operator.itemgetter
+    :param keys: keys to get
+    :return: tuple getter
+    """
+
+    if len(keys) > 1:
+        return getter_cls(*keys)
+    if len(keys) == 0:
+        return lambda obj: ()
+
+    getter = getter_cls(keys[0])
+    return lambda obj: (getter(obj),)
+
+
 class Base(DeclarativeBase):
     """Base class for all the Python data models"""
 
@@ -28,25 +92,169 @@ class Base(DeclarativeBase):
 
         super().__init__()
 
-        cls = self.__class__
-        model_columns = self.__mapper__.columns
-        relationships = self.__mapper__.relationships
+        self._set_values(self._get_model_keys(), kwargs)
 
-        for key, val in kwargs.items():
-            if not hasattr(cls, key):
+    def _set_values(self, model_keys: ModelKeys, values: dict) -> None:
+        """
+        Sets the initial values of a new data object.
+        Columns are set through their cached attribute implementations,
+        skipping the descriptor lookups while keeping their events (i.e. validators)
+        :param model_keys: initializer keys of the data model
+        :param values: dictionary of attribute names and values
+        """
+
+        cls = self.__class__
+        state = instance_state(self)
+        state_dict = state.dict
+        columns = model_keys.columns
+
+        for key, val in values.items():
+            impl = columns.get(key)
+
+            if impl is not None:
+                impl.set(state, state_dict, val, None)
+            elif key in model_keys.children:
+                setattr(self, key, model_keys.children[key].build_all(val))
+            elif not hasattr(cls, key):
                 raise TypeError(f"Invalid keyword argument: {key}")
 
-            if key in model_columns:
-                setattr(self, key, val)
-                continue
+    @classmethod
+    def _get_model_keys(cls) -> ModelKeys:
+        """
+        Gets the keyword arguments accepted by the initializer, computed once per class
+        :return: initializer keys of the data model
+        """
+
+        model_keys = _models_keys.get(cls)
+
+        if model_keys is None:
+            configure_mappers()
 
-            if key in relationships:
-                relation_dir = relationships[key].direction.name
-                relation_cls = relationships[key].mapper.entity
+            mapper = inspect(cls)
+            columns = {key: getattr(cls, key).impl for key in mapper.columns.keys()}
+            children = {
+                key: relation.mapper.entity
+                for key, relation in mapper.relationships.items()
+                if relation.direction.name == ONETOMANY.name
+            }
 
-                if relation_dir == ONETOMANY.name:
-                    instances = [relation_cls(**elem) for elem in val]
-                    setattr(self, key, instances)
+            model_keys = ModelKeys(columns, children)
+            _models_keys[cls] = model_keys
+
+        return model_keys
+
+    @classmethod
+    def build_all(cls, records: Iterable[dict]) -> list:
+        """
+        Builds a list of data objects, resolving the initializer keys once per batch
+        :param records: iterable of dictionary records
+        :return: list of data objects
+        """
+
+        model_keys = cls._get_model_keys()
+        instances = []
+
+        for record in records:
+            instance = cls()
+            instance._set_values(model_keys, record)
+            instances.append(instance)
+
+        return instances
+
+    @classmethod
+    def get_getters(cls, columns: Sequence[str] | None = None) -> ModelGetters:
+        """
+        Gets the getters of the column values, computed once per class and projection
+        :param columns: names of the columns to get. None for all (optional)
+        :return: column getters of the data model
+        """
+
+        cache_key = (cls, None if columns is None else tuple(columns))
+        getters = _models_getters.get(cache_key)
+
+        if getters is not None:
+            return getters
+
+        table_cols = tuple(cls.__table__.columns.keys())
+
+        if columns is None:
+            columns = table_cols
+
+        unknown = set(columns) - set(table_cols)
+        if unknown:
+            raise ValueError(f"Unknown columns in table {cls.__tablename__}: {unknown}")
+
+        columns = tuple(columns)
+        getters = ModelGetters(
+            columns=columns,
+            item_getter=_build_tuple_getter(itemgetter, columns),
+            attr_getter=_build_tuple_getter(attrgetter, columns),
+        )
+
+        _models_getters[cache_key] = getters
+        return getters
+
+    @staticmethod
+    def _get_values(obj: object, getters: ModelGetters) -> tuple:
+        """
+        Gets the column values of a data object or a Core row.
+        Object values are read from their loaded state, unless expired or deferred
+        :param obj: data object or Core row
+        :param getters: column getters of the data model
+        :return: tuple of values
+        """
+
+        if isinstance(obj, Row):
+            return getters.item_getter(obj._mapping)
+
+        try:
+            return getters.item_getter(obj.__dict__)
+        except KeyError:
+            return getters.attr_getter(obj)
+
+    def to_tuple(self, columns: Sequence[str] | None = None) -> tuple:
+        """
+        Serializes the data object as a tuple of column values
+        :param columns: names of the columns to serialize. None for all (optional)
+        :return: tuple of values
+        """
+
+        return self._get_values(self, self.get_getters(columns))
+
+    def to_dict(self, columns: Sequence[str] | None = None) -> dict:
+        """
+        Serializes the data object as a dictionary of column names and values
+        :param columns: names of the columns to serialize. None for all (optional)
+        :return: dictionary of values
+        """
+
+        getters = self.get_getters(columns)
+        return dict(zip(getters.columns, self._get_values(self, getters)))
+
+    @classmethod
+    def serialize_many(
+        cls,
+        rows: Iterable,
+        columns: Sequence[str] | None = None,
+        as_tuples: bool = False,
+    ) -> list:
+        """
+        Serializes a sequence of data objects, or Core rows selecting the model
+        columns, resolving the column getters once for all of them
+        :param rows: iterable of data objects or Core rows
+        :param columns: names of the columns to serialize. None for all (optional)
+        :param as_tuples: whether to serialize the rows as tuples (optional)
+        :return: list of dictionaries (or tuples) of values
+        """
+
+        getters = cls.get_getters(columns)
+        get_values = cls._get_values
+
+        if as_tuples:
+            return [get_values(row, getters) for row in rows]
+
+        keys = getters.columns
+        return [dict(zip(keys, get_values(row, getters))) for row in rows]
 
     def __str__(self) -> str:
         """
@@ -55,12 +263,7 @@ class Base(DeclarativeBase):
         """
 
         model_name = self.__class__.__name__
-        model_cols = self.__table__.columns.keys()
-        obj_values = []
-
-        for col in model_cols:
-            val = getattr(self, col)
-            obj_values.append(f"{col}='{val}'")
+        obj_values = [f"{col}='{val}'" for col, val in self.to_dict().items()]
 
         return f"<{model_name}({', '.join(obj_values)}>)"
 
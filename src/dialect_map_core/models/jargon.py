@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from sqlalchemy import DateTime
 from sqlalchemy import ForeignKeyConstraint as FKConstraint
 from sqlalchemy import String
 from sqlalchemy.orm import mapped_column as Column
@@ -8,6 +9,7 @@ from sqlalchemy.orm import relationship
 from .base import Base
 from .base import ArchivalModel
 from .__utils import generate_id
+from .__utils import generate_timestamp
 
 
 class JargonGroup(Base, ArchivalModel):
@@ -44,14 +46,24 @@ class Jargon(Base, ArchivalModel):
     """
     Jargon term related information record.
     Contains all the static properties of a jargon term
+
+    The audit date is refreshed on every update, so that the expressions
+    modified in place change the version of the jargons table
     """
 
     __tablename__ = "jargons"
 
-    group_id = Column(String(32), nullable=True)
+    group_id = Column(String(32), nullable=True, index=True)
     jargon_id = Column(String(32), nullable=False, primary_key=True, default=generate_id)
     jargon_term = Column(String(64), nullable=False, index=True)
     jargon_regex = Column(String(128), nullable=False)
+    audited_at = Column(
+        DateTime,
+        nullable=True,
+        index=False,
+        default=generate_timestamp,
+        onupdate=generate_timestamp,
+    )
 
     __table_args__ = (
         FKConstraint(
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 
+from sqlalchemy import Boolean
 from sqlalchemy import Float
 from sqlalchemy import ForeignKeyConstraint as FKConstraint
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy.orm import mapped_column as Column
@@ -23,7 +25,7 @@ class JargonCategoryMetrics(Base, StaticModel):
     __tablename__ = "jargon_category_metrics"
 
     metric_id = Column(String(32), nullable=False, primary_key=True, default=generate_id)
-    jargon_id = Column(String(32), nullable=False, index=True)
+    jargon_id = Column(String(32), nullable=False)
     category_id = Column(String(32), nullable=False)
     abs_freq = Column(Integer, nullable=False)
     rel_freq = Column(Float, nullable=False)
@@ -39,6 +41,7 @@ class JargonCategoryMetrics(Base, StaticModel):
             refcolumns=[Category.category_id],
             ondelete="CASCADE",
         ),
+        Index("ix_jargon_category_metrics_jargon_category", jargon_id, category_id),
     )
 
     @property
@@ -55,6 +58,10 @@ class JargonPaperMetrics(Base, StaticModel):
     """
     ArXiv paper jargon NLP metrics
     Contains every NLP metric information computable for a jargon term.
+
+    The 'is_latest' column flags the metrics of the latest paper revision,
+    and it is kept up to date by the corresponding controller, and by the
+    metrics loading listener when loading files.
     """
 
     __tablename__ = "jargon_paper_metrics"
@@ -65,6 +72,7 @@ class JargonPaperMetrics(Base, StaticModel):
     arxiv_rev = Column(Integer, nullable=False)
     abs_freq = Column(Integer, nullable=False)
     rel_freq = Column(Float, nullable=False)
+    is_latest = Column(Boolean, nullable=False, default=False)
 
     # Define a Foreign key over multiple columns (Composite Foreign Key)
     # Official docs: https://docs.sqlalchemy.org/en/20/core/constraints.html
@@ -80,6 +88,8 @@ class JargonPaperMetrics(Base, StaticModel):
             refcolumns=[Paper.arxiv_id, Paper.arxiv_rev],
             ondelete="CASCADE",
         ),
+        Index("ix_jargon_paper_metrics_latest", jargon_id, is_latest),
+        Index("ix_jargon_paper_metrics_paper", arxiv_id, arxiv_rev),
     )
 
     @property
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 
+from sqlalchemy import Boolean
 from sqlalchemy import Date
 from sqlalchemy import ForeignKeyConstraint as FKConstraint
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy.orm import mapped_column as Column
@@ -93,6 +95,7 @@ class PaperAuthor(Base, StaticModel):
             refcolumns=[Paper.arxiv_id, Paper.arxiv_rev],
             ondelete="CASCADE",
         ),
+        Index("ix_paper_authors_paper", arxiv_id, arxiv_rev),
     )
 
     @property
@@ -109,6 +112,10 @@ class PaperReferenceCounters(Base, StaticModel):
     """
     ArXiv paper reference counters record.
     Contains the number of paper references on a certain date
+
+    The 'derived' column flags the counters created from the stored references,
+    as opposed to the loaded ones, which are external snapshots of the counts.
+    Only the derived counters are reconciled with the stored references
     """
 
     __tablename__ = "paper_reference_counters"
@@ -118,6 +125,7 @@ class PaperReferenceCounters(Base, StaticModel):
     arxiv_rev = Column(Integer, nullable=False)
     arxiv_ref_count = Column(Integer, nullable=False)
     total_ref_count = Column(Integer, nullable=False)
+    derived = Column(Boolean, nullable=False, default=False)
 
     # Define a Foreign key over multiple columns (Composite Foreign Key)
     # Official docs: https://docs.sqlalchemy.org/en/20/core/constraints.html
@@ -128,6 +136,7 @@ class PaperReferenceCounters(Base, StaticModel):
             refcolumns=[Paper.arxiv_id, Paper.arxiv_rev],
             ondelete="CASCADE",
         ),
+        Index("ix_paper_reference_counters_paper", arxiv_id, arxiv_rev),
     )
 
     @property
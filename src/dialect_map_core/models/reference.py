@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from sqlalchemy import ForeignKeyConstraint as FKConstraint
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy import UniqueConstraint
@@ -46,6 +47,7 @@ class PaperReference(Base, StaticModel):
             target_arxiv_id,
             target_arxiv_rev,
         ),
+        Index("ix_paper_references_target", target_arxiv_id, target_arxiv_rev),
     )
 
     @property
@@ -1,15 +1,34 @@
 # -*- coding: utf-8 -*-
 
+from .columnar import ColumnarExporter
+from .columnar import DictionaryColumn
+
 from .context import BaseDatabaseContext
 from .context import SQLDatabaseContext
 
+from .database import AsyncSQLDatabase
 from .database import BaseDatabase
+from .database import BaseDatabaseAsyncSession
 from .database import BaseDatabaseError
 from .database import BaseDatabaseSession
 from .database import BaseDatabaseTransaction
+from .database import BaseLoadListener
+from .database import CompositeLoadListener
 from .database import SQLDatabase
+from .database import prepare_rows
 
 from .loader import BaseFileLoader
 from .loader import JSONFileLoader
 
+from .schema import get_indexed_columns
+from .schema import get_table_dependencies
+from .schema import get_unindexed_filters
+
+from .streams import CSVRowsStream
+
+from .validation import RecordError
+from .validation import RecordValidationError
+from .validation import RecordValidator
+from .validation import get_validator
+
 from .__utils import get_error_message
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+
+from datetime import date
+from datetime import datetime
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Sequence
+
+from sqlalchemy import Column
+from sqlalchemy import select
+
+from .database import BaseDatabaseSession
+
+
+class DictionaryColumn(NamedTuple):
+    """
+    Dictionary-encoded column, where each value is stored as an integer code.
+    Null values are encoded as -1 (the pandas.Categorical convention)
+
+    :attr codes: NumPy array of value codes
+    :attr values: list of distinct values, indexed by their code
+    """
+
+    codes: Any
+    values: list
+
+
+class DictionaryEncoder:
+    """Encoder assigning incremental integer codes to the distinct values of a column"""
+
+    def __init__(self):
+        """Initializes the encoder with an empty dictionary"""
+
+        self.mapping: Dict[Any, int] = {}
+        self.values: list = []
+
+    def encode(self, values: Sequence) -> List[int]:
+        """
+        Encodes a sequence of values, extending the dictionary with the new ones
+        :param values: values to encode
+        :return: list of value codes
+        """
+
+        codes = []
+
+        for value in values:
+            if value is None:
+                codes.append(-1)
+                continue
+
+            code = self.mapping.get(value)
+            if code is None:
+                code = self.mapping[value] = len(self.values)
+                self.values.append(value)
+
+            codes.append(code)
+
+        return codes
+
+
+class ColumnarExporter:
+    """
+    Exporter of database tables into columnar formats.
+    Rows are fetched in batches from a server-side cursor (when supported),
+    without building ORM objects, and transposed into NumPy or Arrow arrays.
+    String columns are dictionary-encoded, and the rest are stored as
+    NumPy typed arrays (nullable integers become float arrays with NaNs).
+
+    Requires the 'numpy' package, and 'pyarrow' for the Arrow / Parquet methods.
+    """
+
+    def __init__(self, session: BaseDatabaseSession, batch_size: int = 10000):
+        """
+        Initializes the exporter with the session to run the queries with
+        :param session: database session to use
+        :param batch_size: number of rows fetched at a time (optional)
+        """
+
+        if batch_size < 1:
+            raise ValueError("The batch size must be a positive integer")
+
+        self.session = session
+        self.batch_size = batch_size
+
+    @staticmethod
+    def _get_columns(model: type, column_names: Sequence[str] | None) -> List[Column]:
+        """
+        Gets the table columns to export from a data model
+        :param model: data model to export
+        :param column_names: names of the columns to export. None for all (optional)
+        :return: list of table columns
+        """
+
+        table = model.__table__
+
+        if column_names is None:
+            return list(table.columns)
+
+        unknown = set(column_names) - set(table.columns.keys())
+        if unknown:
+            raise ValueError(f"Unknown columns in table {table.name}: {unknown}")
+
+        return [table.columns[name] for name in column_names]
+
+    @staticmethod
+    def _get_numpy_dtype(column: Column) -> str | None:
+        """
+        Gets the NumPy data type of a table column. None for dictionary-encoded ones
+        :param column: table column
+        :return: NumPy data type
+        """
+
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            python_type = object
+
+        if python_type is bool:
+            return "object" if column.nullable else "bool"
+        if python_type is int:
+            return "float64" if column.nullable else "int64"
+        if python_type is float:
+            return "float64"
+        if python_type is datetime:
+            return "datetime64[us]"
+        if python_type is date:
+            return "datetime64[D]"
+
+        return None
+
+    def _iter_row_batches(
+        self,
+        columns: List[Column],
+        where: Iterable = (),
+    ) -> Iterator[List[tuple]]:
+        """
+        Iterates over batches of rows, as plain tuples
+        :param columns: table columns to select
+        :param where: SQL filter conditions (optional)
+        :return: iterator of row batches
+        """
+
+        query = select(*columns).where(*where)
+        query = query.execution_options(yield_per=self.batch_size)
+
+        result = self.session.execute(query)
+
+        try:
+            for rows in result.partitions():
+                yield [tuple(row) for row in rows]
+        finally:
+            result.close()
+
+    def _iter_column_batches(
+        self,
+        columns: List[Column],
+        encoders: Dict[str, DictionaryEncoder],
+        where: Iterable,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over batches of columns, either NumPy arrays or dictionary codes.
+        Non-numeric columns without encoder are kept as lists of Python values
+        :param columns: table columns to export
+        :param encoders: dictionary encoders of the non-numeric columns, by name
+        :param where: SQL filter conditions
+        :return: iterator of dictionaries of column names and arrays
+        """
+
+        import numpy as np
+
+        dtypes = [self._get_numpy_dtype(column) for column in columns]
+
+        for rows in self._iter_row_batches(columns, where):
+            batch = {}
+
+            for column, dtype, values in zip(columns, dtypes, zip(*rows)):
+                if column.name in encoders:
+                    codes = encoders[column.name].encode(values)
+                    batch[column.name] = np.array(codes, dtype="int32")
+                elif dtype is None:
+                    batch[column.name] = list(values)
+                elif dtype == "float64":
+                    values = [np.nan if v is None else v for v in values]
+                    batch[column.name] = np.array(values, dtype=dtype)
+                else:
+                    batch[column.name] = np.array(values, dtype=dtype)
+
+            yield batch
+
+    def _build_encoders(self, columns: List[Column]) -> Dict[str, DictionaryEncoder]:
+        """
+        Builds the dictionary encoders of the columns without NumPy data type
+        :param columns: table columns to export
+        :return: dictionary of column names and encoders
+        """
+
+        return {c.name: DictionaryEncoder() for c in columns if self._get_numpy_dtype(c) is None}
+
+    def _build_arrow_schema(self, columns: List[Column]) -> Any:
+        """
+        Builds the Arrow schema of the exported columns
+        :param columns: table columns to export
+        :return: Arrow schema
+        """
+
+        import pyarrow as pa
+
+        types = {
+            "bool": pa.bool_(),
+            "object": pa.bool_(),
+            "int64": pa.int64(),
+            "float64": pa.float64(),
+            "datetime64[us]": pa.timestamp("us"),
+            "datetime64[D]": pa.date32(),
+            None: pa.dictionary(pa.int32(), pa.string()),
+        }
+
+        fields = [(c.name, types[self._get_numpy_dtype(c)]) for c in columns]
+        return pa.schema(fields)
+
+    def to_numpy(
+        self,
+        model: type,
+        column_names: Sequence[str] | None = None,
+        where: Iterable = (),
+    ) -> Dict[str, Any]:
+        """
+        Exports a data model table into NumPy arrays
+        :param model: data model to export
+        :param column_names: names of the columns to export. None for all (optional)
+        :param where: SQL filter conditions (optional)
+        :return: dictionary of column names and arrays / dictionary-encoded columns
+        """
+
+        import numpy as np
+
+        columns = self._get_columns(model, column_names)
+        encoders = self._build_encoders(columns)
+        chunks: Dict[str, list] = {column.name: [] for column in columns}
+
+        for batch in self._iter_column_batches(columns, encoders, where):
+            for name, array in batch.items():
+                chunks[name].append(array)
+
+        arrays: Dict[str, Any] = {}
+
+        for column in columns:
+            if chunks[column.name]:
+                array = np.concatenate(chunks[column.name])
+            else:
+                array = np.array([], dtype=self._get_numpy_dtype(column) or "int32")
+
+            if column.name in encoders:
+                arrays[column.name] = DictionaryColumn(array, encoders[column.name].values)
+            else:
+                arrays[column.name] = array
+
+        return arrays
+
+    def iter_record_batches(
+        self,
+        model: type,
+        column_names: Sequence[str] | None = None,
+        where: Iterable = (),
+    ) -> Iterator:
+        """
+        Exports a data model table into Arrow record batches, lazily.
+        String columns are encoded as Arrow dictionary arrays, each batch
+        with its own dictionary, holding only the values within the batch
+        :param model: data model to export
+        :param column_names: names of the columns to export. None for all (optional)
+        :param where: SQL filter conditions (optional)
+        :return: iterator of Arrow record batches
+        """
+
+        import pyarrow as pa
+
+        columns = self._get_columns(model, column_names)
+        schema = self._build_arrow_schema(columns)
+
+        # Values are dictionary-encoded by Arrow, rather than by a table-wide encoder,
+        # so that the batches do not carry every value seen in the previous ones.
+        # Strings are converted from the Python lists, without padded NumPy arrays
+        for batch in self._iter_column_batches(columns, {}, where):
+            arrays = []
+
+            for field, (name, array) in zip(schema, batch.items()):
+                if pa.types.is_dictionary(field.type):
+                    values = pa.array(array, type=field.type.value_type)
+                    arrays.append(values.dictionary_encode())
+                else:
+                    arrays.append(pa.array(array, type=field.type, from_pandas=True))
+
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def to_parquet(
+        self,
+        file_path: str,
+        model: type,
+        column_names: Sequence[str] | None = None,
+        where: Iterable = (),
+    ) -> int:
+        """
+        Exports a data model table into a Parquet file, one batch at a time
+        :param file_path: path of the Parquet file to write
+        :param model: data model to export
+        :param column_names: names of the columns to export. None for all (optional)
+        :param where: SQL filter conditions (optional)
+        :return: number of exported rows
+        """
+
+        import pyarrow.parquet as pq
+
+        columns = self._get_columns(model, column_names)
+        schema = self._build_arrow_schema(columns)
+        num_rows = 0
+
+        with pq.ParquetWriter(file_path, schema) as writer:
+            for batch in self.iter_record_batches(model, column_names, where):
+                writer.write_batch(batch)
+                num_rows += batch.num_rows
+
+        return num_rows
@@ -5,18 +5,44 @@ import time
 
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from graphlib import TopologicalSorter
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
 from typing import Type
 from typing import Union
 
+from sqlalchemy import insert
+
 from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Engine
 from sqlalchemy.engine import Transaction
+from sqlalchemy.engine import URL
 from sqlalchemy.engine import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import StaticPool
 
 from .loader import BaseFileLoader
 from .loader import JSONFileLoader
+from .schema import get_table_dependencies
+from .streams import CSVRowsStream
+from .validation import PRIVATE_COLUMNS
+from .validation import RecordError
+from .validation import RecordValidationError
+from .validation import get_validator
 from ..models import Base
 
 
@@ -25,13 +51,143 @@ logger = logging.getLogger()
 
 # Alias type definitions
 SQLAlchemySession = Session
+SQLAlchemyAsyncSession = AsyncSession
 SQLAlchemyTransaction = Transaction
 
 # Base type definitions
 BaseDatabaseError = Union[SQLAlchemyError]
 BaseDatabaseSession = Union[SQLAlchemySession]
+BaseDatabaseAsyncSession = Union[SQLAlchemyAsyncSession]
 BaseDatabaseTransaction = Union[SQLAlchemyTransaction]
 
+# Handling modes of the invalid records
+VALIDATION_MODES = ("raise", "skip")
+
+
+def _is_memory_url(url: URL) -> bool:
+    """
+    Checks whether a connection URL targets an in-memory SQLite database.
+    Those databases are not shared across connections
+    :param url: database connection URL
+    :return: whether the database is in-memory
+    """
+
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def prepare_rows(data_model: Type[Base], batch: List[dict]) -> List[dict]:
+    """
+    Prepares a batch of records to be inserted as plain table rows, in place.
+    Columns are validated, and missing defaults generated, once per batch.
+    Used by the bulk insertion methods, and by any other plain rows writer
+    :param data_model: SQLAlchemy model whose table is targeted
+    :param batch: list of dictionary records
+    :return: list of dictionary rows sharing the same keys
+    """
+
+    table = data_model.__table__
+    keys = set().union(*batch)
+
+    for key in keys - set(table.columns.keys()):
+        raise TypeError(f"Invalid keyword argument: {key}")
+    for key in keys & PRIVATE_COLUMNS:
+        raise ValueError(f"The column '{key}' must not be provided")
+
+    # Archival records can only be provided an archival date once archived
+    if "archived_at" in keys and "archived" in table.columns:
+        for record in batch:
+            if record.get("archived_at") is not None and not record.get("archived"):
+                raise ValueError("The column 'archived_at' must not be provided")
+
+    # Rows must share the same keys in order to be executed as a batch.
+    # Missing values are filled with the column defaults, or NULL without them
+    for column in table.columns:
+        default = column.default
+        if column.key not in keys and default is None:
+            continue
+
+        rows = [r for r in batch if column.key not in r]
+        if not rows:
+            continue
+
+        if default is None:
+            values = [None] * len(rows)
+        elif default.is_scalar:
+            values = [default.arg] * len(rows)
+        elif column.primary_key or column.unique:
+            values = [default.arg(None) for _ in rows]
+        else:
+            values = [default.arg(None)] * len(rows)
+
+        for row, value in zip(rows, values):
+            row[column.key] = value
+
+    return batch
+
+
+class BaseLoadListener(ABC):
+    """
+    Interface for the listeners of the file loading process.
+    Both methods are called within the loading transaction
+    """
+
+    @abstractmethod
+    def on_batch(self, session: Session, data_model: Type[Base], batch: List[dict]) -> None:
+        """
+        Receives a batch of records, before they are inserted
+        :param session: database session loading the records
+        :param data_model: SQLAlchemy model whose table is targeted
+        :param batch: list of dictionary records
+        """
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def on_loaded(self, session: Session, data_model: Type[Base]) -> None:
+        """
+        Receives the end of a file loading, before committing the transaction
+        :param session: database session loading the records
+        :param data_model: SQLAlchemy model whose table is targeted
+        """
+
+        raise NotImplementedError()
+
+
+class CompositeLoadListener(BaseLoadListener):
+    """
+    File loading listener notifying a sequence of listeners, in order.
+    Used to maintain several derived values within the same loading transaction
+    """
+
+    def __init__(self, listeners: Iterable[BaseLoadListener]):
+        """
+        Initializes the composite listener with its inner listeners
+        :param listeners: listeners of the loaded batches
+        """
+
+        self.listeners = list(listeners)
+
+    def on_batch(self, session: Session, data_model: Type[Base], batch: List[dict]) -> None:
+        """
+        Passes a batch of records to every inner listener
+        :param session: database session loading the records
+        :param data_model: SQLAlchemy model whose table is targeted
+        :param batch: list of dictionary records
+        """
+
+        for listener in self.listeners:
+            listener.on_batch(session, data_model, batch)
+
+    def on_loaded(self, session: Session, data_model: Type[Base]) -> None:
+        """
+        Passes the end of a file loading to every inner listener
+        :param session: database session loading the records
+        :param data_model: SQLAlchemy model whose table is targeted
+        """
+
+        for listener in self.listeners:
+            listener.on_loaded(session, data_model)
+
 
 class BaseDatabase(ABC):
     """Interface for the database classes"""
@@ -68,11 +224,14 @@ class BaseDatabase(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def load(self, file_path: str, data_model):
+    def load(self, file_path: str, data_model, batch_size: int, method: str):
         """
         Loads a specific file of data objects into the database
         :param file_path: path to the specific file to load
         :param data_model: data model to instantiate with each record
+        :param batch_size: maximum number of records to hold in memory at a time
+        :param method: strategy used to insert the records
+        :return: number of loaded records
         """
 
         raise NotImplementedError()
@@ -106,12 +265,24 @@ class SQLDatabase(BaseDatabase):
         connection_url: str,
         backoff_seconds: int = 32,
         file_loader: BaseFileLoader | None = None,
+        pooled: bool = False,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = 3600,
     ):
         """
-        Initiates the database connection
+        Initiates the database connection.
+        On pooled mode, each session checks out its own connection from a pool,
+        while the main connection is kept for the schema and transaction operations.
         :param connection_url: complete url to connect to the database
         :param backoff_seconds: maximum seconds to wait for connection (optional)
         :param file_loader: file loader to populate the database (optional)
+        :param pooled: whether to use a pool of connections for the sessions (optional)
+        :param pool_size: number of connections kept open in the pool (optional)
+        :param max_overflow: number of connections allowed beyond the pool size (optional)
+        :param pool_pre_ping: whether to test the connections upon checkout (optional)
+        :param pool_recycle: seconds after which connections are recycled (optional)
         """
 
         if file_loader is None:
@@ -121,10 +292,41 @@ class SQLDatabase(BaseDatabase):
 
         self.file_loader = file_loader
         self.max_backoff = backoff_seconds
+        self.pooled = pooled
+
+        if pooled:
+            self.engine = self._create_pooled_engine(
+                connection_url,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=pool_pre_ping,
+                pool_recycle=pool_recycle,
+            )
+        else:
+            self.engine = create_engine(connection_url)
 
-        self.engine = create_engine(connection_url)
         self.connection = self._create_connection()
-        self.session_factory = sessionmaker(bind=self.connection)
+
+        if pooled:
+            self.session_factory = sessionmaker(bind=self.engine)
+        else:
+            self.session_factory = sessionmaker(bind=self.connection)
+
+    @staticmethod
+    def _create_pooled_engine(connection_url: str, **pool_options) -> Engine:
+        """
+        Creates a database engine backed by a queue pool of connections
+        :param connection_url: complete url to connect to the database
+        :param pool_options: arguments for the connections pool
+        :return: Engine object
+        """
+
+        url = make_url(connection_url)
+
+        if _is_memory_url(url):
+            raise ValueError("Pooled mode is not supported by in-memory databases")
+
+        return create_engine(url, poolclass=QueuePool, **pool_options)
 
     def _create_connection(self) -> Connection:
         """
@@ -168,25 +370,346 @@ class SQLDatabase(BaseDatabase):
         return self.connection.begin()
 
     def close_connection(self):
-        """Closes the database connection"""
+        """Closes the database connection, and the pool ones on pooled mode"""
 
         self.connection.close()
 
-    def load(self, file_path: str, data_model: Type[Base]):
+        if self.pooled:
+            self.engine.dispose()
+
+    def _insert_objects(
+        self,
+        session: Session,
+        data_model: Type[Base],
+        batches: Iterable[List[dict]],
+    ) -> int:
         """
-        Loads a specific file of data objects into the database
+        Inserts batches of records by instantiating their ORM objects
+        :param session: database session to use
+        :param data_model: SQLAlchemy model to instantiate
+        :param batches: iterable of lists of dictionary records
+        :return: number of inserted records
+        """
+
+        num_records = 0
+
+        for batch in batches:
+            session.add_all(data_model.build_all(batch))
+            session.flush()
+
+            # Flushed objects are released to keep memory usage flat
+            session.expunge_all()
+            num_records += len(batch)
+
+        return num_records
+
+    def _insert_rows(
+        self,
+        session: Session,
+        data_model: Type[Base],
+        batches: Iterable[List[dict]],
+    ) -> int:
+        """
+        Inserts batches of records as multi-row INSERT statements (one per batch).
+        Only suitable for flat models, as nested children are not supported.
+        :param session: database session to use
+        :param data_model: SQLAlchemy model whose table is targeted
+        :param batches: iterable of lists of dictionary records
+        :return: number of inserted records
+        """
+
+        stmt = insert(data_model.__table__)
+        num_records = 0
+
+        for batch in batches:
+            rows = prepare_rows(data_model, batch)
+            session.execute(stmt, rows)
+            num_records += len(rows)
+
+        return num_records
+
+    def _copy_rows(
+        self,
+        session: Session,
+        data_model: Type[Base],
+        batches: Iterable[List[dict]],
+    ) -> int:
+        """
+        Inserts batches of records streaming them through a single COPY statement.
+        Only available for PostgreSQL (psycopg2). Otherwise, it falls back to INSERTs.
+        :param session: database session to use
+        :param data_model: SQLAlchemy model whose table is targeted
+        :param batches: iterable of lists of dictionary records
+        :return: number of inserted records
+        """
+
+        dialect = self.engine.dialect
+
+        if (dialect.name, dialect.driver) != ("postgresql", "psycopg2"):
+            logger.info(f"COPY is not supported by {dialect.name}. Using INSERT statements")
+            return self._insert_rows(session, data_model, batches)
+
+        table = data_model.__table__
+        columns = table.columns.keys()
+
+        rows = (
+            tuple(row.get(col) for col in columns)
+            for batch in batches
+            for row in prepare_rows(data_model, batch)
+        )
+
+        preparer = dialect.identifier_preparer
+        table_name = preparer.format_table(table)
+        column_names = ", ".join(preparer.quote(col) for col in columns)
+
+        stream = CSVRowsStream(rows)
+        stmt = f"COPY {table_name} ({column_names}) FROM STDIN WITH (FORMAT csv)"
+
+        dbapi_conn = session.connection().connection
+        with dbapi_conn.cursor() as cursor:
+            cursor.copy_expert(stmt, stream)
+
+        return stream.num_rows
+
+    @staticmethod
+    def _notify_batches(
+        session: Session,
+        data_model: Type[Base],
+        batches: Iterable[List[dict]],
+        listener: BaseLoadListener,
+    ) -> Iterator[List[dict]]:
+        """
+        Passes each batch of records to a listener, as they are streamed
+        :param session: database session to use
+        :param data_model: SQLAlchemy model whose table is targeted
+        :param batches: iterable of lists of dictionary records
+        :param listener: listener of the loaded batches
+        :return: iterator of lists of dictionary records
+        """
+
+        for batch in batches:
+            listener.on_batch(session, data_model, batch)
+            yield batch
+
+    def _validate_batches(
+        self,
+        file_path: str,
+        data_model: Type[Base],
+        batch_size: int,
+        method: str,
+        validation: str,
+    ) -> Iterator[List[dict]]:
+        """
+        Iterates over batches of validated records, reporting the invalid ones.
+        Nested children are only valid when inserted as ORM objects
+        :param file_path: path to the specific file to load
+        :param data_model: SQLAlchemy model whose table is targeted
+        :param batch_size: maximum number of records to hold in memory at a time
+        :param method: insertion method. Either 'orm', 'bulk' or 'copy'
+        :param validation: invalid records handling. Either 'raise' or 'skip'
+        :return: iterator of lists of valid dictionary records
+        """
+
+        validator = get_validator(data_model, allow_children=method == "orm")
+        batches = self.file_loader.iter_numbered_batches(file_path, batch_size, data_model)
+
+        for lines, batch in batches:
+            valid, errors = validator.split(batch)
+            errors = [RecordError(file_path, lines[i], message) for i, message in errors]
+
+            if errors and validation == "raise":
+                raise RecordValidationError(errors)
+
+            for error in errors:
+                logger.warning(f"Skipping invalid record: {error}")
+
+            if valid:
+                yield valid
+
+    def _load_file(
+        self,
+        session: Session,
+        file_path: str,
+        data_model: Type[Base],
+        batch_size: int,
+        method: str,
+        listener: BaseLoadListener | None = None,
+        validation: str | None = None,
+    ) -> int:
+        """
+        Loads a specific file of data objects using the provided session
+        :param session: database session to use
         :param file_path: path to the specific file to load
         :param data_model: SQLAlchemy model to instantiate
+        :param batch_size: maximum number of records to hold in memory at a time
+        :param method: insertion method. Either 'orm', 'bulk' or 'copy'
+        :param listener: listener of the loaded batches (optional)
+        :param validation: invalid records handling. Either 'raise' or 'skip' (optional)
+        :return: number of loaded records
         """
 
+        inserters = {
+            "orm": self._insert_objects,
+            "bulk": self._insert_rows,
+            "copy": self._copy_rows,
+        }
+
+        if method not in inserters:
+            raise ValueError(f"Unknown loading method: {method}")
+        if validation is not None and validation not in VALIDATION_MODES:
+            raise ValueError(f"Unknown validation mode: {validation}")
+
         logger.info(f"Loading {data_model.__name__} records")
 
-        records = self.file_loader.load(file_path)
-        objects = (data_model(**record) for record in records)
+        if validation is None:
+            batches = self.file_loader.iter_batches(file_path, batch_size, data_model)
+        else:
+            batches = self._validate_batches(file_path, data_model, batch_size, method, validation)
+
+        inserter = inserters[method]
+        start_time = time.perf_counter()
+
+        if listener is not None:
+            batches = self._notify_batches(session, data_model, batches, listener)
+
+        num_records = inserter(session, data_model, batches)
+
+        if listener is not None:
+            listener.on_loaded(session, data_model)
+
+        session.commit()
+
+        elapsed = time.perf_counter() - start_time
+        logger.info(f"Loaded {num_records} records ({num_records / max(elapsed, 1e-6):.0f} rows/s)")
+
+        return num_records
+
+    def _load_file_isolated(
+        self,
+        file_path: str,
+        data_model: Type[Base],
+        batch_size: int,
+        method: str,
+        listener: BaseLoadListener | None = None,
+        validation: str | None = None,
+    ) -> int:
+        """
+        Loads a specific file of data objects using a dedicated connection
+        :param file_path: path to the specific file to load
+        :param data_model: SQLAlchemy model to instantiate
+        :param batch_size: maximum number of records to hold in memory at a time
+        :param method: insertion method. Either 'orm', 'bulk' or 'copy'
+        :param listener: listener of the loaded batches (optional)
+        :param validation: invalid records handling. Either 'raise' or 'skip' (optional)
+        :return: number of loaded records
+        """
+
+        args = (file_path, data_model, batch_size, method, listener, validation)
+
+        with self.engine.connect() as connection:
+            with Session(bind=connection) as session:
+                return self._load_file(session, *args)
+
+    def load(
+        self,
+        file_path: str,
+        data_model: Type[Base],
+        batch_size: int = 1000,
+        method: str = "orm",
+        listener: BaseLoadListener | None = None,
+        validation: str | None = None,
+    ) -> int:
+        """
+        Loads a specific file of data objects into the database.
+        Records are streamed in batches, all of them within a single transaction.
+        When validating, invalid records are either reported with their file line
+        and aborting the load ('raise'), or logged and left out ('skip').
+        :param file_path: path to the specific file to load
+        :param data_model: SQLAlchemy model to instantiate
+        :param batch_size: maximum number of records to hold in memory at a time (optional)
+        :param method: insertion method. Either 'orm', 'bulk' or 'copy' (optional)
+        :param listener: listener of the loaded batches (optional)
+        :param validation: invalid records handling. Either 'raise' or 'skip' (optional)
+        :return: number of loaded records
+        """
+
+        args = (file_path, data_model, batch_size, method, listener, validation)
 
         with self.create_session() as session:
-            session.add_all(objects)
-            session.commit()
+            return self._load_file(session, *args)
+
+    def load_all(
+        self,
+        mappings: Iterable[Tuple[str, Type[Base]]],
+        batch_size: int = 1000,
+        method: str = "orm",
+        workers: int = 1,
+        listener: BaseLoadListener | None = None,
+        validation: str | None = None,
+    ) -> int:
+        """
+        Loads a set of data files into the database, respecting their foreign keys.
+        Files whose tables do not depend on each other are loaded concurrently.
+        :param mappings: iterable of file path and SQLAlchemy model pairs
+        :param batch_size: maximum number of records to hold in memory at a time (optional)
+        :param method: insertion method. Either 'orm', 'bulk' or 'copy' (optional)
+        :param workers: maximum number of files to load concurrently (optional)
+        :param listener: listener of the loaded batches (optional)
+        :param validation: invalid records handling. Either 'raise' or 'skip' (optional)
+        :return: number of loaded records
+        """
+
+        if workers < 1:
+            raise ValueError("The number of workers must be a positive integer")
+
+        mappings = list(mappings)
+        tables = [model.__table__ for _, model in mappings]
+        table_deps = get_table_dependencies(tables)
+
+        sorter: TopologicalSorter = TopologicalSorter()
+
+        for i, table in enumerate(tables):
+            deps = [j for j, t in enumerate(tables) if t.name in table_deps[table.name]]
+            sorter.add(i, *deps)
+
+        if workers == 1 or _is_memory_url(self.engine.url):
+            loads = [
+                self.load(*mappings[i], batch_size, method, listener, validation)
+                for i in sorter.static_order()
+            ]
+            return sum(loads)
+
+        num_records = 0
+        sorter.prepare()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures: Dict[Future, int] = {}
+
+            while sorter.is_active():
+                for i in sorter.get_ready():
+                    future = executor.submit(
+                        self._load_file_isolated,
+                        *mappings[i],
+                        batch_size,
+                        method,
+                        listener,
+                        validation,
+                    )
+                    futures[future] = i
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    try:
+                        num_records += future.result()
+                    except Exception:
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+
+                    sorter.done(futures.pop(future))
+
+        return num_records
 
     def setup(self, check: bool = True):
         """
@@ -205,3 +728,76 @@ class SQLDatabase(BaseDatabase):
 
         with self.create_transaction():
             Base.metadata.drop_all(bind=self.connection, checkfirst=check)
+
+
+class AsyncSQLDatabase:
+    """
+    Database class using SQLAlchemy asyncio utilities.
+    Requires an asyncio compatible driver (i.e. 'asyncpg', 'aiosqlite')
+    """
+
+    error = SQLAlchemyError
+
+    def __init__(
+        self,
+        connection_url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = 3600,
+    ):
+        """
+        Initiates the database engine. Connections are checked out lazily
+        :param connection_url: complete url to connect to the database
+        :param pool_size: number of connections kept open in the pool (optional)
+        :param max_overflow: number of connections allowed beyond the pool size (optional)
+        :param pool_pre_ping: whether to test the connections upon checkout (optional)
+        :param pool_recycle: seconds after which connections are recycled (optional)
+        """
+
+        logger.info(f"Connecting to database URL: {connection_url}")
+
+        url = make_url(connection_url)
+        options: dict = {}
+
+        if _is_memory_url(url):
+            options["poolclass"] = StaticPool
+        elif url.get_backend_name() != "sqlite":
+            options["pool_size"] = pool_size
+            options["max_overflow"] = max_overflow
+            options["pool_pre_ping"] = pool_pre_ping
+            options["pool_recycle"] = pool_recycle
+
+        self.engine = create_async_engine(url, **options)
+        self.session_factory = async_sessionmaker(bind=self.engine, expire_on_commit=False)
+
+    def create_session(self) -> AsyncSession:
+        """
+        Creates an asynchronous database session object
+        :return: asynchronous session
+        """
+
+        return self.session_factory()
+
+    async def close_connection(self):
+        """Closes all the database connections"""
+
+        await self.engine.dispose()
+
+    async def setup(self, check: bool = True):
+        """
+        Creates all the tables necessary to operate the project
+        :param check: whether to respect the already created tables (optional)
+        """
+
+        async with self.engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all, checkfirst=check)
+
+    async def teardown(self, check: bool = False):
+        """
+        Deletes all project tables. Only useful when debugging
+        :param check: whether to respect the filled tables (optional)
+        """
+
+        async with self.engine.begin() as connection:
+            await connection.run_sync(Base.metadata.drop_all, checkfirst=check)
@@ -1,54 +1,293 @@
 # -*- coding: utf-8 -*-
 
 import json
+import re
 
 from abc import ABC
 from abc import abstractmethod
+from itertools import islice
+from typing import Any
+from typing import Iterator
+from typing import List
+from typing import TextIO
+from typing import Tuple
 
 from ..encoding import CustomJSONDecoder
 
 
+# Pattern to skip the JSON insignificant whitespace
+WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+
+# Pattern to detect the number and unicode escape tails that may continue on the next read
+TRUNCATED_TAIL_PATTERN = re.compile(r"(?:[.eE][-+]?|u[0-9a-fA-F]{0,4})\Z")
+
+# JSON literals whose prefixes may continue on the next read
+JSON_LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+
+def _is_truncated(error: json.JSONDecodeError) -> bool:
+    """
+    Checks whether a JSON decoding error may be caused by the end of the buffer,
+    rather than by an invalid document, so that reading more data could fix it
+    :param error: JSON decoding error
+    :return: whether the error may be caused by a truncated value
+    """
+
+    tail = error.doc[error.pos :]
+
+    if not tail or error.msg.startswith("Unterminated string"):
+        return True
+
+    if any(lit.startswith(tail) for lit in JSON_LITERALS):
+        return True
+
+    return TRUNCATED_TAIL_PATTERN.match(tail) is not None
+
+
 class BaseFileLoader(ABC):
     """Interface for the data file loader classes"""
 
     @abstractmethod
-    def load(self, file_path: str) -> list:
+    def load(self, file_path: str, data_model: type | None = None) -> list:
         """
         Loads a specific file of data objects into memory
         :param file_path: path to the specific file to load
+        :param data_model: SQLAlchemy model the records belong to (optional)
         :return: list of dictionary records
         """
 
         raise NotImplementedError()
 
+    def iter_records(self, file_path: str, data_model: type | None = None) -> Iterator[dict]:
+        """
+        Iterates over the records of a specific file of data objects.
+        Loaders not able to stream their files default to a full load.
+        :param file_path: path to the specific file to iterate
+        :param data_model: SQLAlchemy model the records belong to (optional)
+        :return: iterator of dictionary records
+        """
+
+        yield from self.load(file_path, data_model)
+
+    def iter_numbered_records(
+        self,
+        file_path: str,
+        data_model: type | None = None,
+    ) -> Iterator[Tuple[int, dict]]:
+        """
+        Iterates over the records of a specific file, along with their line numbers.
+        Loaders not able to track lines number the records by their position.
+        :param file_path: path to the specific file to iterate
+        :param data_model: SQLAlchemy model the records belong to (optional)
+        :return: iterator of (line number, dictionary record) pairs
+        """
+
+        yield from enumerate(self.iter_records(file_path, data_model), start=1)
+
+    def iter_batches(
+        self,
+        file_path: str,
+        batch_size: int,
+        data_model: type | None = None,
+    ) -> Iterator[list]:
+        """
+        Iterates over bounded-size batches of records of a specific file
+        :param file_path: path to the specific file to iterate
+        :param batch_size: maximum number of records per batch
+        :param data_model: SQLAlchemy model the records belong to (optional)
+        :return: iterator of lists of dictionary records
+        """
+
+        if batch_size < 1:
+            raise ValueError("The batch size must be a positive integer")
+
+        records = self.iter_records(file_path, data_model)
+
+        while batch := list(islice(records, batch_size)):
+            yield batch
+
+    def iter_numbered_batches(
+        self,
+        file_path: str,
+        batch_size: int,
+        data_model: type | None = None,
+    ) -> Iterator[Tuple[List[int], List[dict]]]:
+        """
+        Iterates over bounded-size batches of records, along with their line numbers
+        :param file_path: path to the specific file to iterate
+        :param batch_size: maximum number of records per batch
+        :param data_model: SQLAlchemy model the records belong to (optional)
+        :return: iterator of (line numbers, dictionary records) pairs
+        """
+
+        if batch_size < 1:
+            raise ValueError("The batch size must be a positive integer")
+
+        records = self.iter_numbered_records(file_path, data_model)
+
+        while batch := list(islice(records, batch_size)):
+            lines, records_batch = zip(*batch)
+            yield list(lines), list(records_batch)
+
 
 class JSONFileLoader(BaseFileLoader):
-    """Data file loader class for JSON documents"""
+    """
+    Data file loader class for JSON documents.
+    Supports both top-level JSON arrays and newline-delimited JSON (NDJSON)
+    """
 
-    def __init__(self, **kwargs):
+    def __init__(self, read_size: int = 2**16, **kwargs):
         """
         Initialized the JSON data file loader
+        :param read_size: number of characters to read from the file at a time (optional)
         :param kwargs: arguments for the JSON decoder
         """
 
+        if read_size < 1:
+            raise ValueError("The read size must be a positive integer")
+
         self.decoder = CustomJSONDecoder(**kwargs)
+        self.read_size = read_size
 
-    def load(self, file_path: str) -> list:
+    def _iter_documents(self, file: TextIO) -> Iterator[Tuple[int, Any]]:
         """
-        Loads a specific JSON records file into memory
-        :param file_path: path to the specific JSON file to load
-        :return: list of dictionary records
+        Incrementally parses the JSON values of a file, one at a time.
+        Values inside a top-level array are yielded individually.
+        Invalid values are reported as soon as they are read, without reaching the file end.
+        :param file: opened text file to parse
+        :return: iterator of (starting line number, JSON value) pairs
         """
 
-        with open(file_path) as file:
-            records = json.load(file)
+        buffer = ""
+        pos = 0
+        eof = False
+
+        # Newlines are counted up to the 'counted' buffer position
+        line = 1
+        counted = 0
+
+        in_array = False
+        array_seen = False
+        array_closed = False
+        expect_value = True
+        trailing_comma = False
+
+        # Top-level values must be separated by newlines (NDJSON)
+        expect_newline = False
+
+        while True:
+            start = pos
+            pos = WHITESPACE_PATTERN.match(buffer, pos).end()  # type: ignore
+
+            if expect_newline and buffer.find("\n", start, pos) >= 0:
+                expect_newline = False
+
+            # Refill the buffer when the whole of it has been consumed
+            if pos == len(buffer):
+                if eof:
+                    break
+
+                chunk = file.read(self.read_size)
+                line += buffer.count("\n", counted, pos)
+                buffer, pos, eof, counted = buffer[pos:] + chunk, 0, not chunk, 0
+                continue
+
+            char = buffer[pos]
+
+            if array_closed or expect_newline:
+                raise json.JSONDecodeError("Extra data", buffer, pos)
+
+            if not array_seen and char == "[":
+                in_array = array_seen = True
+                pos += 1
+                continue
+
+            array_seen = True
+
+            if in_array and not expect_value:
+                if char == ",":
+                    expect_value = trailing_comma = True
+                elif char == "]":
+                    array_closed = True
+                else:
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+
+                pos += 1
+                continue
+
+            if in_array and char == "]":
+                if trailing_comma:
+                    raise json.JSONDecodeError("Illegal trailing comma", buffer, pos)
+
+                array_closed = True
+                pos += 1
+                continue
+
+            try:
+                value, end = self.decoder.raw_decode(buffer, pos)
+                tail = TRUNCATED_TAIL_PATTERN.match(buffer, end)
+                truncated = end == len(buffer) or tail is not None
+            except json.JSONDecodeError as error:
+                if eof or not _is_truncated(error):
+                    raise
+                truncated = True
 
-        if type(records) is not list:
-            records = [records]
+            # Values reaching the end of the buffer may continue on the next read
+            if truncated and not eof:
+                chunk = file.read(max(self.read_size, len(buffer)))
+                line += buffer.count("\n", counted, pos)
+                buffer, pos, eof, counted = buffer[pos:] + chunk, 0, not chunk, 0
+                continue
 
-        # Decode strings into corresponding Python objects
-        for record in records:
-            for key, val in record.items():
-                record[key] = self.decoder.custom_decode(val)
+            line += buffer.count("\n", counted, pos)
+            counted = pos
+
+            pos = end
+            expect_value = trailing_comma = False
+            expect_newline = not in_array
+            yield line, value
+
+        if in_array and not array_closed:
+            raise json.JSONDecodeError("Unterminated array", buffer, pos)
+
+    def iter_records(self, file_path: str, data_model: type | None = None) -> Iterator[dict]:
+        """
+        Lazily iterates over the records of a specific JSON file.
+        Only a bounded portion of the file is held in memory at a time.
+        When a data model is provided, only its date and datetime columns are decoded
+        :param file_path: path to the specific JSON file to iterate
+        :param data_model: SQLAlchemy model the records belong to (optional)
+        :return: iterator of dictionary records
+        """
+
+        for _, record in self.iter_numbered_records(file_path, data_model):
+            yield record
+
+    def iter_numbered_records(
+        self,
+        file_path: str,
+        data_model: type | None = None,
+    ) -> Iterator[Tuple[int, dict]]:
+        """
+        Lazily iterates over the records of a specific JSON file, along with
+        the line number where each of them starts
+        :param file_path: path to the specific JSON file to iterate
+        :param data_model: SQLAlchemy model the records belong to (optional)
+        :return: iterator of (line number, dictionary record) pairs
+        """
+
+        with open(file_path) as file:
+            for line, record in self._iter_documents(file):
+                if isinstance(record, dict):
+                    record = self.decoder.custom_decode_record(record, data_model)
+                yield line, record
+
+    def load(self, file_path: str, data_model: type | None = None) -> list:
+        """
+        Loads a specific JSON records file into memory
+        :param file_path: path to the specific JSON file to load
+        :param data_model: SQLAlchemy model the records belong to (optional)
+        :return: list of dictionary records
+        """
 
-        return records
+        return list(self.iter_records(file_path, data_model))
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+
+from sqlalchemy import Table
+from sqlalchemy import UniqueConstraint
+
+
+def get_table_dependencies(tables: Iterable[Table]) -> Dict[str, Set[str]]:
+    """
+    Gets the tables each table depends on, given their foreign keys.
+    Only dependencies among the provided tables are considered.
+    :param tables: tables to compute the dependencies of
+    :return: dictionary of table names and their dependency table names
+    """
+
+    tables = list(tables)
+    names = {table.name for table in tables}
+    dependencies: Dict[str, Set[str]] = {}
+
+    for table in tables:
+        refs = {fk.column.table.name for fk in table.foreign_keys}
+        refs = refs & names - {table.name}
+        dependencies.setdefault(table.name, set()).update(refs)
+
+    return dependencies
+
+
+def get_indexed_columns(table: Table) -> Set[Tuple[str, ...]]:
+    """
+    Gets the column names of every index a table has, including the ones
+    implicitly created by the primary key and the unique constraints
+    :param table: table to get the indexes from
+    :return: set of indexed column names tuples
+    """
+
+    indexes = {tuple(c.name for c in table.primary_key.columns)}
+    indexes.update(tuple(c.name for c in idx.columns) for idx in table.indexes)
+    indexes.update(
+        tuple(c.name for c in cons.columns)
+        for cons in table.constraints
+        if isinstance(cons, UniqueConstraint)
+    )
+
+    return {index for index in indexes if len(index) > 0}
+
+
+def get_unindexed_filters(
+    table: Table,
+    filters: Iterable[Sequence[str]],
+) -> List[Tuple[str, ...]]:
+    """
+    Gets the filters that no table index can be used for, causing full scans.
+    An index can be used when its leading column is part of the filter.
+    :param table: table the filters are applied to
+    :param filters: sets of column names used together in filter conditions
+    :return: list of unindexed filters
+    """
+
+    leading = {index[0] for index in get_indexed_columns(table)}
+    unindexed = []
+
+    for columns in filters:
+        unknown = set(columns) - set(table.columns.keys())
+        if unknown:
+            raise ValueError(f"Unknown columns in table {table.name}: {unknown}")
+        if leading.isdisjoint(columns):
+            unindexed.append(tuple(columns))
+
+    return unindexed
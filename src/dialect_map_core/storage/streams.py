@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import io
+
+from datetime import date
+from datetime import datetime
+from typing import Iterator
+
+
+class CSVRowsStream(io.TextIOBase):
+    """
+    Read-only text stream producing CSV lines out of table rows, lazily.
+    The format follows the PostgreSQL COPY defaults for CSV files:
+    unquoted empty values are NULLs, while quoted ones are empty strings.
+    """
+
+    def __init__(self, rows: Iterator[tuple]):
+        """
+        Initializes the stream with the rows to encode
+        :param rows: iterator of row value tuples
+        """
+
+        self.rows = rows
+        self.parts: list = []
+        self.parts_size = 0
+        self.num_rows = 0
+
+    @staticmethod
+    def format_value(value: object) -> str:
+        """
+        Formats a single row value as a CSV field
+        :param value: Python value to format
+        :return: CSV field
+        """
+
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (int, float)):
+            return repr(value)
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+
+        value = str(value).replace('"', '""')
+        return f'"{value}"'
+
+    def format_row(self, row: tuple) -> str:
+        """
+        Formats a complete row as a CSV line
+        :param row: tuple of row values
+        :return: CSV line
+        """
+
+        return ",".join([self.format_value(v) for v in row]) + "\n"
+
+    def readable(self) -> bool:
+        """
+        Checks whether the stream can be read from
+        :return: always true
+        """
+
+        return True
+
+    def read(self, size: int | None = -1) -> str:
+        """
+        Reads up to a number of characters from the stream
+        :param size: maximum number of characters to read. Negative to read all (optional)
+        :return: CSV text
+        """
+
+        if size is None:
+            size = -1
+
+        while size < 0 or self.parts_size < size:
+            row = next(self.rows, None)
+            if row is None:
+                break
+
+            line = self.format_row(row)
+            self.parts.append(line)
+            self.parts_size += len(line)
+            self.num_rows += 1
+
+        text = "".join(self.parts)
+
+        if 0 <= size < len(text):
+            text, rest = text[:size], text[size:]
+            self.parts, self.parts_size = [rest], len(rest)
+        else:
+            self.parts, self.parts_size = [], 0
+
+        return text
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+from datetime import date
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+from typing import Type
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import ONETOMANY
+
+from ..models import Base
+
+
+# Columns filled by the database layer, never by the records
+PRIVATE_COLUMNS = {"audited_at"}
+
+
+class RecordError(NamedTuple):
+    """Validation error of a specific record within a data file"""
+
+    file_path: str
+    line: int
+    message: str
+
+    def __str__(self) -> str:
+        """
+        Builds a string representation of the error
+        :return: string representation
+        """
+
+        return f"{self.file_path}:{self.line}: {self.message}"
+
+
+class RecordValidationError(ValueError):
+    """Error raised when a batch of records contains invalid ones"""
+
+    def __init__(self, errors: List[RecordError]):
+        """
+        Initializes the error with the list of invalid records
+        :param errors: list of record errors
+        """
+
+        self.errors = errors
+        super().__init__("\n".join(str(error) for error in errors))
+
+
+class ColumnRule(NamedTuple):
+    """Validation rule of a specific table column"""
+
+    types: Tuple[type, ...]
+    parse: Callable | None
+    nullable: bool
+    max_length: int | None
+
+
+class RecordValidator:
+    """
+    Validator of the dictionary records of a data model.
+
+    The rules are compiled once from the model mapper: accepted types,
+    nullability and maximum length of the columns, the required columns,
+    and the one-to-many relationships allowed to contain nested children
+    (unless the records are inserted as plain table rows).
+
+    Values are coerced in place when lossless (ISO strings into dates and
+    datetimes, integers into floats), so the validated records can be
+    inserted as plain table rows.
+    """
+
+    def __init__(
+        self,
+        data_model: Type[Base],
+        parent_keys: FrozenSet[str] = frozenset(),
+        allow_children: bool = True,
+    ):
+        """
+        Compiles the validation rules of a data model
+        :param data_model: SQLAlchemy model to validate the records of
+        :param parent_keys: columns filled by the parent relationship (optional)
+        :param allow_children: whether nested children are accepted (optional)
+        """
+
+        mapper = inspect(data_model)
+        table = data_model.__table__
+
+        self.model_name = data_model.__name__
+        self.rules: Dict[str, ColumnRule] = {}
+        self.required: List[str] = []
+        self.children: Dict[str, Tuple[Type[Base], FrozenSet[str]]] = {}
+        self.archival = "archived" in table.columns and "archived_at" in table.columns
+        self.allow_children = allow_children
+
+        for key, column in mapper.columns.items():
+            if key in PRIVATE_COLUMNS:
+                continue
+
+            try:
+                python_type = column.type.python_type
+            except NotImplementedError:
+                python_type = object
+
+            if python_type is bool:
+                rule = ColumnRule((bool,), None, column.nullable, None)
+            elif python_type is int:
+                rule = ColumnRule((int,), None, column.nullable, None)
+            elif python_type is float:
+                rule = ColumnRule((float, int), float, column.nullable, None)
+            elif python_type is datetime:
+                rule = ColumnRule((datetime,), datetime.fromisoformat, column.nullable, None)
+            elif python_type is date:
+                rule = ColumnRule((date,), date.fromisoformat, column.nullable, None)
+            else:
+                length = getattr(column.type, "length", None)
+                rule = ColumnRule((python_type,), None, column.nullable, length)
+
+            self.rules[key] = rule
+
+            if column.nullable or key in parent_keys or column is table.autoincrement_column:
+                continue
+            if column.default is None and column.server_default is None:
+                self.required.append(key)
+
+        for key, relation in mapper.relationships.items():
+            if relation.direction.name == ONETOMANY.name:
+                remote_keys = frozenset(c.key for c in relation.remote_side)
+                self.children[key] = (relation.mapper.entity, remote_keys)
+
+    def _check_value(self, key: str, val: object, rule: ColumnRule) -> Tuple[object, str | None]:
+        """
+        Checks (and coerces) the value of a specific column
+        :param key: column name
+        :param val: provided value
+        :param rule: column validation rule
+        :return: coerced value, and error message (None if valid)
+        """
+
+        if val is None:
+            return val, None if rule.nullable else f"The column '{key}' must not be null"
+
+        # Booleans are integers in Python, but not in the database
+        if isinstance(val, bool) and bool not in rule.types:
+            return val, f"The column '{key}' must be of type {rule.types[0].__name__}"
+
+        if isinstance(val, rule.types):
+            if rule.types[0] is date and isinstance(val, datetime):
+                return val, f"The column '{key}' must be of type date"
+            if rule.max_length is not None and len(val) > rule.max_length:  # type: ignore
+                return val, f"The column '{key}' exceeds {rule.max_length} characters"
+            if rule.parse is float:
+                return float(val), None  # type: ignore
+            return val, None
+
+        if rule.parse is not None and isinstance(val, str):
+            try:
+                return rule.parse(val), None
+            except ValueError:
+                pass
+
+        return val, f"The column '{key}' must be of type {rule.types[0].__name__}"
+
+    def validate(self, record: dict) -> List[str]:
+        """
+        Validates a record, coercing its values in place
+        :param record: dictionary record
+        :return: list of error messages (empty if valid)
+        """
+
+        if not isinstance(record, dict):
+            return [f"Invalid {self.model_name} record: expected a JSON object"]
+
+        messages = []
+
+        for key, val in record.items():
+            rule = self.rules.get(key)
+
+            if rule is not None:
+                record[key], message = self._check_value(key, val, rule)
+                if message is not None:
+                    messages.append(message)
+            elif key in self.children and not self.allow_children:
+                messages.append(f"The relationship '{key}' is only supported by the 'orm' method")
+            elif key in self.children:
+                messages.extend(self._validate_children(key, val))
+            elif key in PRIVATE_COLUMNS:
+                messages.append(f"The column '{key}' must not be provided")
+            else:
+                messages.append(f"Invalid keyword argument: {key}")
+
+        for key in self.required:
+            if key not in record:
+                messages.append(f"The column '{key}' is required")
+
+        if self.archival and record.get("archived_at") is not None and not record.get("archived"):
+            messages.append("The column 'archived_at' must not be provided")
+
+        return messages
+
+    def _validate_children(self, key: str, val: object) -> List[str]:
+        """
+        Validates the nested children of a one-to-many relationship
+        :param key: relationship name
+        :param val: provided list of children records
+        :return: list of error messages (empty if valid)
+        """
+
+        if not isinstance(val, list):
+            return [f"The relationship '{key}' must be a list"]
+
+        validator = get_validator(*self.children[key])
+        messages = []
+
+        for i, child in enumerate(val):
+            messages.extend(f"{key}[{i}]: {message}" for message in validator.validate(child))
+
+        return messages
+
+    def split(self, records: List[dict]) -> Tuple[List[dict], List[Tuple[int, str]]]:
+        """
+        Validates a batch of records, separating the valid ones
+        :param records: list of dictionary records
+        :return: list of valid records, and list of (record position, error message) pairs
+        """
+
+        valid = []
+        errors = []
+
+        for i, record in enumerate(records):
+            messages = self.validate(record)
+
+            if messages:
+                errors.append((i, "; ".join(messages)))
+            else:
+                valid.append(record)
+
+        return valid, errors
+
+
+@lru_cache(maxsize=None)
+def get_validator(
+    data_model: Type[Base],
+    parent_keys: FrozenSet[str] = frozenset(),
+    allow_children: bool = True,
+) -> RecordValidator:
+    """
+    Gets the validator of a data model, compiled once per model
+    :param data_model: SQLAlchemy model to validate the records of
+    :param parent_keys: columns filled by the parent relationship (optional)
+    :param allow_children: whether nested children are accepted (optional)
+    :return: record validator
+    """
+
+    return RecordValidator(data_model, parent_keys, allow_children)
@@ -27,8 +27,9 @@ FILES_PATH = Path(__file__).parent.joinpath("files")
 
 
 ### NOTE:
-### Mappings order matters, as there are some data models
-### that define Foreign key constrains on other data models.
+### Mappings order matters when loading them one by one, as there are some
+### data models that define Foreign key constrains on other data models.
+### The SQLDatabase 'load_all' method derives the right order by itself.
 FILES_MAPPINGS = [
     Mapping(
         file=str(FILES_PATH.joinpath("test_category.json")),
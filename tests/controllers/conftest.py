@@ -4,6 +4,7 @@ import pytest
 
 from sqlalchemy.sql import text
 
+from src.dialect_map_core.controllers import LatestMetricsListener
 from src.dialect_map_core.storage import BaseDatabase
 from src.dialect_map_core.storage import BaseDatabaseContext
 from src.dialect_map_core.storage import JSONFileLoader
@@ -40,9 +41,10 @@ def context(database: BaseDatabase):
     """
 
     context = SQLDatabaseContext(database)
+    listener = LatestMetricsListener()
 
     with context.tables():
-        _ = [database.load(mapping.file, mapping.model) for mapping in FILES_MAPPINGS]
+        _ = [database.load(m.file, m.model, listener=listener) for m in FILES_MAPPINGS]
         yield context
 
 
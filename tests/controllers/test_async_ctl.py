@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from src.dialect_map_core.controllers import AsyncCategoryController
+from src.dialect_map_core.controllers import AsyncJargonController
+from src.dialect_map_core.controllers import AsyncJargonPaperMetricsController
+from src.dialect_map_core.controllers import AsyncMembershipController
+from src.dialect_map_core.controllers import AsyncPaperController
+from src.dialect_map_core.controllers import AsyncReferenceController
+from src.dialect_map_core.models import Category
+from src.dialect_map_core.models import Paper
+from src.dialect_map_core.storage import AsyncSQLDatabase
+from src.dialect_map_core.storage import JSONFileLoader
+from src.dialect_map_data import FILES_MAPPINGS
+
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture(scope="module")
+def loop():
+    """
+    Creates an event loop shared by all the asynchronous tests
+    :return: event loop
+    """
+
+    loop = asyncio.new_event_loop()
+
+    try:
+        yield loop
+    finally:
+        loop.close()
+
+
+@pytest.fixture(scope="module")
+def database(loop: asyncio.AbstractEventLoop):
+    """
+    Creates a memory-based async database loaded with the testing data
+    :param loop: event loop to run the operations
+    :return: memory-based async database object
+    """
+
+    async def create() -> AsyncSQLDatabase:
+        db = AsyncSQLDatabase("sqlite+aiosqlite:///:memory:")
+        await db.setup(check=False)
+
+        loader = JSONFileLoader()
+
+        async with db.create_session() as session:
+            for mapping in FILES_MAPPINGS:
+                records = loader.load(mapping.file)
+                session.add_all(mapping.model(**record) for record in records)
+                await session.flush()
+
+            await AsyncJargonPaperMetricsController(session).refresh_latest()
+
+        return db
+
+    db = loop.run_until_complete(create())
+
+    try:
+        yield db
+    finally:
+        loop.run_until_complete(db.close_connection())
+
+
+@pytest.fixture(scope="function")
+def run(loop: asyncio.AbstractEventLoop, database: AsyncSQLDatabase):
+    """
+    Defines a helper to run a coroutine function within a fresh async session
+    :param loop: event loop to run the operations
+    :param database: async database to create the sessions from
+    :return: runner function
+    """
+
+    def runner(func):
+        async def wrapper():
+            async with database.create_session() as session:
+                return await func(session)
+
+        return loop.run_until_complete(wrapper())
+
+    return runner
+
+
+def test_async_get(run):
+    """
+    Tests the asynchronous retrieval of records by their ID
+    :param run: coroutine runner
+    """
+
+    async def func(session):
+        category = await AsyncCategoryController(session).get("category-01234")
+        paper = await AsyncPaperController(session).get("paper-01234", 1)
+        return category, paper
+
+    category, paper = run(func)
+
+    assert type(category) is Category
+    assert type(paper) is Paper
+
+
+def test_async_get_archived(run):
+    """
+    Tests the asynchronous retrieval of archived records
+    :param run: coroutine runner
+    """
+
+    async def func(session):
+        ctl = AsyncJargonController(session)
+        all_jargons = await ctl.get_all()
+        all_archived = await ctl.get_all(include_archived=True)
+        with pytest.raises(ValueError):
+            await ctl.get("jargon-archived")
+        return all_jargons, all_archived
+
+    all_jargons, all_archived = run(func)
+
+    assert len(all_jargons) == 2
+    assert len(all_archived) == 3
+
+
+def test_async_query_helpers(run):
+    """
+    Tests the asynchronous per-model query helpers
+    :param run: coroutine runner
+    """
+
+    async def func(session):
+        jargon = await AsyncJargonController(session).get_by_string("One string")
+        jargons = await AsyncJargonController(session).get_by_group("jargon-group-01234")
+        members = await AsyncMembershipController(session).get_by_paper("paper-01234", 1)
+        refs = await AsyncReferenceController(session).get_by_target_paper("paper-56789", 1)
+        latest = await AsyncJargonPaperMetricsController(session).get_latest_by_jargon(
+            "jargon-01234"
+        )
+        return jargon, jargons, members, refs, latest
+
+    jargon, jargons, members, refs, latest = run(func)
+
+    assert jargon.id == "jargon-01234"
+    assert len(jargons) == 2
+    assert len(members) == 2
+    assert len(refs) == 2
+    assert len(latest) == 2
+    assert all(m.arxiv_rev > 1 for m in latest)
+
+
+def test_async_create_archive_delete(run):
+    """
+    Tests the asynchronous creation, archival and deletion of records
+    :param run: coroutine runner
+    """
+
+    async def func(session):
+        ctl = AsyncCategoryController(session)
+        category = Category(
+            category_id="category-async",
+            description="My async category",
+            archived=False,
+            created_at=datetime.now(timezone.utc),
+        )
+
+        creation_id = await ctl.create(category)
+        archival_id = await ctl.archive(creation_id)
+        archived = await ctl.get(archival_id, include_archived=True)
+        deletion_id = await ctl.delete(archival_id)
+
+        with pytest.raises(ValueError):
+            await ctl.get(deletion_id, include_archived=True)
+
+        return archived
+
+    archived = run(func)
+
+    assert archived.archived is True
+    assert archived.archived_at is not None
+
+
+def test_async_delete_revisions(run):
+    """
+    Tests the asynchronous deletion of all the revisions of an evolving record
+    :param run: coroutine runner
+    """
+
+    async def func(session):
+        ctl = AsyncPaperController(session)
+        papers = [
+            Paper(
+                arxiv_id="paper-async",
+                arxiv_rev=rev,
+                title="Test Paper",
+                submission_date=datetime.today().date(),
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+            for rev in (1, 2)
+        ]
+
+        await ctl.create_all(papers)
+        await ctl.delete("paper-async")
+
+        for rev in (1, 2):
+            with pytest.raises(ValueError):
+                await ctl.get("paper-async", rev)
+
+    run(func)
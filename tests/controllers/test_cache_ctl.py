@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from src.dialect_map_core.controllers import JargonController
+from src.dialect_map_core.controllers import RecordsCache
+from src.dialect_map_core.models import Jargon
+from src.dialect_map_core.storage import BaseDatabase
+from src.dialect_map_core.storage import BaseDatabaseSession
+
+
+class CachedJargonController(JargonController):
+    """Jargon controller with its own records cache"""
+
+    cache = RecordsCache(max_size=8, ttl=60)
+
+
+def test_cache_eviction():
+    """Tests the eviction of the least recently used cache entries"""
+
+    cache = RecordsCache(max_size=2)
+    cache.set(("table", "a"), 1, version=0)
+    cache.set(("table", "b"), 2, version=0)
+    cache.get(("table", "a"))
+    cache.set(("table", "c"), 3, version=0)
+
+    assert len(cache) == 2
+    assert cache.get(("table", "a")) == (True, 1)
+    assert cache.get(("table", "b")) == (False, None)
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+
+def test_cache_expiration(monkeypatch: pytest.MonkeyPatch):
+    """
+    Tests the expiration of the cache entries after their time-to-live
+    :param monkeypatch: pytest attributes patcher
+    """
+
+    cache = RecordsCache(ttl=10)
+    cache.set(("table", "a"), 1, version=0)
+
+    now = time.monotonic()
+    monkeypatch.setattr("time.monotonic", lambda: now + 11)
+
+    assert cache.get(("table", "a")) == (False, None)
+    assert len(cache) == 0
+
+
+def test_cache_invalidation():
+    """Tests the invalidation of a cache namespace"""
+
+    cache = RecordsCache()
+    version = cache.version("table")
+
+    cache.set(("table", "a"), 1, version)
+    cache.set(("other", "a"), 1, version)
+    cache.invalidate("table")
+    cache.set(("table", "b"), 2, version)
+
+    assert cache.get(("table", "a")) == (False, None)
+    assert cache.get(("table", "b")) == (False, None)
+    assert cache.get(("other", "a")) == (True, 1)
+
+
+@pytest.mark.usefixtures("rollback")
+@pytest.mark.usefixtures("session")
+class TestCachedController:
+    """Class to group all the cached controller tests"""
+
+    @pytest.fixture(scope="class")
+    def controller(self, session: BaseDatabaseSession):
+        """
+        Creates a memory-based controller with a records cache
+        :param session: database session instance
+        :return: initiated controller instance
+        """
+
+        CachedJargonController.cache.clear()
+        return CachedJargonController(session)
+
+    def test_get_by_string(self, database: BaseDatabase, controller: JargonController):
+        """
+        Tests the retrieval of a cached jargon from a different session
+        :param database: dummy database instance
+        :param controller: initiated instance
+        """
+
+        cache = CachedJargonController.cache
+        cache.clear()
+
+        jargon_1 = controller.get_by_string("One string")
+
+        with database.create_session() as session:
+            jargon_2 = CachedJargonController(session).get_by_string("One string")
+
+            assert jargon_2 is not jargon_1
+            assert jargon_2 in session
+            assert jargon_2.id == jargon_1.id
+            assert jargon_2.jargon_term == jargon_1.jargon_term
+
+        assert cache.misses == 1
+        assert cache.hits == 1
+
+    def test_invalidation(self, controller: JargonController):
+        """
+        Tests the invalidation of the cached jargons after their archival
+        :param controller: initiated instance
+        """
+
+        cache = CachedJargonController.cache
+        jargon = Jargon(
+            jargon_id="jargon-cached",
+            jargon_term="Cached string",
+            jargon_regex="Cached regex",
+            archived=False,
+            created_at=datetime.now(timezone.utc),
+        )
+
+        cache.clear()
+
+        assert controller.get_by_string("Cached string") is None
+        assert controller.get_by_string("Cached string") is None
+        assert cache.hits == 0
+        assert len(cache) == 0
+
+        controller.create(jargon)
+        assert controller.get_by_string("Cached string").id == "jargon-cached"
+        assert controller.get("jargon-cached").id == "jargon-cached"
+
+        controller.archive("jargon-cached")
+        assert controller.get_by_string("Cached string") is None
+        assert controller.get("jargon-cached", include_archived=True).archived is True
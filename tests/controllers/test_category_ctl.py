@@ -89,3 +89,59 @@ class TestCategoryController:
 
         assert creation_id == deletion_id
         assert pytest.raises(ValueError, controller.get, category_id)
+
+    def test_delete_many(self, controller: CategoryController):
+        """
+        Tests the deletion of multiple categories by the controller
+        :param controller: initiated instance
+        """
+
+        category_ids = [f"category-deletion-{i}" for i in range(5)]
+        categories = [
+            Category(
+                category_id=category_id,
+                description="My test category",
+                archived=False,
+                created_at=datetime.now(timezone.utc),
+            )
+            for category_id in category_ids
+        ]
+
+        for category in categories:
+            controller.create(category)
+
+        deleted = controller.delete_many(category_ids + ["non-existing"], chunk_size=2)
+
+        assert deleted == len(category_ids)
+        assert all(pytest.raises(ValueError, controller.get, c) for c in category_ids)
+
+    def test_archive_many(self, controller: CategoryController):
+        """
+        Tests the archival of multiple categories by the controller
+        :param controller: initiated instance
+        """
+
+        category_ids = [f"category-archival-{i}" for i in range(5)]
+        categories = [
+            Category(
+                category_id=category_id,
+                description="My test category",
+                archived=False,
+                created_at=datetime.now(timezone.utc),
+            )
+            for category_id in category_ids
+        ]
+
+        for category in categories:
+            controller.create(category)
+
+        archived = controller.archive_many(category_ids, chunk_size=2)
+        rearchived = controller.archive_many(category_ids)
+
+        assert archived == len(category_ids)
+        assert rearchived == 0
+
+        for category_id in category_ids:
+            category = controller.get(category_id, include_archived=True)
+            assert category.archived is True
+            assert category.archived_at is not None
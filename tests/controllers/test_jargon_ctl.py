@@ -40,6 +40,24 @@ class TestJargonController:
         assert type(jargon_obj) is Jargon
         assert jargon_obj.id == jargon_id
 
+    def test_get_many(self, controller: JargonController):
+        """
+        Tests the retrieval of multiple jargons by the controller
+        :param controller: initiated instance
+        """
+
+        jargon_ids = ["jargon-56789", "jargon-archived", "jargon-01234"]
+        jargon_obj = controller.get("jargon-56789")
+
+        records, missing = controller.get_many(jargon_ids)
+        all_records, all_missing = controller.get_many(jargon_ids, include_archived=True)
+
+        assert records[0] is jargon_obj
+        assert [r.id for r in records] == ["jargon-56789", "jargon-01234"]
+        assert [r.id for r in all_records] == jargon_ids
+        assert missing == ["jargon-archived"]
+        assert all_missing == []
+
     def test_get_archived(self, controller: JargonController):
         """
         Tests the raised error when retrieving an archived jargon
@@ -48,6 +66,58 @@ class TestJargonController:
 
         assert pytest.raises(ValueError, controller.get, "jargon-archived")
 
+    def test_get_all_pages(self, controller: JargonController):
+        """
+        Tests the paginated retrieval of all jargons by the controller
+        :param controller: initiated instance
+        """
+
+        page_1 = controller.get_all(include_archived=True, limit=2)
+        page_2 = controller.get_all(include_archived=True, after=page_1[-1].id, limit=2)
+
+        assert [j.id for j in page_1] == ["jargon-01234", "jargon-56789"]
+        assert [j.id for j in page_2] == ["jargon-archived"]
+
+    def test_iter_all(self, controller: JargonController):
+        """
+        Tests the streamed retrieval of all jargons by the controller
+        :param controller: initiated instance
+        """
+
+        all_jargons = controller.iter_all(batch_size=1)
+        all_archived = controller.iter_all(include_archived=True, batch_size=1)
+
+        assert [j.id for j in all_jargons] == ["jargon-01234", "jargon-56789"]
+        assert len(list(all_archived)) == 3
+
+    def test_get_version(self, controller: JargonController):
+        """
+        Tests the changes of the jargons table version
+        :param controller: initiated instance
+        """
+
+        jargon = Jargon(
+            jargon_id="jargon-version",
+            jargon_term="Version string",
+            jargon_regex="Version regex",
+            archived=False,
+            created_at=datetime.now(timezone.utc),
+        )
+
+        version_1 = controller.get_version()
+        controller.create(jargon)
+        version_2 = controller.get_version()
+        jargon.jargon_regex = "Other regex"
+        controller.session.commit()
+        version_3 = controller.get_version()
+        controller.delete("jargon-version")
+        version_4 = controller.get_version()
+
+        assert version_2[0] == version_1[0] + 1
+        assert version_3 != version_2
+        assert version_4[0] == version_1[0]
+        assert version_4 != version_3
+
     def test_get_by_string(self, controller: JargonController):
         """
         Tests the retrieval of a jargon by the controller
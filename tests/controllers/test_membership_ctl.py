@@ -38,6 +38,18 @@ class TestMembershipController:
         assert type(membership_obj) is CategoryMembership
         assert membership_obj.id == membership_id
 
+    def test_get_many(self, controller: MembershipController):
+        """
+        Tests the retrieval of multiple category memberships by the controller
+        :param controller: initiated instance
+        """
+
+        membership_ids = ["membership-56789", "membership-unknown", "membership-01234"]
+        records, missing = controller.get_many(membership_ids, chunk_size=1)
+
+        assert [r.id for r in records] == ["membership-56789", "membership-01234"]
+        assert missing == ["membership-unknown"]
+
     def test_get_by_paper(self, controller: MembershipController):
         """
         Tests the retrieval of a category membership by the controller
@@ -70,6 +82,34 @@ class TestMembershipController:
         assert creation_id == membership_id
         assert created_obj == membership
 
+    def test_delete_many(self, controller: MembershipController):
+        """
+        Tests the deletion of multiple category memberships by the controller
+        :param controller: initiated instance
+        """
+
+        membership_ids = ["membership-deletion-A", "membership-deletion-B"]
+        memberships = [
+            CategoryMembership(
+                membership_id=membership_id,
+                arxiv_id="paper-56789",
+                arxiv_rev=2,
+                category_id=category_id,
+                created_at=datetime.now(timezone.utc),
+            )
+            for membership_id, category_id in zip(
+                membership_ids,
+                ["category-01234", "category-56789"],
+            )
+        ]
+
+        controller.create_all(memberships)
+        deleted = controller.delete_many(membership_ids)
+
+        assert deleted == len(membership_ids)
+        assert all(m not in controller.session for m in memberships)
+        assert all(pytest.raises(ValueError, controller.get, m) for m in membership_ids)
+
     def test_create_with_non_existent_paper(
         self,
         database: BaseDatabase,
@@ -7,10 +7,42 @@ import pytest
 
 from src.dialect_map_core.controllers import JargonCategoryMetricsController
 from src.dialect_map_core.controllers import JargonPaperMetricsController
+from src.dialect_map_core.controllers import LatestMetricsListener
 from src.dialect_map_core.models import JargonCategoryMetrics
 from src.dialect_map_core.models import JargonPaperMetrics
+from src.dialect_map_core.models import Paper
 from src.dialect_map_core.storage import BaseDatabase
 from src.dialect_map_core.storage import BaseDatabaseSession
+from src.dialect_map_core.storage import SQLDatabase
+from src.dialect_map_data import FILES_MAPPINGS
+
+
+@pytest.mark.parametrize("method", ["orm", "bulk"])
+def test_latest_listener(method: str):
+    """
+    Tests the flagging of the latest paper metrics when loading them
+    :param method: insertion method
+    """
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+
+    listener = LatestMetricsListener()
+
+    for mapping in FILES_MAPPINGS:
+        db.load(mapping.file, mapping.model, batch_size=1, method=method, listener=listener)
+
+    with db.create_session() as session:
+        controller = JargonPaperMetricsController(session)
+        metrics = controller.get_by_jargon("jargon-01234")
+        latest = controller.get_latest_by_jargon("jargon-01234")
+
+    assert listener.pending == {}
+    assert len(metrics) == 4
+    assert sorted(m.id for m in latest) == [
+        "jargon-paper-metric-00002",
+        "jargon-paper-metric-00004",
+    ]
 
 
 @pytest.mark.usefixtures("rollback")
@@ -41,6 +73,34 @@ class TestCategoryMetricsController:
         assert type(one_metric) is JargonCategoryMetrics
         assert one_metric.id == "jargon-cat-metric-01234"
 
+    def test_get_by_jargons(self, controller: JargonCategoryMetricsController):
+        """
+        Tests the retrieval of multiple jargons category metrics by the controller
+        :param controller: initiated instance
+        """
+
+        jargon_ids = ["jargon-01234", "jargon-56789"]
+        all_metrics = controller.get_by_jargons(jargon_ids)
+        agg_metrics = controller.get_by_jargons(jargon_ids, aggregate=True)
+
+        assert list(all_metrics.keys()) == jargon_ids
+        assert [m.id for m in all_metrics["jargon-01234"]] == ["jargon-cat-metric-01234"]
+        assert all_metrics["jargon-56789"] == []
+        assert agg_metrics["jargon-01234"] == [("jargon-01234", "category-01234", 20, 0.001)]
+
+    def test_aggregate(self, controller: JargonCategoryMetricsController):
+        """
+        Tests the aggregation of the category jargon metrics by the controller
+        :param controller: initiated instance
+        """
+
+        metrics = controller.aggregate(["group", "category"])
+        group_metrics = controller.aggregate("group")
+
+        assert metrics == [("jargon-group-01234", "category-01234", 20, 0.001)]
+        assert group_metrics == [("jargon-group-01234", 20, 0.001)]
+        assert pytest.raises(ValueError, controller.aggregate, "paper")
+
     def test_create_with_non_existent_jargon(
         self,
         database: BaseDatabase,
@@ -126,6 +186,151 @@ class TestPaperMetricsController:
         assert len(all_metrics) > 0
         assert all(m.arxiv_rev > 1 for m in all_metrics)
 
+    def test_get_by_jargons(self, controller: JargonPaperMetricsController):
+        """
+        Tests the retrieval of multiple jargons paper metrics by the controller
+        :param controller: initiated instance
+        """
+
+        jargon_ids = ["jargon-01234", "jargon-56789"]
+        all_metrics = controller.get_by_jargons(jargon_ids)
+        latest_metrics = controller.get_by_jargons(jargon_ids, latest=True)
+
+        assert len(all_metrics["jargon-01234"]) == 4
+        assert len(latest_metrics["jargon-01234"]) == 2
+        assert all_metrics["jargon-56789"] == []
+
+    def test_get_by_jargons_aggregated(self, controller: JargonPaperMetricsController):
+        """
+        Tests the retrieval of multiple jargons paper metrics aggregated by category
+        :param controller: initiated instance
+        """
+
+        jargon_ids = ["jargon-01234"]
+        all_metrics = controller.get_by_jargons(jargon_ids, aggregate=True)
+        latest_metrics = controller.get_by_jargons(jargon_ids, latest=True, aggregate=True)
+
+        assert all_metrics["jargon-01234"] == [
+            ("jargon-01234", "category-01234", 10, 0.05),
+            ("jargon-01234", "category-56789", 10, 0.05),
+        ]
+        assert latest_metrics["jargon-01234"] == []
+
+    def test_aggregate(self, controller: JargonPaperMetricsController):
+        """
+        Tests the aggregation of the paper jargon metrics by the controller
+        :param controller: initiated instance
+        """
+
+        jargon_metrics = controller.aggregate("jargon")
+        paper_metrics = controller.aggregate("paper", latest=True)
+        month_metrics = controller.aggregate(["group", "month"], jargon_ids=["jargon-01234"])
+        single_metrics = controller.aggregate("month", jargon_ids=["jargon-01234"])
+
+        # Weighted relative frequency: 32 / (10 / 0.05 + 12 / 0.08 + 4 / 0.01 + 6 / 0.02)
+        assert jargon_metrics == [("jargon-01234", 32, pytest.approx(32 / 1050))]
+        assert paper_metrics == [("paper-01234", 2, 12, 0.08), ("paper-56789", 2, 6, 0.02)]
+        assert month_metrics == [("jargon-group-01234", 2020, 11, 32, pytest.approx(32 / 1050))]
+        assert single_metrics == [(2020, 11, 32, pytest.approx(32 / 1050))]
+
+    def test_latest_maintenance(
+        self,
+        session: BaseDatabaseSession,
+        controller: JargonPaperMetricsController,
+    ):
+        """
+        Tests the maintenance of the latest jargon paper metrics flags
+        when creating and deleting metrics through the controller
+        :param session: database session instance
+        :param controller: initiated instance
+        """
+
+        paper = Paper(
+            arxiv_id="paper-01234",
+            arxiv_rev=3,
+            title="Test Paper",
+            submission_date=datetime.today().date(),
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        paper_metrics = JargonPaperMetrics(
+            metric_id="jargon-paper-metric-latest",
+            jargon_id="jargon-01234",
+            arxiv_id="paper-01234",
+            arxiv_rev=3,
+            abs_freq=10,
+            rel_freq=0.05,
+            created_at=datetime.now(timezone.utc),
+        )
+
+        session.add(paper)
+        session.commit()
+
+        controller.create(paper_metrics)
+        created_revs = {
+            (m.arxiv_id, m.arxiv_rev) for m in controller.get_latest_by_jargon("jargon-01234")
+        }
+
+        controller.delete("jargon-paper-metric-latest")
+        deleted_revs = {
+            (m.arxiv_id, m.arxiv_rev) for m in controller.get_latest_by_jargon("jargon-01234")
+        }
+
+        assert created_revs == {("paper-01234", 3), ("paper-56789", 2)}
+        assert deleted_revs == {("paper-01234", 2), ("paper-56789", 2)}
+        assert controller.refresh_latest() == 0
+
+    def test_latest_maintenance_many(
+        self,
+        session: BaseDatabaseSession,
+        controller: JargonPaperMetricsController,
+    ):
+        """
+        Tests the maintenance of the latest jargon paper metrics flags
+        when bulk-deleting the metrics of the latest revision
+        :param session: database session instance
+        :param controller: initiated instance
+        """
+
+        paper = Paper(
+            arxiv_id="paper-56789",
+            arxiv_rev=3,
+            title="Test Paper",
+            submission_date=datetime.today().date(),
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        paper_metrics = JargonPaperMetrics(
+            metric_id="jargon-paper-metric-many",
+            jargon_id="jargon-01234",
+            arxiv_id="paper-56789",
+            arxiv_rev=3,
+            abs_freq=10,
+            rel_freq=0.05,
+            created_at=datetime.now(timezone.utc),
+        )
+
+        session.add(paper)
+        session.commit()
+
+        controller.create(paper_metrics)
+        created_revs = {
+            (m.arxiv_id, m.arxiv_rev) for m in controller.get_latest_by_jargon("jargon-01234")
+        }
+
+        assert controller.delete_many(["jargon-paper-metric-many", "non-existing-metric"]) == 1
+        deleted_revs = {
+            (m.arxiv_id, m.arxiv_rev) for m in controller.get_latest_by_jargon("jargon-01234")
+        }
+
+        session.delete(paper)
+        session.commit()
+
+        assert ("paper-56789", 3) in created_revs
+        assert ("paper-56789", 2) in deleted_revs
+        assert ("paper-56789", 3) not in deleted_revs
+        assert controller.refresh_latest() == 0
+
     def test_create_with_non_existent_jargon(
         self,
         database: BaseDatabase,
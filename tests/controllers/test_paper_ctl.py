@@ -5,11 +5,15 @@ from datetime import timezone
 
 import pytest
 
+from src.dialect_map_core.controllers import JargonPaperMetricsController
 from src.dialect_map_core.controllers import PaperController
 from src.dialect_map_core.controllers import PaperAuthorController
 from src.dialect_map_core.controllers import PaperReferenceCountersController
+from src.dialect_map_core.controllers import ReferenceController
+from src.dialect_map_core.models import JargonPaperMetrics
 from src.dialect_map_core.models import Paper
 from src.dialect_map_core.models import PaperAuthor
+from src.dialect_map_core.models import PaperReference
 from src.dialect_map_core.models import PaperReferenceCounters
 from src.dialect_map_core.storage import BaseDatabase
 from src.dialect_map_core.storage import BaseDatabaseSession
@@ -42,6 +46,18 @@ class TestPaperController:
         assert type(paper_obj) is Paper
         assert paper_obj.id == paper_id
 
+    def test_get_many(self, controller: PaperController):
+        """
+        Tests the retrieval of multiple paper revisions by the controller
+        :param controller: initiated instance
+        """
+
+        paper_keys = [("paper-56789", 2), ("paper-01234", 3), ("paper-01234", 1)]
+        records, missing = controller.get_many(paper_keys)
+
+        assert [(r.id, r.arxiv_rev) for r in records] == [paper_keys[0], paper_keys[2]]
+        assert missing == [("paper-01234", 3)]
+
     def test_create(self, controller: PaperController):
         """
         Tests the creation of a paper by the controller
@@ -88,6 +104,33 @@ class TestPaperController:
         assert creation_id == deletion_id
         assert pytest.raises(ValueError, controller.get, paper_id, paper_rev)
 
+    def test_delete_revisions(self, controller: PaperController):
+        """
+        Tests the deletion of every paper revision by the controller,
+        including those after a gap in the revision numbers
+        :param controller: initiated instance
+        """
+
+        paper_id = "paper-deletion-revs"
+        paper_revs = [1, 2, 4]
+
+        for paper_rev in paper_revs:
+            paper = Paper(
+                arxiv_id=paper_id,
+                arxiv_rev=paper_rev,
+                title="Test Paper",
+                submission_date=datetime.today().date(),
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+            controller.create(paper)
+
+        deleted_revs = controller.delete_revisions(paper_id)
+
+        assert deleted_revs == paper_revs
+        assert all(pytest.raises(ValueError, controller.get, paper_id, r) for r in paper_revs)
+        assert controller.delete_revisions(paper_id) == []
+
     def test_delete_rev(self, controller: PaperController):
         """
         Tests the deletion of a paper revision by the controller
@@ -112,6 +155,48 @@ class TestPaperController:
         assert deletion_rev == paper_rev
         assert pytest.raises(ValueError, controller.get, paper_id, paper_rev)
 
+    def test_delete_rev_metrics(self, controller: PaperController):
+        """
+        Tests the refresh of the latest paper metrics when deleting a paper revision
+        :param controller: initiated instance
+        """
+
+        paper_id = "paper-deletion-metrics"
+        papers = [
+            Paper(
+                arxiv_id=paper_id,
+                arxiv_rev=rev,
+                title="Test Paper",
+                submission_date=datetime.today().date(),
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+            for rev in (1, 2)
+        ]
+        metrics = [
+            JargonPaperMetrics(
+                jargon_id="jargon-01234",
+                arxiv_id=paper_id,
+                arxiv_rev=rev,
+                abs_freq=1,
+                rel_freq=0.01,
+                created_at=datetime.now(timezone.utc),
+            )
+            for rev in (1, 2)
+        ]
+
+        metrics_ctl = JargonPaperMetricsController(controller.session)
+
+        _ = [controller.create(paper) for paper in papers]
+        metrics_ctl.create_all(metrics)
+        controller.delete_rev(paper_id, 2)
+
+        remaining = metrics_ctl.get_by_jargon("jargon-01234", paper_id)
+
+        assert len(remaining) == 1
+        assert remaining[0].arxiv_rev == 1
+        assert remaining[0].is_latest is True
+
 
 @pytest.mark.usefixtures("rollback")
 @pytest.mark.usefixtures("session")
@@ -212,3 +297,100 @@ class TestPaperRefCounterController:
         )
 
         assert pytest.raises(database.error, controller.create, counter)
+
+    def test_get_current(self, controller: PaperReferenceCountersController):
+        """
+        Tests the retrieval of the most recent paper ref. counter
+        :param controller: initiated instance
+        """
+
+        counter = controller.get_current("paper-01234", 2)
+
+        assert type(counter) is PaperReferenceCounters
+        assert counter.id == "paper-ref-counter-01234-B"
+        assert controller.get_current("paper-01234", 3) is None
+
+    def test_increment(self, controller: PaperReferenceCountersController):
+        """
+        Tests the incremental update of the paper ref. counters
+        :param controller: initiated instance
+        """
+
+        keys = [("paper-01234", 1), ("paper-01234", 2), ("paper-56789", 2)]
+        deltas = dict(zip(keys, [2, 0, -1]))
+
+        previous = [controller.get_current(*key) for key in keys]
+        previous = [(c.arxiv_ref_count, c.total_ref_count) for c in previous]
+
+        num_counters = controller.increment(deltas, chunk_size=2)
+
+        current = [controller.get_current(*key) for key in keys]
+        current = [(c.arxiv_ref_count, c.total_ref_count) for c in current]
+
+        assert num_counters == 2
+        assert current[0] == (previous[0][0] + 2, previous[0][1] + 2)
+        assert current[1] == previous[1]
+        assert current[2] == (previous[2][0] - 1, previous[2][1] - 1)
+
+    def test_reconcile(self, controller: PaperReferenceCountersController):
+        """
+        Tests the reconciliation leaves the loaded paper ref. counters untouched
+        :param controller: initiated instance
+        """
+
+        previous = controller.get_current("paper-56789", 1)
+        previous = (previous.arxiv_ref_count, previous.total_ref_count)
+
+        assert controller.reconcile() == 0
+
+        counter = controller.get_current("paper-56789", 1)
+
+        assert (counter.arxiv_ref_count, counter.total_ref_count) == previous
+
+    def test_reconcile_missing(self, controller: PaperReferenceCountersController):
+        """
+        Tests the reconciliation of the papers with references but without counters,
+        and the correction of their derived counters afterwards
+        :param controller: initiated instance
+        """
+
+        paper = Paper(
+            arxiv_id="paper-uncounted",
+            arxiv_rev=1,
+            title="Test Paper",
+            submission_date=datetime.today().date(),
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        ref = PaperReference(
+            source_arxiv_id="paper-01234",
+            source_arxiv_rev=2,
+            target_arxiv_id="paper-uncounted",
+            target_arxiv_rev=1,
+            created_at=datetime.now(timezone.utc),
+        )
+
+        PaperController(controller.session).create(paper)
+        ReferenceController(controller.session).create(ref)
+
+        assert controller.get_current("paper-uncounted", 1) is None
+        assert controller.reconcile() == 1
+
+        counter = controller.get_current("paper-uncounted", 1)
+
+        assert counter.arxiv_ref_count == 1
+        assert counter.total_ref_count == 1
+        assert counter.derived is True
+
+        counter.arxiv_ref_count = 5
+        counter.total_ref_count = 7
+        controller.session.commit()
+
+        assert controller.reconcile() == 1
+
+        controller.session.refresh(counter)
+
+        assert counter.arxiv_ref_count == 1
+        assert counter.total_ref_count == 3
+
+        PaperController(controller.session).delete("paper-uncounted")
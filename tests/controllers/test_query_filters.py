@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+from typing import List
+from typing import Set
+
+import pytest
+
+from sqlalchemy import Column
+from sqlalchemy import Table
+from sqlalchemy import event
+from sqlalchemy.sql import visitors
+
+from src.dialect_map_core.controllers import JargonCategoryMetricsController
+from src.dialect_map_core.controllers import JargonController
+from src.dialect_map_core.controllers import JargonPaperMetricsController
+from src.dialect_map_core.controllers import MembershipController
+from src.dialect_map_core.controllers import PaperAuthorController
+from src.dialect_map_core.controllers import PaperReferenceCountersController
+from src.dialect_map_core.controllers import ReferenceController
+from src.dialect_map_core.storage import BaseDatabaseSession
+
+
+# Column filtered by every archival controller query, besides the declared ones
+ARCHIVAL_COLUMN = "archived"
+
+# Controller queries and the arguments to run them with
+QUERIES = [
+    (JargonController, "get_by_string", ("One string",)),
+    (JargonController, "get_by_group", ("jargon-group-01234",)),
+    (MembershipController, "get_by_paper", ("paper-01234", 1)),
+    (JargonCategoryMetricsController, "get_by_jargon", ("jargon-01234", "category-01234")),
+    (JargonCategoryMetricsController, "get_by_jargons", (["jargon-01234"], True)),
+    (JargonCategoryMetricsController, "aggregate", (("group", "category"), ["jargon-01234"])),
+    (JargonPaperMetricsController, "get_by_jargon", ("jargon-01234", "paper-01234", 1)),
+    (JargonPaperMetricsController, "get_latest_by_jargon", ("jargon-01234",)),
+    (JargonPaperMetricsController, "get_by_jargons", (["jargon-01234"], True, True)),
+    (JargonPaperMetricsController, "aggregate", (("category",), ["jargon-01234"], True)),
+    (PaperAuthorController, "get_by_paper", ("paper-01234", 1)),
+    (PaperReferenceCountersController, "get_by_paper", ("paper-01234", 1)),
+    (PaperReferenceCountersController, "get_current", ("paper-01234", 1)),
+    (ReferenceController, "get_by_source_paper", ("paper-01234", 1)),
+    (ReferenceController, "get_by_target_paper", ("paper-56789", 1)),
+    (ReferenceController, "count_citations", ([("paper-56789", 1)],)),
+]
+
+
+def get_filtered_columns(statement, table: Table) -> Set[str]:
+    """
+    Gets the names of the table columns used within the WHERE clause of a statement
+    :param statement: SQL statement to inspect
+    :param table: table whose columns are considered
+    :return: set of column names
+    """
+
+    if statement.whereclause is None:
+        return set()
+
+    return {
+        elem.name
+        for elem in visitors.iterate(statement.whereclause)
+        if isinstance(elem, Column) and elem.table is table
+    }
+
+
+@pytest.mark.usefixtures("rollback")
+@pytest.mark.parametrize("controller_cls, method, args", QUERIES)
+def test_query_filters(session: BaseDatabaseSession, controller_cls, method: str, args: tuple):
+    """
+    Tests that the columns filtered by the controller queries are declared
+    :param session: database session instance
+    :param controller_cls: controller class to test
+    :param method: name of the controller query method
+    :param args: arguments to run the query method with
+    """
+
+    table = controller_cls.model.__table__
+    statements: List = []
+
+    def collect(state):
+        if state.is_select:
+            statements.append(state.statement)
+
+    event.listen(session, "do_orm_execute", collect)
+
+    try:
+        getattr(controller_cls(session), method)(*args)
+    finally:
+        event.remove(session, "do_orm_execute", collect)
+
+    declared = [set(columns) for columns in controller_cls.query_filters]
+    declared.append({column.name for column in table.primary_key.columns})
+
+    filters = [get_filtered_columns(statement, table) for statement in statements]
+    filters = [columns - {ARCHIVAL_COLUMN} for columns in filters if columns]
+
+    assert len(filters) > 0
+    assert all(any(f <= columns for columns in declared) for f in filters)
+
+
+def test_query_filters_coverage():
+    """Tests that every controller declaring query filters has its queries tested"""
+
+    from src.dialect_map_core.cli import iter_controllers
+
+    tested = {controller_cls for controller_cls, _, _ in QUERIES}
+    declared = {c for c in iter_controllers() if "query_filters" in c.__dict__}
+
+    assert declared <= tested
@@ -5,10 +5,53 @@ from datetime import timezone
 
 import pytest
 
+from src.dialect_map_core.controllers import PaperReferenceCountersController
 from src.dialect_map_core.controllers import ReferenceController
+from src.dialect_map_core.controllers import ReferenceCountersListener
 from src.dialect_map_core.models import PaperReference
 from src.dialect_map_core.storage import BaseDatabase
 from src.dialect_map_core.storage import BaseDatabaseSession
+from src.dialect_map_core.storage import SQLDatabase
+from src.dialect_map_data import FILES_MAPPINGS
+
+
+class CountedReferenceController(ReferenceController):
+    """Reference controller maintaining the target papers reference counters"""
+
+    maintain_counters = True
+
+
+@pytest.mark.parametrize("method", ["orm", "bulk"])
+@pytest.mark.parametrize("counters_first", [False, True])
+def test_counters_listener(method: str, counters_first: bool):
+    """
+    Tests the update of the target paper counters when loading references
+    :param method: insertion method
+    :param counters_first: whether to load the counters before the references
+    """
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+
+    listener = ReferenceCountersListener()
+    mappings = list(FILES_MAPPINGS)
+
+    # The references and counters files are the last two mappings
+    if counters_first:
+        mappings[-2:] = reversed(mappings[-2:])
+
+    for mapping in mappings:
+        db.load(mapping.file, mapping.model, batch_size=1, method=method, listener=listener)
+
+    with db.create_session() as session:
+        counters = PaperReferenceCountersController(session)
+        counter = counters.get_current("paper-56789", 1)
+
+    assert listener.pending == {}
+    assert listener.deferred == {}
+    assert counter.id == "paper-ref-counter-56789-A"
+    assert counter.arxiv_ref_count == 10 + 2
+    assert counter.total_ref_count == 12 + 2
 
 
 @pytest.mark.usefixtures("rollback")
@@ -159,3 +202,232 @@ class TestPaperReferenceController:
 
         assert creation_id == deletion_id
         assert pytest.raises(ValueError, controller.get, ref_id)
+
+
+@pytest.mark.usefixtures("rollback")
+@pytest.mark.usefixtures("session")
+class TestPaperReferenceGraph:
+    """Class to group all the PaperReference graph traversal tests"""
+
+    @pytest.fixture(scope="class")
+    def controller(self, session: BaseDatabaseSession):
+        """
+        Creates a memory-based controller with a chain of paper references:
+        (paper-01234, 1) -> (paper-56789, 1) -> (paper-56789, 2) -> (paper-01234, 1)
+        :param session: database session instance
+        :return: initiated controller instance
+        """
+
+        controller = ReferenceController(session)
+        controller.create_all(
+            [
+                PaperReference(
+                    source_arxiv_id="paper-56789",
+                    source_arxiv_rev=1,
+                    target_arxiv_id="paper-56789",
+                    target_arxiv_rev=2,
+                    created_at=datetime.now(timezone.utc),
+                ),
+                PaperReference(
+                    source_arxiv_id="paper-56789",
+                    source_arxiv_rev=2,
+                    target_arxiv_id="paper-01234",
+                    target_arxiv_rev=1,
+                    created_at=datetime.now(timezone.utc),
+                ),
+            ]
+        )
+
+        return controller
+
+    def test_get_neighbourhood(self, controller: ReferenceController):
+        """
+        Tests the retrieval of the papers within a number of reference hops
+        :param controller: initiated instance
+        """
+
+        one_hop = controller.get_neighbourhood("paper-01234", 1, depth=1)
+        all_hops = controller.get_neighbourhood("paper-01234", 1, depth=5)
+        citing = controller.get_neighbourhood("paper-56789", 1, depth=2, direction="citations")
+
+        assert one_hop == {("paper-56789", 1): 1}
+        assert all_hops == {("paper-56789", 1): 1, ("paper-56789", 2): 2}
+        assert citing == {
+            ("paper-01234", 1): 1,
+            ("paper-01234", 2): 1,
+            ("paper-56789", 2): 2,
+        }
+
+        assert pytest.raises(ValueError, controller.get_neighbourhood, "paper-01234", 1, 1, "other")
+
+    def test_get_shortest_path(self, controller: ReferenceController):
+        """
+        Tests the retrieval of the shortest chain of references between two papers
+        :param controller: initiated instance
+        """
+
+        path = controller.get_shortest_path(("paper-01234", 2), ("paper-01234", 1))
+
+        assert path == [
+            ("paper-01234", 2),
+            ("paper-56789", 1),
+            ("paper-56789", 2),
+            ("paper-01234", 1),
+        ]
+        assert controller.get_shortest_path(("paper-01234", 2), ("paper-01234", 1), 2) is None
+        assert controller.get_shortest_path(("paper-01234", 1), ("paper-01234", 2)) is None
+
+    def test_count_citations(self, controller: ReferenceController):
+        """
+        Tests the count of citations of multiple papers
+        :param controller: initiated instance
+        """
+
+        keys = [("paper-01234", 1), ("paper-01234", 2), ("paper-56789", 1)]
+        counts = controller.count_citations(keys, chunk_size=2)
+
+        assert counts == {
+            ("paper-01234", 1): 1,
+            ("paper-01234", 2): 0,
+            ("paper-56789", 1): 2,
+        }
+
+    def test_snapshot(self, controller: ReferenceController):
+        """
+        Tests the in-memory snapshot traversals against the database ones
+        :param controller: initiated instance
+        """
+
+        graph = controller.snapshot(batch_size=2)
+        source = ("paper-01234", 2)
+        target = ("paper-01234", 1)
+
+        assert len(graph) == 4
+        assert graph.get_neighbours(("paper-56789", 2)) == [target]
+        assert graph.count_citations(("paper-56789", 1)) == 2
+
+        for key in graph.nodes:
+            for direction in ("references", "citations"):
+                db_hops = controller.get_neighbourhood(*key, depth=3, direction=direction)
+                assert graph.get_neighbourhood(key, 3, direction) == db_hops
+
+        assert graph.get_shortest_path(source, target) == controller.get_shortest_path(
+            source, target
+        )
+        assert graph.get_shortest_path(source, target, max_depth=2) is None
+        assert graph.get_shortest_path(source, target, max_depth=None) is not None
+
+
+@pytest.mark.usefixtures("rollback")
+@pytest.mark.usefixtures("session")
+class TestPaperReferenceCounters:
+    """Class to group all the PaperReference counters maintenance tests"""
+
+    @pytest.fixture(scope="class")
+    def controller(self, session: BaseDatabaseSession):
+        """
+        Creates a memory-based controller maintaining the reference counters
+        :param session: database session instance
+        :return: initiated controller instance
+        """
+
+        return CountedReferenceController(session)
+
+    @pytest.fixture(scope="class")
+    def counters(self, session: BaseDatabaseSession):
+        """
+        Creates a memory-based controller for the PaperReferenceCounter records
+        :param session: database session instance
+        :return: initiated controller instance
+        """
+
+        return PaperReferenceCountersController(session)
+
+    def test_create(
+        self,
+        controller: ReferenceController,
+        counters: PaperReferenceCountersController,
+    ):
+        """
+        Tests the update of the target paper counters when creating references
+        :param controller: initiated instance
+        :param counters: initiated counters controller
+        """
+
+        refs = [
+            PaperReference(
+                reference_id=f"reference-counted-{rev}",
+                source_arxiv_id="paper-01234",
+                source_arxiv_rev=rev,
+                target_arxiv_id="paper-56789",
+                target_arxiv_rev=2,
+                created_at=datetime.now(timezone.utc),
+            )
+            for rev in (1, 2)
+        ]
+
+        count = counters.get_current("paper-56789", 2).arxiv_ref_count
+
+        controller.create(refs[0])
+        assert counters.get_current("paper-56789", 2).arxiv_ref_count == count + 1
+
+        controller.create_all(refs[1:])
+        assert counters.get_current("paper-56789", 2).arxiv_ref_count == count + 2
+
+        controller.delete_many([ref.id for ref in refs])
+        assert counters.get_current("paper-56789", 2).arxiv_ref_count == count
+
+    def test_create_rollback(
+        self,
+        database: BaseDatabase,
+        controller: ReferenceController,
+        counters: PaperReferenceCountersController,
+    ):
+        """
+        Tests the rollback of the counters update when a reference cannot be created
+        :param database: dummy database instance
+        :param controller: initiated instance
+        :param counters: initiated counters controller
+        """
+
+        ref = PaperReference(
+            reference_id="reference-01234",
+            source_arxiv_id="paper-56789",
+            source_arxiv_rev=2,
+            target_arxiv_id="paper-01234",
+            target_arxiv_rev=1,
+            created_at=datetime.now(timezone.utc),
+        )
+
+        count = counters.get_current("paper-01234", 1).arxiv_ref_count
+
+        assert pytest.raises(database.error, controller.create, ref)
+        assert counters.get_current("paper-01234", 1).arxiv_ref_count == count
+
+    def test_delete(
+        self,
+        controller: ReferenceController,
+        counters: PaperReferenceCountersController,
+    ):
+        """
+        Tests the update of the target paper counters when deleting a reference
+        :param controller: initiated instance
+        :param counters: initiated counters controller
+        """
+
+        ref = PaperReference(
+            reference_id="reference-counted-deletion",
+            source_arxiv_id="paper-56789",
+            source_arxiv_rev=2,
+            target_arxiv_id="paper-01234",
+            target_arxiv_rev=2,
+            created_at=datetime.now(timezone.utc),
+        )
+
+        count = counters.get_current("paper-01234", 2).arxiv_ref_count
+
+        controller.create(ref)
+        assert counters.get_current("paper-01234", 2).arxiv_ref_count == count + 1
+
+        controller.delete(ref.id)
+        assert counters.get_current("paper-01234", 2).arxiv_ref_count == count
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from datetime import date
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from sqlalchemy import create_engine
+from sqlalchemy import literal
+from sqlalchemy import select
+
+from src.dialect_map_core.encoding import CustomJSONEncoder
+from src.dialect_map_core.encoding import FastJSONEncoder
+from src.dialect_map_core.models import JargonPaperMetrics
+
+
+@pytest.fixture(scope="module")
+def objects() -> list:
+    """
+    Defines a set of Python objects covering the encoded data types
+    :return: list of objects
+    """
+
+    return [
+        None,
+        True,
+        100,
+        0.25,
+        "example",
+        "ñandú",
+        date(1990, 1, 1),
+        datetime(1990, 1, 1, 10, 30, 15),
+        datetime(1990, 1, 1, 10, 30, 15, 123456),
+        datetime(1990, 1, 1, 10, 30, 15, 123456, tzinfo=timezone.utc),
+        [1, "a", date(2020, 11, 20)],
+        {"a": {"b": [datetime(2020, 11, 20, 14, 0, 0)]}, 1: "c"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "time_resolution, time_separation",
+    [
+        (None, None),
+        ("seconds", "T"),
+        ("auto", "T"),
+        ("milliseconds", "T"),
+        ("microseconds", " "),
+    ],
+)
+def test_fast_encoding_parity(objects: list, time_resolution: str, time_separation: str):
+    """
+    Checks the identical output of the fast and the custom JSON encoders
+    :param objects: list of Python objects
+    :param time_resolution: resolution for the time objects
+    :param time_separation: separator character for the time objects
+    """
+
+    kwargs = {"time_resolution": time_resolution, "time_separation": time_separation}
+
+    custom = CustomJSONEncoder(**kwargs, separators=(",", ":"), ensure_ascii=False)
+    fast = FastJSONEncoder(**kwargs)
+
+    for obj in objects:
+        assert fast.encode(obj) == custom.encode(obj).encode()
+        assert fast.custom_encode(obj) == custom.custom_encode(obj)
+
+
+def test_fast_encoding_models():
+    """Checks the encoding of data objects, straight from their loaded state"""
+
+    metric = JargonPaperMetrics(
+        jargon_id="jargon-01234",
+        arxiv_id="paper-01234",
+        arxiv_rev=1,
+        abs_freq=10,
+        rel_freq=0.1,
+        created_at=datetime(2020, 11, 20, 14, 0, 0),
+    )
+
+    keys = JargonPaperMetrics.__table__.columns.keys()
+    record = {key: getattr(metric, key) for key in keys}
+
+    custom = CustomJSONEncoder(separators=(",", ":"), ensure_ascii=False)
+    fast = FastJSONEncoder()
+
+    assert fast.encode_rows([metric, metric]) == custom.encode([record, record]).encode()
+    assert fast.encode({"metrics": (metric,)}) == custom.encode({"metrics": [record]}).encode()
+
+
+def test_fast_encoding_rows():
+    """Checks the encoding of Core rows by their keys"""
+
+    engine = create_engine("sqlite:///:memory:")
+    query = select(literal(1).label("a"), literal("b").label("b"))
+
+    with engine.connect() as connection:
+        rows = connection.execute(query).all()
+
+    fast = FastJSONEncoder()
+
+    assert json.loads(fast.encode_rows(iter(rows))) == [{"a": 1, "b": "b"}]
+
+
+def test_fast_encoding_invalid():
+    """Checks the raised error when encoding unsupported objects"""
+
+    fast = FastJSONEncoder()
+
+    assert pytest.raises(TypeError, fast.encode, object())
@@ -4,6 +4,7 @@ from datetime import date
 from datetime import datetime
 
 from src.dialect_map_core.encoding import CustomJSONDecoder
+from src.dialect_map_core.models import Paper
 
 
 def test_json_decoding():
@@ -31,3 +32,60 @@ def test_json_decoding_dates():
     assert date_obj.year == 1990
     assert date_obj.month == 1
     assert date_obj.day == 1
+
+
+def test_json_decoding_separators():
+    """Checks the correct decoding of datetime strings with both separators"""
+
+    decoder = CustomJSONDecoder()
+
+    s1 = decoder.custom_decode("2020-11-20 14:00:00")
+    s2 = decoder.custom_decode("2020-11-20T14:00:00")
+
+    assert s1 == s2 == datetime(2020, 11, 20, 14, 0, 0)
+
+
+def test_json_decoding_records():
+    """Checks the decoding of records, only parsing the data model date columns"""
+
+    decoder = CustomJSONDecoder()
+
+    record = {
+        "arxiv_id": "paper-01234",
+        "arxiv_rev": 1,
+        "title": "2020-11-20",
+        "revision_date": None,
+        "submission_date": "2020-11-20",
+        "created_at": "2020-11-20T14:00:00",
+    }
+
+    decoded = decoder.custom_decode_record(dict(record), Paper)
+
+    assert decoded["title"] == "2020-11-20"
+    assert decoded["revision_date"] is None
+    assert decoded["submission_date"] == date(2020, 11, 20)
+    assert decoded["created_at"] == datetime(2020, 11, 20, 14, 0, 0)
+
+    decoded = decoder.custom_decode_record(dict(record))
+
+    assert decoded["title"] == date(2020, 11, 20)
+
+
+def test_json_decoding_records_invalid():
+    """Checks the decoding of records keeps the invalid or unmatched date strings"""
+
+    decoder = CustomJSONDecoder(date_regex="[0-9]{4}/[0-9]{2}/[0-9]{2}")
+
+    record = {
+        "submission_date": "2020-11-20",
+        "revision_date": "2020/13/45",
+    }
+
+    decoded = decoder.custom_decode_record(dict(record), Paper)
+
+    assert decoded["submission_date"] == "2020-11-20"
+    assert decoded["revision_date"] == "2020/13/45"
+
+    decoded = CustomJSONDecoder().custom_decode_record({"submission_date": "2020-13-45"}, Paper)
+
+    assert decoded["submission_date"] == "2020-13-45"
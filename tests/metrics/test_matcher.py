@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import re
+
+import pytest
+
+from src.dialect_map_core.controllers import JargonController
+from src.dialect_map_core.metrics import JargonMatcher
+from src.dialect_map_core.metrics import load_matcher
+from src.dialect_map_core.metrics.matcher import build_trie_regex
+from src.dialect_map_core.metrics.matcher import get_required_literal
+from src.dialect_map_core.models import JargonPaperMetrics
+from src.dialect_map_core.storage import SQLDatabase
+from src.dialect_map_data import FILES_MAPPINGS
+
+
+JARGONS = [
+    ("jargon-regex", "[Oo]ne string"),
+    ("jargon-literal", "string"),
+    ("jargon-prefix", "str"),
+    ("jargon-infix", "ring"),
+    ("jargon-digits", r"x\d+"),
+    ("jargon-nocase", "(?i)stop"),
+    ("jargon-absent", "absent"),
+]
+
+TEXT = "One string and one string, STRINGS x12 x3 Stop"
+
+
+@pytest.fixture(scope="module")
+def database():
+    """
+    Creates a memory-based database with the testing data
+    :return: memory-based database object
+    """
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+    db.load_all(FILES_MAPPINGS)
+
+    return db
+
+
+@pytest.mark.parametrize(
+    "regex, literal, is_literal",
+    [
+        ("[Oo]ne string", "ne string", False),
+        ("colou?r", "colo", False),
+        ("string", "string", True),
+        ("(?i)string", "", False),
+        ("one|two", "", False),
+        ("one|other", "o", False),
+    ],
+)
+def test_required_literal(regex: str, literal: str, is_literal: bool):
+    """
+    Tests the extraction of the literals required by a regular expression
+    :param regex: regular expression
+    :param literal: expected required literal
+    :param is_literal: whether the expression is just the literal
+    """
+
+    assert get_required_literal(regex) == (literal, is_literal)
+
+
+def test_required_literal_invalid():
+    """Tests the extraction of the literals of an unparseable regular expression"""
+
+    assert get_required_literal("(") == ("", False)
+
+
+def test_trie_regex():
+    """Tests the combination of literals into a trie regular expression"""
+
+    regex = build_trie_regex(["str", "string", "stop", "a.b"])
+
+    assert regex == r"(?:a\.b|st(?:op|r(?:ing)?))"
+    assert re.findall(regex, "strings stop str a.b axb") == ["string", "stop", "str", "a.b"]
+
+
+def test_matcher_counts():
+    """Tests the jargon counts against independent regular expression searches"""
+
+    matcher = JargonMatcher(JARGONS + [("jargon-invalid", "(")])
+    expected = {j: len(re.findall(r, TEXT)) for j, r in JARGONS if re.search(r, TEXT)}
+
+    assert len(matcher) == len(JARGONS)
+    assert matcher.count(TEXT) == expected
+    assert matcher.count("nothing to see") == {}
+    assert matcher.get_candidates("nothing to see") == ["jargon-nocase"]
+
+
+def test_matcher_counts_empty():
+    """Tests the jargon counts skip the empty matches"""
+
+    matcher = JargonMatcher([("jargon-star", "a*"), ("jargon-plus", "a+")])
+
+    assert matcher.count("banana") == {"jargon-star": 3, "jargon-plus": 3}
+    assert matcher.count("xyz") == {}
+
+
+def test_matcher_metrics():
+    """Tests the creation of the paper metrics from the jargon counts"""
+
+    matcher = JargonMatcher(JARGONS)
+    metrics = matcher.build_metrics(TEXT, "paper-01234", 1)
+    metrics = {m.jargon_id: m for m in metrics}
+
+    assert all(type(m) is JargonPaperMetrics for m in metrics.values())
+    assert metrics["jargon-regex"].abs_freq == 2
+    assert metrics["jargon-regex"].rel_freq == 2 / 9
+    assert metrics["jargon-regex"].arxiv_id == "paper-01234"
+    assert "jargon-absent" not in metrics
+
+    metrics = JargonMatcher([("jargon-space", r"\s")]).build_metrics("  ", "paper-01234", 1)
+
+    assert metrics[0].abs_freq == 2
+    assert metrics[0].rel_freq == 0.0
+
+
+def test_matcher_loading(database: SQLDatabase):
+    """
+    Tests the caching of the matching engine until the jargons change
+    :param database: memory-based database object
+    """
+
+    with database.create_session() as session:
+        matcher_1 = load_matcher(session)
+        matcher_2 = load_matcher(session)
+
+        assert matcher_1 is matcher_2
+        assert matcher_1.count("One string, other string") == {
+            "jargon-01234": 1,
+            "jargon-56789": 1,
+        }
+
+        JargonController(session).archive("jargon-01234")
+        matcher_3 = load_matcher(session)
+
+        assert matcher_3 is not matcher_1
+        assert len(matcher_3) == 1
+
+        jargon = JargonController(session).get("jargon-56789")
+        jargon.jargon_regex = "other"
+        session.commit()
+        matcher_4 = load_matcher(session)
+
+        assert matcher_4 is not matcher_3
+        assert matcher_4.count("One string, other string") == {"jargon-56789": 1}
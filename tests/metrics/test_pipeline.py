@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from sqlalchemy import select
+
+from src.dialect_map_core.metrics import MetricsPipeline
+from src.dialect_map_core.metrics import PaperText
+from src.dialect_map_core.metrics.pipeline import MetricsCheckpoint
+from src.dialect_map_core.metrics.pipeline import PaperCounts
+from src.dialect_map_core.models import JargonCategoryMetrics
+from src.dialect_map_core.models import JargonPaperMetrics
+from src.dialect_map_core.storage import SQLDatabase
+from src.dialect_map_data import FILES_MAPPINGS
+
+
+PAPERS = [
+    PaperText("paper-01234", 1, "One string and other string, one string again"),
+    PaperText("paper-01234", 2, "One string only"),
+    PaperText("paper-56789", 1, "No jargons at all"),
+]
+
+
+@pytest.fixture(scope="function")
+def database():
+    """
+    Creates a memory-based database with the testing data
+    :return: memory-based database object
+    """
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+    db.load_all(FILES_MAPPINGS)
+
+    return db
+
+
+def get_metrics(database: SQLDatabase, model: type) -> dict:
+    """
+    Gets the stored metrics of a model, by their jargon and paper / category
+    :param database: memory-based database object
+    :param model: metrics model
+    :return: dictionary of keys and (abs_freq, rel_freq) pairs
+    """
+
+    if model is JargonPaperMetrics:
+        keys = (model.jargon_id, model.arxiv_id, model.arxiv_rev, model.is_latest)
+    else:
+        keys = (model.jargon_id, model.category_id)
+
+    with database.create_session() as session:
+        rows = session.execute(select(*keys, model.abs_freq, model.rel_freq))
+        return {tuple(row[:-2]): tuple(row[-2:]) for row in rows}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_pipeline_run(database: SQLDatabase, workers: int):
+    """
+    Tests the computation of the paper and category metrics
+    :param database: memory-based database object
+    :param workers: number of worker processes
+    """
+
+    with database.create_session() as session:
+        pipeline = MetricsPipeline(session, workers=workers, batch_size=2)
+        result = pipeline.run(PAPERS)
+
+    paper_metrics = get_metrics(database, JargonPaperMetrics)
+    category_metrics = get_metrics(database, JargonCategoryMetrics)
+
+    assert result == (3, 3, 4)
+    assert paper_metrics == {
+        ("jargon-01234", "paper-01234", 1, False): (2, 2 / 8),
+        ("jargon-56789", "paper-01234", 1, False): (1, 1 / 8),
+        ("jargon-01234", "paper-01234", 2, True): (1, 1 / 3),
+        ("jargon-01234", "paper-56789", 2, True): (6, 0.02),
+    }
+    assert category_metrics == {
+        ("jargon-01234", "category-01234"): (2, 2 / 8),
+        ("jargon-01234", "category-56789"): (2, 2 / 8),
+        ("jargon-56789", "category-01234"): (1, 1 / 8),
+        ("jargon-56789", "category-56789"): (1, 1 / 8),
+    }
+
+
+def test_pipeline_resume(database: SQLDatabase, tmp_path: Path):
+    """
+    Tests the resumption of a crashed run from its checkpoint
+    :param database: memory-based database object
+    :param tmp_path: temporary directory path
+    """
+
+    checkpoint_path = tmp_path.joinpath("checkpoint.jsonl")
+
+    def crashing_papers():
+        yield PAPERS[0]
+        raise RuntimeError("Crash")
+
+    with database.create_session() as session:
+        pipeline = MetricsPipeline(session, str(checkpoint_path), batch_size=1)
+
+        assert pytest.raises(RuntimeError, pipeline.run, crashing_papers())
+        assert checkpoint_path.exists()
+
+        result = pipeline.run(PAPERS)
+
+    category_metrics = get_metrics(database, JargonCategoryMetrics)
+
+    assert result.num_papers == 2
+    assert category_metrics[("jargon-01234", "category-01234")] == (2, 2 / 8)
+    assert not checkpoint_path.exists()
+
+
+def test_pipeline_checkpoint_version(database: SQLDatabase, tmp_path: Path):
+    """
+    Tests the rejection of a checkpoint after the jargons change
+    :param database: memory-based database object
+    :param tmp_path: temporary directory path
+    """
+
+    checkpoint_path = tmp_path.joinpath("checkpoint.jsonl")
+    checkpoint_path.write_text('{"version": "other"}\n')
+
+    with database.create_session() as session:
+        pipeline = MetricsPipeline(session, str(checkpoint_path))
+
+        assert pytest.raises(ValueError, pipeline.run, PAPERS)
+
+
+def test_pipeline_checkpoint_header(database: SQLDatabase, tmp_path: Path):
+    """
+    Tests the restart of a checkpoint with an incomplete header
+    :param database: memory-based database object
+    :param tmp_path: temporary directory path
+    """
+
+    checkpoint_path = tmp_path.joinpath("checkpoint.jsonl")
+    checkpoint_path.write_text('{"versi')
+
+    checkpoint = MetricsCheckpoint(str(checkpoint_path))
+    checkpoint.open("version-1")
+
+    assert checkpoint_path.read_text() == '{"version": "version-1"}\n'
+    assert checkpoint.papers == set()
+
+    checkpoint_path.write_text('{"versi')
+
+    with database.create_session() as session:
+        pipeline = MetricsPipeline(session, str(checkpoint_path))
+        result = pipeline.run(PAPERS)
+
+    category_metrics = get_metrics(database, JargonCategoryMetrics)
+
+    assert result.num_papers == 3
+    assert category_metrics[("jargon-01234", "category-01234")] == (2, 2 / 8)
+    assert not checkpoint_path.exists()
+
+
+def test_pipeline_zero_words(database: SQLDatabase):
+    """
+    Tests the relative frequencies of the papers and categories without words
+    :param database: memory-based database object
+    """
+
+    counts = PaperCounts("paper-01234", 1, {"jargon-01234": 1}, 0)
+
+    with database.create_session() as session:
+        pipeline = MetricsPipeline(session)
+        _, abs_freqs, num_words = pipeline._write_papers([counts])
+        pipeline._write_categories(abs_freqs, num_words)
+
+    paper_metrics = get_metrics(database, JargonPaperMetrics)
+    category_metrics = get_metrics(database, JargonCategoryMetrics)
+
+    assert paper_metrics[("jargon-01234", "paper-01234", 1, False)] == (1, 0.0)
+    assert category_metrics[("jargon-01234", "category-01234")] == (1, 0.0)
+
+
+def test_pipeline_stale_categories(database: SQLDatabase):
+    """
+    Tests the removal of the stale jargon metrics of the computed categories
+    :param database: memory-based database object
+    """
+
+    abs_freqs = Counter({("jargon-01234", "category-01234"): 2})
+    num_words = Counter({"category-01234": 8})
+
+    with database.create_session() as session:
+        pipeline = MetricsPipeline(session)
+        pipeline.run(PAPERS)
+        pipeline._write_categories(abs_freqs, num_words)
+
+    category_metrics = get_metrics(database, JargonCategoryMetrics)
+
+    assert ("jargon-56789", "category-01234") not in category_metrics
+    assert ("jargon-56789", "category-56789") in category_metrics
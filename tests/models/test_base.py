@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+
+import pytest
+
+from sqlalchemy import create_engine
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.dialect_map_core.models import JargonGroup
+from src.dialect_map_core.models import JargonPaperMetrics
+from src.dialect_map_core.models import Paper
+from src.dialect_map_core.models import PaperAuthor
+
+
+def test_model_initialization():
+    """Tests the initialization of data objects from keyword arguments"""
+
+    created_at = datetime(2020, 11, 20, 10, 0, 0)
+    metric = JargonPaperMetrics(
+        jargon_id="jargon-01234",
+        arxiv_id="paper-01234",
+        arxiv_rev=1,
+        abs_freq=10,
+        rel_freq=0.1,
+        created_at=created_at,
+    )
+
+    assert metric.jargon_id == "jargon-01234"
+    assert metric.created_at == created_at
+    assert inspect(metric).attrs.abs_freq.history.added == [10]
+    assert pytest.raises(TypeError, JargonPaperMetrics, unknown="value")
+
+
+def test_model_initialization_validators():
+    """Tests the execution of the attribute validators upon initialization"""
+
+    args = {"description": "A", "archived": False}
+
+    assert pytest.raises(ValueError, JargonGroup, **args, audited_at=datetime.now())
+    assert pytest.raises(ValueError, JargonGroup, **args, archived_at=datetime.now())
+
+
+def test_model_nested_initialization():
+    """Tests the initialization of the nested one-to-many children"""
+
+    created_at = datetime(2020, 11, 20, 10, 0, 0)
+    authors = [{"author_name": f"Author {i}", "created_at": created_at} for i in range(3)]
+
+    paper = Paper(
+        arxiv_id="paper-01234",
+        arxiv_rev=1,
+        title="Title",
+        created_at=created_at,
+        authors=authors,
+    )
+
+    assert all(type(author) is PaperAuthor for author in paper.authors)
+    assert [author.author_name for author in paper.authors] == ["Author 0", "Author 1", "Author 2"]
+
+
+def test_model_build_all():
+    """Tests the batched initialization of data objects"""
+
+    records = [{"author_name": f"Author {i}", "arxiv_rev": i} for i in range(3)]
+    authors = PaperAuthor.build_all(records)
+
+    assert [author.arxiv_rev for author in authors] == [0, 1, 2]
+    assert pytest.raises(TypeError, PaperAuthor.build_all, [{"unknown": "value"}])
+
+
+def test_model_serialization():
+    """Tests the serialization of data objects as dictionaries and tuples"""
+
+    created_at = datetime(2020, 11, 20, 10, 0, 0)
+    group = JargonGroup(group_id="group-01234", description="A", archived=False)
+    group.created_at = created_at
+
+    assert group.to_dict() == {
+        "group_id": "group-01234",
+        "description": "A",
+        "archived": False,
+        "created_at": created_at,
+        "archived_at": None,
+        "audited_at": None,
+    }
+
+    assert group.to_tuple(["group_id", "archived"]) == ("group-01234", False)
+    assert group.to_dict(["description"]) == {"description": "A"}
+    assert pytest.raises(ValueError, group.to_dict, ["unknown"])
+    assert str(group).startswith("<JargonGroup(group_id='group-01234', description='A'")
+
+
+def test_model_serialize_many():
+    """Tests the serialization of data objects and Core rows with the same output"""
+
+    engine = create_engine("sqlite:///:memory:")
+    JargonGroup.__table__.create(engine)
+
+    with Session(engine) as session:
+        groups = [
+            JargonGroup(description=f"Group {i}", archived=False, created_at=datetime.now())
+            for i in range(3)
+        ]
+
+        session.add_all(groups)
+        session.commit()
+
+        objects = session.scalars(select(JargonGroup)).all()
+        rows = session.execute(select(JargonGroup.__table__)).all()
+
+        columns = ["group_id", "description"]
+
+        assert JargonGroup.serialize_many(objects) == JargonGroup.serialize_many(rows)
+        assert JargonGroup.serialize_many(objects, columns) == [
+            {"group_id": g.group_id, "description": g.description} for g in groups
+        ]
+        assert JargonGroup.serialize_many(rows, columns, as_tuples=True) == [
+            (g.group_id, g.description) for g in groups
+        ]
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from src.dialect_map_core.models import JargonPaperMetrics
+from src.dialect_map_core.models import Paper
+from src.dialect_map_core.storage import ColumnarExporter
+from src.dialect_map_core.storage import DictionaryColumn
+from src.dialect_map_core.storage import SQLDatabase
+from src.dialect_map_data import FILES_MAPPINGS
+
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module")
+def exporter():
+    """
+    Creates a columnar exporter over a memory-based database with the testing data
+    :return: columnar exporter object
+    """
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+    db.load_all(FILES_MAPPINGS)
+
+    with db.create_session() as session:
+        yield ColumnarExporter(session, batch_size=3)
+
+
+def test_numpy_export(exporter: ColumnarExporter):
+    """
+    Tests the export of a table into NumPy arrays
+    :param exporter: columnar exporter object
+    """
+
+    arrays = exporter.to_numpy(JargonPaperMetrics)
+
+    assert arrays["arxiv_rev"].dtype == np.int64
+    assert arrays["rel_freq"].dtype == np.float64
+    assert arrays["is_latest"].dtype == np.bool_
+    assert arrays["created_at"].dtype == np.dtype("datetime64[us]")
+    assert arrays["abs_freq"].tolist() == [10, 12, 4, 6]
+
+    arxiv_ids = arrays["arxiv_id"]
+
+    assert type(arxiv_ids) is DictionaryColumn
+    assert arxiv_ids.codes.tolist() == [0, 0, 1, 1]
+    assert arxiv_ids.values == ["paper-01234", "paper-56789"]
+
+
+def test_numpy_export_filtered(exporter: ColumnarExporter):
+    """
+    Tests the export of a subset of columns and rows into NumPy arrays
+    :param exporter: columnar exporter object
+    """
+
+    model = JargonPaperMetrics
+    arrays = exporter.to_numpy(model, ["jargon_id", "abs_freq"], [model.arxiv_rev == 2])
+    empty = exporter.to_numpy(model, ["jargon_id", "abs_freq"], [model.arxiv_rev == 3])
+
+    assert list(arrays.keys()) == ["jargon_id", "abs_freq"]
+    assert arrays["abs_freq"].tolist() == [12, 6]
+    assert arrays["jargon_id"].values == ["jargon-01234"]
+    assert len(empty["abs_freq"]) == 0
+    assert len(empty["jargon_id"].codes) == 0
+
+
+def test_unknown_columns(exporter: ColumnarExporter):
+    """
+    Tests the rejection of unknown columns
+    :param exporter: columnar exporter object
+    """
+
+    with pytest.raises(ValueError):
+        exporter.to_numpy(Paper, ["arxiv_id", "unknown"])
+
+
+def test_arrow_export(exporter: ColumnarExporter):
+    """
+    Tests the export of a table into Arrow record batches
+    :param exporter: columnar exporter object
+    """
+
+    pa = pytest.importorskip("pyarrow")
+
+    batches = list(exporter.iter_record_batches(JargonPaperMetrics))
+    table = pa.Table.from_batches(batches)
+
+    assert [b.num_rows for b in batches] == [3, 1]
+    assert [len(b.column("metric_id").dictionary) for b in batches] == [3, 1]
+    assert pa.types.is_dictionary(table.schema.field("metric_id").type)
+    assert table.column("arxiv_id").to_pylist() == [
+        "paper-01234",
+        "paper-01234",
+        "paper-56789",
+        "paper-56789",
+    ]
+
+
+def test_arrow_export_strings(exporter: ColumnarExporter):
+    """
+    Tests the export of nullable string columns, without NumPy string arrays
+    :param exporter: columnar exporter object
+    """
+
+    pa = pytest.importorskip("pyarrow")
+
+    columns = exporter._get_columns(Paper, ["arxiv_id", "doi_id"])
+    batches = list(exporter._iter_column_batches(columns, {}, ()))
+    table = pa.Table.from_batches(exporter.iter_record_batches(Paper, ["arxiv_id", "doi_id"]))
+
+    assert all(type(b["arxiv_id"]) is list for b in batches)
+    assert table.column("doi_id").null_count == table.num_rows
+    assert table.column("arxiv_id").to_pylist() == [a for b in batches for a in b["arxiv_id"]]
+
+
+def test_parquet_export(exporter: ColumnarExporter, tmp_path):
+    """
+    Tests the export of a table into a Parquet file
+    :param exporter: columnar exporter object
+    :param tmp_path: temporary directory path
+    """
+
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    file_path = str(tmp_path / "papers.parquet")
+    num_rows = exporter.to_parquet(file_path, Paper, ["arxiv_id", "arxiv_rev", "submission_date"])
+    table = pq.read_table(file_path)
+
+    assert num_rows == table.num_rows
+    assert table.column_names == ["arxiv_id", "arxiv_rev", "submission_date"]
+    assert table.column("arxiv_rev").to_pylist() == [1, 2, 1, 2]
@@ -1,8 +1,21 @@
 # -*- coding: utf-8 -*-
 
+import json
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import pytest
 
+from sqlalchemy import func
+from sqlalchemy import select
+
+from src.dialect_map_core.models import JargonGroup
+from src.dialect_map_core.models import JargonPaperMetrics
+from src.dialect_map_core.models import Paper
+from src.dialect_map_core.storage import RecordValidationError
 from src.dialect_map_core.storage import SQLDatabase
+from src.dialect_map_data import FILES_MAPPINGS
 
 
 def test_connection_exception():
@@ -28,3 +41,289 @@ def test_sql_tables_deletion():
 
     db = SQLDatabase("sqlite:///:memory:")
     db.teardown(True)
+
+
+def test_sql_records_loading():
+    """Tests the streamed loading of data files in multiple batches"""
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+
+    loaded = [db.load(m.file, m.model, batch_size=1) for m in FILES_MAPPINGS]
+
+    assert all(count > 0 for count in loaded)
+
+
+def test_sql_records_bulk_loading():
+    """Tests the bulk loading of data files, bypassing the ORM objects"""
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+
+    loaded = [db.load(m.file, m.model, batch_size=2, method="bulk") for m in FILES_MAPPINGS]
+
+    assert all(count > 0 for count in loaded)
+
+    with db.create_session() as session:
+        table = JargonPaperMetrics.__table__
+        rows = session.execute(select(table)).all()
+
+    assert len(rows) == 4
+    assert all(row.audited_at is not None for row in rows)
+
+
+def test_sql_records_bulk_defaults(tmp_path: Path):
+    """
+    Tests the generation of default values when bulk loading records
+    :param tmp_path: temporary directory path
+    """
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+
+    file_path = tmp_path.joinpath("groups.json")
+    file_path.write_text(
+        json.dumps(
+            [
+                {"description": "A", "archived": False, "created_at": "2020-11-20 10:00:00"},
+                {"description": "B", "archived": False, "created_at": "2020-11-20 10:00:00"},
+            ]
+        )
+    )
+
+    db.load(str(file_path), JargonGroup, method="bulk")
+
+    with db.create_session() as session:
+        table = JargonGroup.__table__
+        rows = session.execute(select(table)).all()
+
+    assert len({row.group_id for row in rows}) == 2
+    assert len({row.audited_at for row in rows}) == 1
+
+
+def test_sql_records_bulk_partial_defaults(tmp_path: Path):
+    """
+    Tests the generation of default values for records missing some keys
+    :param tmp_path: temporary directory path
+    """
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+
+    for mapping in FILES_MAPPINGS:
+        if mapping.model.__tablename__ != JargonPaperMetrics.__tablename__:
+            db.load(mapping.file, mapping.model, method="bulk")
+            continue
+
+        records = json.loads(Path(mapping.file).read_text())
+        records = [{k: v for k, v in r.items() if k != "is_latest"} for r in records]
+        records[0]["is_latest"] = True
+
+        file_path = tmp_path.joinpath("metrics.json")
+        file_path.write_text(json.dumps(records))
+
+        assert db.load(str(file_path), mapping.model, method="bulk") == len(records)
+
+
+def test_sql_records_bulk_invalid(tmp_path: Path):
+    """
+    Tests the raised errors when bulk loading invalid records
+    :param tmp_path: temporary directory path
+    """
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+
+    unknown_path = tmp_path.joinpath("unknown.json")
+    unknown_path.write_text('{"description": "A", "unknown": 1}')
+
+    private_path = tmp_path.joinpath("private.json")
+    private_path.write_text('{"description": "A", "audited_at": "2020-11-20 10:00:00"}')
+
+    archived_path = tmp_path.joinpath("archived.json")
+    archived_path.write_text(
+        '[{"description": "A", "archived": true, "archived_at": "2020-11-20 10:00:00"},'
+        ' {"description": "B", "archived": false, "archived_at": "2020-11-20 10:00:00"}]'
+    )
+
+    assert pytest.raises(TypeError, db.load, str(unknown_path), JargonGroup, method="bulk")
+    assert pytest.raises(ValueError, db.load, str(private_path), JargonGroup, method="bulk")
+    assert pytest.raises(ValueError, db.load, str(archived_path), JargonGroup, method="bulk")
+    assert pytest.raises(ValueError, db.load, str(private_path), JargonGroup, method="other")
+
+
+@pytest.mark.parametrize("method", ["orm", "bulk"])
+def test_sql_records_validated_loading(method: str):
+    """
+    Tests the loading of data files validating their records
+    :param method: insertion method
+    """
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+
+    loaded = [db.load(m.file, m.model, method=method, validation="raise") for m in FILES_MAPPINGS]
+
+    assert loaded == [len(json.loads(Path(m.file).read_text())) for m in FILES_MAPPINGS]
+
+
+def test_sql_records_validated_invalid(tmp_path: Path):
+    """
+    Tests the reporting of invalid records, along with their file lines
+    :param tmp_path: temporary directory path
+    """
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+
+    file_path = tmp_path.joinpath("groups.ndjson")
+    file_path.write_text(
+        '{"description": "A", "archived": false, "created_at": "2020-11-20 10:00:00"}\n'
+        '{"description": "B", "archived": "no", "created_at": "2020-11-20 10:00:00"}\n'
+        '{"description": "C", "archived": false, "created_at": "2020-11-20 10:00:00"}\n'
+        '{"description": "D", "archived": false}\n'
+    )
+
+    with pytest.raises(RecordValidationError) as error:
+        db.load(str(file_path), JargonGroup, method="bulk", validation="raise")
+
+    assert [e.line for e in error.value.errors] == [2, 4]
+    assert str(error.value).startswith(f"{file_path}:2:")
+
+    loaded = db.load(str(file_path), JargonGroup, method="bulk", validation="skip")
+
+    with db.create_session() as session:
+        stmt = select(JargonGroup.description).order_by(JargonGroup.description)
+        descriptions = session.execute(stmt).scalars().all()
+
+    assert loaded == 2
+    assert descriptions == ["A", "C"]
+    assert pytest.raises(ValueError, db.load, str(file_path), JargonGroup, validation="other")
+
+
+@pytest.mark.parametrize("method", ["orm", "bulk"])
+def test_sql_records_validated_dates(tmp_path: Path, method: str):
+    """
+    Tests the reporting of invalid dates, along with their file lines
+    :param tmp_path: temporary directory path
+    :param method: insertion method
+    """
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+
+    file_path = tmp_path.joinpath("groups.ndjson")
+    file_path.write_text(
+        '{"description": "A", "archived": false, "created_at": "2020-11-20 10:00:00"}\n'
+        '{"description": "B", "archived": false, "created_at": "2020-13-45 10:00:00"}\n'
+    )
+
+    with pytest.raises(RecordValidationError) as error:
+        db.load(str(file_path), JargonGroup, method=method, validation="raise")
+
+    assert str(error.value) == f"{file_path}:2: The column 'created_at' must be of type datetime"
+
+    loaded = db.load(str(file_path), JargonGroup, method=method, validation="skip")
+
+    assert loaded == 1
+
+
+def test_sql_records_validated_children(tmp_path: Path):
+    """
+    Tests the rejection of nested children when not inserted as ORM objects
+    :param tmp_path: temporary directory path
+    """
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+
+    file_path = tmp_path.joinpath("groups.ndjson")
+    file_path.write_text(
+        '{"description": "A", "archived": false, "created_at": "2020-11-20 10:00:00", '
+        '"jargons": []}\n'
+    )
+
+    with pytest.raises(RecordValidationError) as error:
+        db.load(str(file_path), JargonGroup, method="bulk", validation="raise")
+
+    assert str(error.value).endswith(
+        "The relationship 'jargons' is only supported by the 'orm' method"
+    )
+    assert db.load(str(file_path), JargonGroup, method="orm", validation="raise") == 1
+
+
+def test_sql_records_copy_fallback():
+    """Tests the fallback to INSERT statements when COPY is not supported"""
+
+    db = SQLDatabase("sqlite:///:memory:")
+    db.setup(False)
+
+    loaded = [db.load(m.file, m.model, method="copy") for m in FILES_MAPPINGS]
+
+    assert all(count > 0 for count in loaded)
+
+
+def test_sql_records_parallel_loading(tmp_path: Path):
+    """
+    Tests the concurrent loading of data files respecting their dependencies
+    :param tmp_path: temporary directory path
+    """
+
+    db_path = tmp_path.joinpath("parallel.db")
+    db = SQLDatabase(f"sqlite:///{db_path}")
+    db.setup(False)
+
+    mappings = list(reversed(FILES_MAPPINGS))
+    loaded = db.load_all(mappings, method="bulk", workers=4)
+
+    assert loaded == sum(len(json.loads(Path(m.file).read_text())) for m in mappings)
+    assert pytest.raises(ValueError, db.load_all, mappings, workers=0)
+
+
+def test_sql_pooled_sessions(tmp_path: Path):
+    """
+    Tests the checkout of a different connection per session on pooled mode
+    :param tmp_path: temporary directory path
+    """
+
+    db_path = tmp_path.joinpath("pooled.db")
+    db = SQLDatabase(f"sqlite:///{db_path}", pooled=True, pool_size=2)
+    db.setup(False)
+
+    with db.create_session() as s1, db.create_session() as s2:
+        c1 = s1.connection().connection.dbapi_connection
+        c2 = s2.connection().connection.dbapi_connection
+
+        assert c1 is not c2
+
+    db.close_connection()
+
+
+def test_sql_pooled_concurrency(tmp_path: Path):
+    """
+    Tests the concurrent use of sessions from multiple threads on pooled mode
+    :param tmp_path: temporary directory path
+    """
+
+    db_path = tmp_path.joinpath("pooled.db")
+    db = SQLDatabase(f"sqlite:///{db_path}", pooled=True, pool_size=4)
+    db.setup(False)
+    db.load_all(FILES_MAPPINGS)
+
+    def count_papers(_) -> int:
+        with db.create_session() as session:
+            stmt = select(func.count()).select_from(Paper)
+            return session.execute(stmt).scalar_one()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        counts = list(executor.map(count_papers, range(8)))
+
+    assert counts == [4] * 8
+
+    db.close_connection()
+
+
+def test_sql_pooled_in_memory():
+    """Tests the raised exception when pooling in-memory databases"""
+
+    assert pytest.raises(ValueError, SQLDatabase, "sqlite:///:memory:", pooled=True)
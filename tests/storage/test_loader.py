@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from datetime import date
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.dialect_map_core.models import Paper
+from src.dialect_map_core.storage import JSONFileLoader
+
+
+@pytest.fixture(scope="module")
+def records() -> list:
+    """
+    Defines a set of JSON records to be written into the test files
+    :return: list of records
+    """
+
+    return [
+        {"id": f"record-{i}", "value": i * 0.5, "created_at": "2020-11-20 10:00:00"}
+        for i in range(50)
+    ]
+
+
+def test_json_array_loading(tmp_path: Path, records: list):
+    """
+    Tests the streaming of a top-level JSON array file
+    :param tmp_path: temporary directory path
+    :param records: list of JSON records
+    """
+
+    file_path = tmp_path.joinpath("records.json")
+    file_path.write_text(json.dumps(records, indent=2))
+
+    loader = JSONFileLoader(read_size=16)
+    loaded = list(loader.iter_records(str(file_path)))
+
+    assert len(loaded) == len(records)
+    assert loaded[0]["id"] == "record-0"
+    assert loaded[-1]["value"] == 24.5
+    assert type(loaded[0]["created_at"]) is datetime
+
+
+def test_json_lines_loading(tmp_path: Path, records: list):
+    """
+    Tests the streaming of a newline-delimited JSON file
+    :param tmp_path: temporary directory path
+    :param records: list of JSON records
+    """
+
+    file_path = tmp_path.joinpath("records.ndjson")
+    file_path.write_text("\n".join(json.dumps(r) for r in records) + "\n")
+
+    loader = JSONFileLoader(read_size=7)
+    loaded = loader.load(str(file_path))
+
+    assert type(loaded) is list
+    assert [r["id"] for r in loaded] == [r["id"] for r in records]
+
+
+def test_json_object_loading(tmp_path: Path):
+    """
+    Tests the loading of a file containing a single JSON object
+    :param tmp_path: temporary directory path
+    """
+
+    file_path = tmp_path.joinpath("record.json")
+    file_path.write_text('{"id": "record", "submission_date": "2020-11-20"}')
+
+    loader = JSONFileLoader()
+    loaded = loader.load(str(file_path))
+
+    assert len(loaded) == 1
+    assert type(loaded[0]["submission_date"]) is date
+
+
+def test_json_batches_loading(tmp_path: Path, records: list):
+    """
+    Tests the iteration of a JSON file in bounded-size batches
+    :param tmp_path: temporary directory path
+    :param records: list of JSON records
+    """
+
+    file_path = tmp_path.joinpath("records.json")
+    file_path.write_text(json.dumps(records))
+
+    loader = JSONFileLoader()
+    batches = list(loader.iter_batches(str(file_path), batch_size=20))
+
+    assert [len(b) for b in batches] == [20, 20, 10]
+    assert pytest.raises(ValueError, list, loader.iter_batches(str(file_path), 0))
+
+
+def test_json_invalid_loading(tmp_path: Path):
+    """
+    Tests the raised error when loading malformed JSON files
+    :param tmp_path: temporary directory path
+    """
+
+    truncated_path = tmp_path.joinpath("truncated.json")
+    truncated_path.write_text('[{"id": "record-0"}, {"id": "rec')
+
+    unclosed_path = tmp_path.joinpath("unclosed.json")
+    unclosed_path.write_text('[{"id": "record-0"}')
+
+    loader = JSONFileLoader(read_size=8)
+
+    assert pytest.raises(json.JSONDecodeError, loader.load, str(truncated_path))
+    assert pytest.raises(json.JSONDecodeError, loader.load, str(unclosed_path))
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '[{"id": "record-0"},]',
+        '[{"id": "record-0"}, {"id": "record-1"} ,\n]',
+        '{"id": "record-0"}{"id": "record-1"}',
+        '{"id": "record-0"} {"id": "record-1"}\n',
+    ],
+)
+def test_json_invalid_separators(tmp_path: Path, content: str):
+    """
+    Tests the raised error when loading JSON files with trailing commas or concatenated values
+    :param tmp_path: temporary directory path
+    :param content: malformed JSON content
+    """
+
+    file_path = tmp_path.joinpath("records.json")
+    file_path.write_text(content)
+
+    loader = JSONFileLoader(read_size=8)
+
+    assert pytest.raises(json.JSONDecodeError, loader.load, str(file_path))
+
+
+def test_json_invalid_fail_fast(tmp_path: Path, records: list):
+    """
+    Tests the raised error on invalid values before reading the rest of the file
+    :param tmp_path: temporary directory path
+    :param records: list of dictionary records
+    """
+
+    content = '[{"id": tru}, ' + ", ".join(json.dumps(r) for r in records * 100) + "]"
+
+    file_path = tmp_path.joinpath("records.json")
+    file_path.write_text(content)
+
+    loader = JSONFileLoader(read_size=16)
+
+    with pytest.raises(json.JSONDecodeError) as error:
+        loader.load(str(file_path))
+
+    assert len(error.value.doc) < 2 * loader.read_size
+
+
+def test_json_split_values_loading(tmp_path: Path):
+    """
+    Tests the loading of numbers and literals split across file reads
+    :param tmp_path: temporary directory path
+    """
+
+    values = [1.5, -2e10, True, None, "caf\u00e9", 12345]
+
+    file_path = tmp_path.joinpath("values.json")
+    file_path.write_text(json.dumps(values))
+
+    for read_size in range(1, 8):
+        assert JSONFileLoader(read_size=read_size).load(str(file_path)) == values
+
+
+def test_json_model_loading(tmp_path: Path):
+    """
+    Tests the loading of a JSON file decoding only the data model date columns
+    :param tmp_path: temporary directory path
+    """
+
+    file_path = tmp_path.joinpath("papers.json")
+    file_path.write_text(
+        '[{"arxiv_id": "2020-11-20", "arxiv_rev": 1, "submission_date": "2020-11-20"}]'
+    )
+
+    loader = JSONFileLoader()
+    loaded = loader.load(str(file_path), Paper)
+
+    assert type(loaded[0]["arxiv_id"]) is str
+    assert type(loaded[0]["submission_date"]) is date
+
+
+def test_json_numbered_loading(tmp_path: Path, records: list):
+    """
+    Tests the tracking of the line where each JSON record starts
+    :param tmp_path: temporary directory path
+    :param records: list of JSON records
+    """
+
+    array_path = tmp_path.joinpath("records.json")
+    array_path.write_text(json.dumps(records[:3], indent=2))
+
+    lines_path = tmp_path.joinpath("records.ndjson")
+    lines_path.write_text("\n".join(json.dumps(r) for r in records[:3]) + "\n")
+
+    loader = JSONFileLoader(read_size=8)
+    array_lines = [line for line, _ in loader.iter_numbered_records(str(array_path))]
+    batches = list(loader.iter_numbered_batches(str(lines_path), batch_size=2))
+
+    assert array_lines == [2, 7, 12]
+    assert [lines for lines, _ in batches] == [[1, 2], [3]]
+    assert [len(batch) for _, batch in batches] == [2, 1]
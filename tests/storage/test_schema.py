@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from src.dialect_map_core.models import Base
+from src.dialect_map_core.storage import get_indexed_columns
+from src.dialect_map_core.storage import get_table_dependencies
+from src.dialect_map_core.storage import get_unindexed_filters
+
+
+def test_table_dependencies():
+    """Checks the computation of the table dependencies from their foreign keys"""
+
+    deps = get_table_dependencies(Base.metadata.tables.values())
+
+    assert deps["categories"] == set()
+    assert deps["papers"] == set()
+    assert deps["jargons"] == {"jargon_groups"}
+    assert deps["category_memberships"] == {"categories", "papers"}
+    assert deps["jargon_paper_metrics"] == {"jargons", "papers"}
+    assert deps["paper_references"] == {"papers"}
+
+
+def test_table_dependencies_subset():
+    """Checks the exclusion of dependencies outside the provided tables"""
+
+    tables = Base.metadata.tables
+    deps = get_table_dependencies([tables["jargons"], tables["jargon_paper_metrics"]])
+
+    assert deps["jargons"] == set()
+    assert deps["jargon_paper_metrics"] == {"jargons"}
+
+
+def test_indexed_columns():
+    """Checks the retrieval of the indexed columns, including constraints ones"""
+
+    indexes = get_indexed_columns(Base.metadata.tables["paper_references"])
+
+    assert ("reference_id",) in indexes
+    assert ("target_arxiv_id", "target_arxiv_rev") in indexes
+    assert ("source_arxiv_id", "source_arxiv_rev", "target_arxiv_id", "target_arxiv_rev") in indexes
+
+
+def test_unindexed_filters():
+    """Checks the detection of filters not supported by any index"""
+
+    table = Base.metadata.tables["jargon_category_metrics"]
+    filters = [("jargon_id", "category_id"), ("abs_freq",), ("rel_freq", "metric_id")]
+
+    assert get_unindexed_filters(table, filters) == [("abs_freq",)]
+    assert pytest.raises(ValueError, get_unindexed_filters, table, [("unknown",)])
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import csv
+import io
+
+from datetime import date
+from datetime import datetime
+
+from src.dialect_map_core.storage import CSVRowsStream
+
+
+def test_csv_rows_formatting():
+    """Checks the COPY compatible formatting of the row values"""
+
+    rows = iter(
+        [
+            ("id-1", None, "", True, 10, 0.5, date(2020, 11, 20)),
+            ('quoted "id", with comma', None, "a\nb", False, 0, 1.0, datetime(2020, 11, 20)),
+        ]
+    )
+
+    stream = CSVRowsStream(rows)
+    text = stream.read()
+
+    assert text.splitlines()[0] == '"id-1",,"",true,10,0.5,2020-11-20'
+    assert stream.num_rows == 2
+
+    parsed = list(csv.reader(io.StringIO(text)))
+
+    assert parsed[1][0] == 'quoted "id", with comma'
+    assert parsed[1][2] == "a\nb"
+    assert parsed[1][6] == "2020-11-20T00:00:00"
+
+
+def test_csv_rows_partial_reads():
+    """Checks the lazy consumption of rows on bounded-size reads"""
+
+    rows = iter([(f"id-{i}", i) for i in range(100)])
+    stream = CSVRowsStream(rows)
+
+    first = stream.read(10)
+    assert len(first) == 10
+    assert stream.num_rows < 100
+
+    chunks = [first]
+    while chunk := stream.read(32):
+        chunks.append(chunk)
+
+    lines = "".join(chunks).splitlines()
+
+    assert len(lines) == 100
+    assert lines[-1] == '"id-99",99'
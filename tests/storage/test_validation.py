@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+from datetime import date
+from datetime import datetime
+
+from src.dialect_map_core.models import JargonGroup
+from src.dialect_map_core.models import JargonPaperMetrics
+from src.dialect_map_core.models import Paper
+from src.dialect_map_core.storage import RecordError
+from src.dialect_map_core.storage import get_validator
+
+
+def test_validator_caching():
+    """Tests the compilation of a single validator per data model"""
+
+    assert get_validator(Paper) is get_validator(Paper)
+    assert get_validator(Paper) is not get_validator(JargonGroup)
+
+
+def test_validator_valid_records():
+    """Tests the validation and coercion of valid records"""
+
+    validator = get_validator(Paper)
+    record = {
+        "arxiv_id": "paper-01234",
+        "arxiv_rev": 1,
+        "title": "Title",
+        "submission_date": "2020-11-20",
+        "created_at": "2020-11-20T10:00:00",
+        "updated_at": datetime(2020, 11, 20, 10, 0, 0),
+        "authors": [{"author_name": "Author", "created_at": "2020-11-20 10:00:00"}],
+    }
+
+    assert validator.validate(record) == []
+    assert record["submission_date"] == date(2020, 11, 20)
+    assert record["created_at"] == datetime(2020, 11, 20, 10, 0, 0)
+
+
+def test_validator_invalid_records():
+    """Tests the reported errors of invalid records"""
+
+    validator = get_validator(JargonGroup)
+    records = [
+        {"description": "A", "archived": False, "created_at": "2020-11-20 10:00:00"},
+        {"description": "A" * 257, "archived": False, "created_at": "2020-11-20 10:00:00"},
+        {"description": "A", "archived": 1, "created_at": "2020-11-20 10:00:00"},
+        {"description": "A", "archived": False, "created_at": None},
+        {"description": "A", "archived": False},
+        {"description": "A", "archived": False, "created_at": "2020", "other": 1},
+        {"description": "A", "archived": False, "created_at": "2020-11-20", "audited_at": 1},
+        {"description": "A", "archived": False, "archived_at": "2020-11-20 10:00:00"},
+    ]
+
+    valid, errors = validator.split(records)
+
+    assert valid == records[:1]
+    assert [i for i, _ in errors] == list(range(1, len(records)))
+    assert "exceeds" in errors[0][1]
+    assert "must be of type bool" in errors[1][1]
+    assert "must not be null" in errors[2][1]
+    assert "is required" in errors[3][1]
+    assert "Invalid keyword argument: other" in errors[4][1]
+    assert "'audited_at' must not be provided" in errors[5][1]
+    assert "'archived_at' must not be provided" in errors[6][1]
+
+
+def test_validator_float_coercion():
+    """Tests the coercion of integer values into float columns"""
+
+    validator = get_validator(JargonPaperMetrics)
+    record = {
+        "jargon_id": "jargon-01234",
+        "arxiv_id": "paper-01234",
+        "arxiv_rev": 1,
+        "abs_freq": 10,
+        "rel_freq": 1,
+        "created_at": "2020-11-20 10:00:00",
+    }
+
+    assert validator.validate(record) == []
+    assert type(record["rel_freq"]) is float
+
+
+def test_record_error_format():
+    """Tests the string representation of record errors"""
+
+    error = RecordError("file.json", 3, "Invalid keyword argument: other")
+
+    assert str(error) == "file.json:3: Invalid keyword argument: other"
+
+
+def test_validator_children_disallowed():
+    """Tests the rejection of nested children when not allowed"""
+
+    validator = get_validator(Paper, allow_children=False)
+    record = {
+        "arxiv_id": "paper-01234",
+        "arxiv_rev": 1,
+        "title": "Title",
+        "submission_date": "2020-11-20",
+        "created_at": "2020-11-20T10:00:00",
+        "updated_at": "2020-11-20T10:00:00",
+        "authors": [],
+    }
+
+    assert validator.validate(record) == [
+        "The relationship 'authors' is only supported by the 'orm' method"
+    ]
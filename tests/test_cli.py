@@ -5,6 +5,8 @@ import pytest
 from click.testing import CliRunner
 
 from src.dialect_map_core.cli import main
+from src.dialect_map_core.controllers import PaperReferenceCountersController
+from src.dialect_map_core.storage import SQLDatabase
 
 
 @pytest.fixture(scope="module")
@@ -32,6 +34,34 @@ def test_cli_load_db(env: dict):
     assert result.output == ""
 
 
+@pytest.mark.parametrize("method", ["bulk", "copy"])
+def test_cli_load_db_method(env: dict, method: str):
+    """
+    Tests the invocation of the DB loading CLI command with other insertion methods
+    :param env: dictionary of environment variables
+    :param method: insertion method
+    """
+
+    runner = CliRunner(env=env)
+    result = runner.invoke(main, f"load-db --method {method}")
+
+    assert result.exit_code == 0
+    assert result.output == ""
+
+
+def test_cli_load_db_validation(env: dict):
+    """
+    Tests the invocation of the DB loading CLI command validating the records
+    :param env: dictionary of environment variables
+    """
+
+    runner = CliRunner(env=env)
+    result = runner.invoke(main, "load-db --method bulk --validation raise")
+
+    assert result.exit_code == 0
+    assert result.output == ""
+
+
 def test_cli_setup_db(env: dict):
     """
     Tests the invocation of the DB set-up CLI command
@@ -61,3 +91,52 @@ def test_cli_teardown_db(env: dict):
 
     assert result.exit_code == 1
     assert result.output != ""
+
+
+def test_cli_load_db_workers(env: dict):
+    """
+    Tests the invocation of the DB loading CLI command with multiple workers
+    :param env: dictionary of environment variables
+    """
+
+    runner = CliRunner(env=env)
+    result = runner.invoke(main, "load-db --workers 4")
+
+    assert result.exit_code == 0
+    assert result.output == ""
+
+
+def test_cli_check_indexes(env: dict):
+    """
+    Tests the invocation of the index checking CLI command
+    :param env: dictionary of environment variables
+    """
+
+    runner = CliRunner(env=env)
+    result = runner.invoke(main, "check-indexes")
+
+    assert result.exit_code == 0
+    assert result.output == ""
+
+
+def test_cli_reconcile_counters(tmp_path):
+    """
+    Tests the invocation of the reference counters reconciliation CLI command,
+    after loading the references along with their counters
+    :param tmp_path: temporary directory path
+    """
+
+    env = {"DIALECT_MAP_DB_URL": f"sqlite:///{tmp_path.joinpath('db.sqlite')}"}
+
+    runner = CliRunner(env=env)
+    runner.invoke(main, "load-db --workers 2")
+    result = runner.invoke(main, "reconcile-counters")
+
+    database = SQLDatabase(env["DIALECT_MAP_DB_URL"])
+
+    with database.create_session() as session:
+        counter = PaperReferenceCountersController(session).get_current("paper-56789", 1)
+
+    assert result.exit_code == 0
+    assert result.output == "Corrected 0 reference counters\n"
+    assert (counter.arxiv_ref_count, counter.total_ref_count) == (12, 14)